@@ -22,30 +22,166 @@ Changes:
   - Enhanced --execute flag to support multiple statements
   - Final cleanup and readability improvements
   - Added --no-color flag support for consistent color handling
+- Precompiled the comment-stripping regex at module scope
+- Strip comments and split statements in a single scan with iter_statements;
+  "--" inside quoted strings is now kept instead of being stripped as a comment
+- Classify queries from their leading keyword instead of uppercasing them
+- Shared the per-query execute and display step between run_script and execute_statements
+- Replaced runtime rebinding of the color globals with fixed color tables
+- Buffered per-query output into a single write and added --quiet
+- Added a literal-stripping template cache so repeated query shapes skip the parser
+- Threaded a per-run memo through script execution so repeated SELECTs are reused
+- Moved the colorama import from module scope into _init_colors
+- Parse common command lines directly, using argparse only for help and errors
+- Skip colorama entirely when colors are disabled or stdout is not a terminal
+- Display status message results directly instead of through format_result
+- Stream statements from the script file when per-query output is off
+- Read script files as bytes and decode them in one call
+- Run a single --execute statement without splitting it
+- Prebuilt the colored separator lines in the color tables
+- Exit --script and --execute runs without interpreter teardown, with errors on stderr
+- Compiled the literal regexes with re.ASCII
+- Limited the error messages shown by quiet runs, summarizing the rest
+- Refuse to template literals containing a clause keyword, which the parser could split on
 """
 
+import io
+import os
 import sys
 import re
-import argparse
+import functools
+from types import SimpleNamespace
 
-# Import colorama for cross-platform colored terminal text
-try:
-    from colorama import init, Fore, Back, Style
-    has_colors = True
+# Separator lines under the script banner and each query
+_SEP40 = '-' * 40
+_SEP50 = '-' * 50
+
+def _color_table(cyan='', yellow='', green='', red='', reset=''):
+    """
+    Build a color table, including the separator lines drawn in cyan.
+    
+    Args:
+        cyan, yellow, green, red, reset (str): Escape codes, empty for no color
+        
+    Returns:
+        SimpleNamespace: Color codes and colored separators by name
+    """
+    return SimpleNamespace(CYAN=cyan, YELLOW=yellow, GREEN=green, RED=red, RESET=reset,
+                           SEP40=f"{cyan}{_SEP40}{reset}", SEP50=f"{cyan}{_SEP50}{reset}")
+
+# Color table used when colors are disabled
+_COLOR_OFF = _color_table()
+
+@functools.lru_cache(maxsize=None)
+def _init_colors():
+    """
+    Import colorama and build the color table.
+    
+    The import happens on first use rather than at module import, so the
+    driver functions hold all of the work done per run.
+    
+    Returns:
+        SimpleNamespace: Color codes by name, all empty if colorama is not available
+    """
+    try:
+        from colorama import init, Fore, Style
+    except ImportError:
+        return _COLOR_OFF
     init()  # Initialize colorama
-except ImportError:
-    # Create dummy color objects if colorama is not available
-    has_colors = False
-    class DummyColor:
-        def __getattr__(self, name):
-            return ''
-    Fore = DummyColor()
-    Back = DummyColor()
-    Style = DummyColor()
+    return _color_table(Fore.CYAN, Fore.YELLOW, Fore.GREEN, Fore.RED, Style.RESET_ALL)
+
+def _colors(no_color):
+    """
+    Get the color table for a run.
+    
+    colorama is only imported (and stdout only wrapped) when output goes to
+    a terminal, since colorama strips the codes from redirected output anyway.
+    
+    Args:
+        no_color (bool): Whether colors were disabled with --no-color
+        
+    Returns:
+        SimpleNamespace: Color codes by name
+    """
+    if no_color or not sys.stdout.isatty():
+        return _COLOR_OFF
+    return _init_colors()
 
 from modules.engine.db import Database
-from modules.cli.cli import run_cli
-from modules.utils import smart_split_sql, format_result
+from modules.utils import iter_statements, iter_statements_streaming, format_result
+
+# Leading keywords that get special result formatting
+_QUERY_TYPES = {'SELECT': 'SELECT', 'INSERT': 'INSERT', 'CREATE': 'CREATE'}
+
+def _classify(query):
+    """
+    Determine the query type from the leading keyword of a query.
+    
+    Only the first six characters are uppercased, so the cost does not
+    depend on the length of the query.
+    
+    Args:
+        query (str): The query to classify
+        
+    Returns:
+        str: 'SELECT', 'INSERT' or 'CREATE', or None for other queries
+    """
+    return _QUERY_TYPES.get(query.lstrip()[:6].upper())
+
+# Literals that are lifted out of a query into template parameters
+_LITERAL_RE = re.compile(r"'[^']*'|\"[^\"]*\"|\b\d+(?:\.\d+)?\b", re.ASCII)
+
+# Literals containing these could change how the rest of the query parses,
+# including any keyword the parser's clause patterns split on
+_UNSAFE_LITERAL_RE = re.compile(
+    r"[=<>!,;()\\]"
+    r"|\b(?:select|insert|update|delete|create|from|where|set|into|values|table|and|or)\b",
+    re.IGNORECASE | re.ASCII)
+
+# A template must be seen this many times before its queries use the
+# prepared path, so one-off queries don't fill the database's template cache
+_ADMIT_AFTER = 5
+_MAX_TRACKED_TEMPLATES = 10000
+_template_counts = {}
+
+@functools.lru_cache(maxsize=1000)
+def _fingerprint(query):
+    """
+    Split a query into a template and its literals.
+    
+    Args:
+        query (str): The query to fingerprint
+        
+    Returns:
+        tuple: (template, params) with each literal replaced by "?" in the
+            template, or None if the query has no literals or can't be
+            templated safely
+    """
+    if '?' in query:
+        return None
+    params = _LITERAL_RE.findall(query)
+    if not params or any(_UNSAFE_LITERAL_RE.search(p) for p in params):
+        return None
+    return _LITERAL_RE.sub('?', query), tuple(params)
+
+def _decode_script(data):
+    """
+    Decode the contents of a script file.
+    
+    Decoding the whole file in one call is faster than reading through a
+    text-mode file. Newlines are normalized as text mode would, and a UTF-8
+    byte order mark is dropped.
+    
+    Args:
+        data (bytes): Raw contents of the script file
+        
+    Returns:
+        str: The script text
+    """
+    content = data.decode('utf-8-sig')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
 
 def create_database():
     """
@@ -56,20 +192,87 @@ def create_database():
     """
     return Database()
 
-def run_query(db, query):
+def run_query(db, query, memo=None):
     """
     Run a SQL-ish query on a database.
     
+    Queries whose literal-free template has been seen often enough are run
+    through Database.query_prepared, which reuses the parsed template.
+    
     Args:
         db (Database): The database to query
         query (str): The SQL-ish query to execute
+        memo (dict, optional): Memo shared by a run of statements, so repeated
+            SELECTs reuse earlier results until data or schema changes
         
     Returns:
         Various: Result depends on the query type
     """
-    return db.query(query)
+    fingerprint = _fingerprint(query)
+    if fingerprint is None:
+        return db.query(query, memo=memo)
+    
+    template, params = fingerprint
+    seen = _template_counts.get(template, 0)
+    if seen >= _ADMIT_AFTER:
+        return db.query_prepared(template, params, memo=memo)
+    
+    # Still monitoring this template
+    if len(_template_counts) >= _MAX_TRACKED_TEMPLATES:
+        _template_counts.clear()
+    _template_counts[template] = seen + 1
+    return db.query(query, memo=memo)
+
+# Quiet script runs and non-debug --execute runs only format this many
+# error messages, so a badly broken input doesn't flood the output
+_MAX_ERROR_MESSAGES = 20
+
+def _execute_one(db, query, query_num, total_queries, buf, c=_COLOR_OFF, verbose=True,
+                 memo=None):
+    """
+    Execute a single query from a script, optionally displaying it.
+    
+    Display output is appended to buf rather than printed, so the caller
+    can emit everything for a query with a single write.
+    
+    Args:
+        db (Database): The database to use
+        query (str): The query to execute
+        query_num (int): Position of the query in the script (1-based)
+        total_queries (int): Number of queries in the script
+        buf (list): Output buffer to append display text to
+        c (SimpleNamespace): Color table to display with
+        verbose (bool): Whether to display the query and its result
+        memo (dict, optional): Memo shared by the statements being run
+        
+    Returns:
+        tuple: (True, result) on success, (False, exception) on failure
+    """
+    if verbose:
+        buf.append(f"\n{c.YELLOW}Query {query_num}/{total_queries}:{c.RESET}\n{query}\n{c.SEP40}\n")
+    
+    try:
+        # Execute the query
+        result = run_query(db, query, memo)
+    except Exception as e:
+        return False, e
+    
+    if verbose:
+        # Format and display the result
+        if result is not None:
+            # Status messages (e.g. from INSERT) are already display text, so
+            # only tables need classifying and formatting
+            if isinstance(result, str):
+                formatted_result = result
+            else:
+                formatted_result = format_result(result, _classify(query))
+            buf.append(f"{c.GREEN}Result:{c.RESET}\n{formatted_result}\n")
+        else:
+            buf.append(f"{c.GREEN}Query executed successfully{c.RESET}\n")
+    
+    return True, result
 
-def run_script(db, script_path, continue_on_error=True, debug=False, no_color=False):
+def run_script(db, script_path, continue_on_error=True, debug=False, no_color=False, quiet=False):
     """
     Run a SQL script file on a database.
     
@@ -79,91 +282,73 @@ def run_script(db, script_path, continue_on_error=True, debug=False, no_color=Fa
         continue_on_error (bool): Whether to continue execution after errors
         debug (bool): Whether to show debug output
         no_color (bool): Whether to disable colored output
+        quiet (bool): Whether to skip per-query output (the first errors and the summary are still shown)
         
     Returns:
         bool: True if script executed successfully (all queries), False otherwise
     """
-    # Disable colors if requested
-    if no_color:
-        global Fore, Back, Style
-        Fore = DummyColor()
-        Back = DummyColor()
-        Style = DummyColor()
-        
+    c = _colors(no_color)
+    
     total_queries = 0
     successful_queries = 0
     error_queries = 0
     
     try:
-        print(f"{Fore.CYAN}Executing SQL script: {script_path}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{'-' * 50}{Style.RESET_ALL}")
+        print(f"{c.CYAN}Executing SQL script: {script_path}{c.RESET}")
+        print(c.SEP50)
         
-        with open(script_path, 'r') as f:
-            content = f.read()
-        
-        # Remove comments
-        content = re.sub(r'--.*$', '', content, flags=re.MULTILINE)
-        
-        # Split content into queries, respecting string literals
-        queries = smart_split_sql(content)
-        
-        # Filter out empty queries
-        queries = [q.strip() for q in queries if q.strip()]
-        total_queries = len(queries)
-        
-        if debug:
-            print(f"{Fore.YELLOW}Found {total_queries} queries to execute.{Style.RESET_ALL}")
-        
-        for i, query in enumerate(queries):
-            try:
-                query_num = i + 1
-                print(f"\n{Fore.YELLOW}Query {query_num}/{total_queries}:{Style.RESET_ALL}")
-                print(query)
-                print(f"{Fore.CYAN}{'-' * 40}{Style.RESET_ALL}")
-                
-                # Execute the query
-                result = db.query(query)
-                successful_queries += 1
-                
-                # Determine query type for formatting
-                query_type = None
-                if query.strip().upper().startswith('SELECT'):
-                    query_type = 'SELECT'
-                elif query.strip().upper().startswith('INSERT'):
-                    query_type = 'INSERT'
-                elif query.strip().upper().startswith('CREATE'):
-                    query_type = 'CREATE'
-                    
-                # Format and display the result
-                if result is not None:
-                    formatted_result = format_result(result, query_type)
-                    print(f"{Fore.GREEN}Result:{Style.RESET_ALL}")
-                    print(formatted_result)
+        with open(script_path, 'rb', buffering=1 << 20) as f:
+            if quiet and not debug:
+                # Nothing needs the query count up front, so stream the
+                # statements instead of reading the whole file
+                queries = iter_statements_streaming(io.TextIOWrapper(f, encoding='utf-8-sig'))
+            else:
+                # Strip comments and split into queries, respecting string literals
+                queries = list(iter_statements(_decode_script(f.read())))
+                total_queries = len(queries)
+            
+            if debug:
+                print(f"{c.YELLOW}Found {total_queries} queries to execute.{c.RESET}")
+            
+            write = sys.stdout.write
+            buf = []
+            memo = {}  # Reused SELECT results, cleared by any other statement
+            for query_num, query in enumerate(queries, 1):
+                ok, result = _execute_one(db, query, query_num, total_queries, buf, c,
+                                          verbose=not quiet, memo=memo)
+                if ok:
+                    successful_queries += 1
                 else:
-                    print(f"{Fore.GREEN}Query executed successfully{Style.RESET_ALL}")
-                    
-            except Exception as e:
-                error_queries += 1
-                print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+                    error_queries += 1
+                    if not quiet or error_queries <= _MAX_ERROR_MESSAGES:
+                        buf.append(f"{c.RED}Error: {result}{c.RESET}\n")
+                    if not continue_on_error:
+                        buf.append(f"{c.RED}Stopping script execution due to error{c.RESET}\n")
                 
-                if not continue_on_error:
-                    print(f"{Fore.RED}Stopping script execution due to error{Style.RESET_ALL}")
+                if buf:
+                    write(''.join(buf))
+                    buf.clear()
+                if not ok and not continue_on_error:
                     return False
         
+        total_queries = successful_queries + error_queries
+        
         # Report results
-        print(f"\n{Fore.CYAN}Script execution summary:{Style.RESET_ALL}")
+        print(f"\n{c.CYAN}Script execution summary:{c.RESET}")
         print(f"- Total queries: {total_queries}")
         print(f"- Successful: {successful_queries}")
         print(f"- Failed: {error_queries}")
+        if quiet and error_queries > _MAX_ERROR_MESSAGES:
+            print(f"  ({error_queries - _MAX_ERROR_MESSAGES} error message(s) not shown)")
         
         if error_queries == 0:
-            print(f"\n{Fore.GREEN}All queries executed successfully!{Style.RESET_ALL}")
+            print(f"\n{c.GREEN}All queries executed successfully!{c.RESET}")
         else:
-            print(f"\n{Fore.YELLOW}Script completed with {error_queries} error(s){Style.RESET_ALL}")
+            print(f"\n{c.YELLOW}Script completed with {error_queries} error(s){c.RESET}")
         
         return error_queries == 0
     except Exception as e:
-        print(f"{Fore.RED}Error processing script file: {e}{Style.RESET_ALL}")
+        print(f"{c.RED}Error processing script file: {e}{c.RESET}")
         return False
 
 def execute_statements(db, statements, debug=False, no_color=False):
@@ -179,78 +364,77 @@ def execute_statements(db, statements, debug=False, no_color=False):
     Returns:
         Any: Result of the last executed query
     """
-    # Disable colors if requested
-    if no_color:
-        global Fore, Back, Style
-        Fore = DummyColor()
-        Back = DummyColor()
-        Style = DummyColor()
-        
-    # Remove comments
-    statements = re.sub(r'--.*$', '', statements, flags=re.MULTILINE)
+    c = _colors(no_color)
     
-    # Split into individual queries
-    queries = smart_split_sql(statements)
+    # A lone statement without comments needs no splitting
+    query = statements.strip()
+    if not debug and query and ';' not in query and '--' not in query:
+        try:
+            return run_query(db, query)
+        except Exception as e:
+            print(f"{c.RED}Error in query 1: {e}{c.RESET}")
+            return None
     
-    # Filter out empty queries
-    queries = [q.strip() for q in queries if q.strip()]
+    # Strip comments and split into individual queries
+    queries = list(iter_statements(statements))
     total_queries = len(queries)
     successful_queries = 0
     error_queries = 0
     last_result = None
     
     if debug:
-        print(f"{Fore.YELLOW}Found {total_queries} queries to execute.{Style.RESET_ALL}")
+        print(f"{c.YELLOW}Found {total_queries} queries to execute.{c.RESET}")
     
-    for i, query in enumerate(queries):
-        try:
-            if debug:
-                print(f"\n{Fore.CYAN}Executing query {i+1}/{total_queries}:{Style.RESET_ALL}")
-                print(query)
-                
-            # Execute the query
-            result = db.query(query)
+    write = sys.stdout.write
+    buf = []
+    memo = {}  # Reused SELECT results, cleared by any other statement
+    for query_num, query in enumerate(queries, 1):
+        ok, result = _execute_one(db, query, query_num, total_queries, buf, c,
+                                  verbose=debug, memo=memo)
+        if ok:
             successful_queries += 1
             last_result = result
-            
-            if debug:
-                # Determine query type for formatting
-                query_type = None
-                if query.strip().upper().startswith('SELECT'):
-                    query_type = 'SELECT'
-                elif query.strip().upper().startswith('INSERT'):
-                    query_type = 'INSERT'
-                elif query.strip().upper().startswith('CREATE'):
-                    query_type = 'CREATE'
-                    
-                # Format and display the result
-                if result is not None:
-                    formatted_result = format_result(result, query_type)
-                    print(f"{Fore.GREEN}Result:{Style.RESET_ALL}")
-                    print(formatted_result)
-                else:
-                    print(f"{Fore.GREEN}Query executed successfully{Style.RESET_ALL}")
-        except Exception as e:
+        else:
             error_queries += 1
             if debug:
-                print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
-            else:
-                print(f"{Fore.RED}Error in query {i+1}: {e}{Style.RESET_ALL}")
+                buf.append(f"{c.RED}Error: {result}{c.RESET}\n")
+            elif error_queries <= _MAX_ERROR_MESSAGES:
+                buf.append(f"{c.RED}Error in query {query_num}: {result}{c.RESET}\n")
+        
+        if buf:
+            write(''.join(buf))
+            buf.clear()
                 
+    if not debug and error_queries > _MAX_ERROR_MESSAGES:
+        print(f"{c.RED}{error_queries - _MAX_ERROR_MESSAGES} more error(s) not shown{c.RESET}")
+    
     if debug:
-        print(f"\n{Fore.CYAN}Execution summary:{Style.RESET_ALL}")
+        print(f"\n{c.CYAN}Execution summary:{c.RESET}")
         print(f"- Total queries: {total_queries}")
         print(f"- Successful: {successful_queries}")
         print(f"- Failed: {error_queries}")
     
     return last_result
 
-def main():
+# Flags understood by the fast argument parser: flag -> (attribute, takes a value)
+_FLAGS = {
+    '--script': ('script', True), '-s': ('script', True),
+    '--execute': ('execute', True), '-e': ('execute', True),
+    '--stop-on-error': ('stop_on_error', False),
+    '--debug': ('debug', False), '-d': ('debug', False),
+    '--no-color': ('no_color', False),
+    '--quiet': ('quiet', False), '-q': ('quiet', False),
+}
+
+def _build_arg_parser():
     """
-    Main entry point for the SQL-ish package.
+    Build the argparse parser for the command line.
     
-    Parses command line arguments and runs the CLI or executes scripts directly.
+    Returns:
+        argparse.ArgumentParser: Parser for the SQL-ish command line
     """
+    import argparse
+    
     parser = argparse.ArgumentParser(description="SQL-ish Database Engine")
     parser.add_argument('--script', '-s', help='SQL script file to execute without CLI')
     parser.add_argument('--execute', '-e', help='Execute SQL command(s) and exit')
@@ -260,8 +444,69 @@ def main():
                         help='Enable debug output')
     parser.add_argument('--no-color', action='store_true',
                         help='Disable colored output')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help='Only show the first errors and the summary when running a script')
+    
+    return parser
+
+def _parse_args(argv):
+    """
+    Parse command line arguments.
+    
+    Plain uses of the known flags are parsed directly, which avoids importing
+    and building an argparse parser on every run. Anything else (--help,
+    abbreviations, unknown or malformed flags) goes to argparse so it can
+    print help and errors as usual. Setting SQL_ISH_FAST_CLI=0 always uses
+    argparse.
+    
+    Args:
+        argv (list): Command line arguments, without the program name
+        
+    Returns:
+        Namespace: Parsed arguments
+    """
+    if os.environ.get('SQL_ISH_FAST_CLI') != '0':
+        args = SimpleNamespace(script=None, execute=None, stop_on_error=False,
+                               debug=False, no_color=False, quiet=False)
+        remaining = iter(argv)
+        for arg in remaining:
+            flag = _FLAGS.get(arg)
+            if flag is None:
+                break
+            name, takes_value = flag
+            if takes_value:
+                value = next(remaining, None)
+                if value is None or value.startswith('-'):
+                    break
+                setattr(args, name, value)
+            else:
+                setattr(args, name, True)
+        else:
+            return args
+    
+    return _build_arg_parser().parse_args(argv)
+
+def _exit(code):
+    """
+    Flush output and exit immediately with the given status.
+    
+    Skips interpreter teardown (atexit handlers, module cleanup), which is a
+    noticeable part of the run time of short --execute and --script runs.
+    
+    Args:
+        code (int): Exit status
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+
+def main():
+    """
+    Main entry point for the SQL-ish package.
     
-    args = parser.parse_args()
+    Parses command line arguments and runs the CLI or executes scripts directly.
+    """
+    args = _parse_args(sys.argv[1:])
     
     # Create a single database instance for all operations
     db = create_database()
@@ -270,8 +515,9 @@ def main():
     if args.script:
         success = run_script(db, args.script, 
                            continue_on_error=not args.stop_on_error,
-                           debug=args.debug, no_color=args.no_color)
-        sys.exit(0 if success else 1)
+                           debug=args.debug, no_color=args.no_color,
+                           quiet=args.quiet)
+        _exit(0 if success else 1)
     
     # Direct command execution mode
     elif args.execute:
@@ -279,13 +525,14 @@ def main():
             result = execute_statements(db, args.execute, debug=args.debug, no_color=args.no_color)
             if result is not None:
                 print(format_result(result))
-            sys.exit(0)
         except Exception as e:
-            print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
-            sys.exit(1)
+            sys.stderr.write(f"Error: {e}\n")
+            _exit(1)
+        _exit(0)
     
-    # CLI mode (default)
+    # CLI mode (default); the CLI module imports colorama, so load it only here
     else:
+        from modules.cli.cli import run_cli
         run_cli(no_color=args.no_color, script=args.script, execute=args.execute,
                stop_on_error=args.stop_on_error, debug=args.debug)
 
@@ -24,6 +24,52 @@ Changes:
 - Added interactive features for better script execution experience
 - Fixed color initialization for macOS compatibility
 - Added better UI with box characters for improved visibility
+- Resolved color codes into module constants and prebuilt the status bar wrapping
+- Emit ANSI codes directly outside Windows instead of going through colorama
+- Keep the query log open between queries instead of reopening it for each one
+- Time queries with time.perf_counter instead of datetime.now
+- Precompiled the comment and error message regexes at module scope
+- Find keywords missing a following space with one regex search
+- Draw result table borders with str.translate and fixed the corner characters
+- Stream script statements from the file in run instead of reading it whole
+- Cache completion names until the set of tables changes
+- Skip unchanged status bars and thin out the progress bar for long scripts
+- Made quit an alias of exit and check for them with a length guard first
+- Write the tables listing and each script query header in a single write
+- Detect the query type from the first six characters only
+- Load only the tail of the history file and append new entries at exit
+- Print plain result tables when output is not going to a terminal
+- Reuse the formatted log timestamp for queries within the same second
+- Keep the completion keywords as interned class-level tuples
+- Added run -q, which redraws one progress line and skips successful results
+- Skip fuzzy match candidates whose length rules them out before using difflib
+- Draw result tables from format_result_structured instead of reparsing text
+- Refresh the cached terminal width on SIGWINCH instead of querying it
+- Match leading keyword typos with one precompiled regex, longest typo first
+- Precompiled the SQL colorizer patterns and dropped its unused token helper
+- Colorize SQL in a single pass over one combined token pattern
+- Estimate the run progress total from the file's semicolons instead of splitting it twice
+- Read scripts as utf-8-sig so a byte order mark isn't part of the first query
+- Dropped the fuzzy match length prefilter, as get_close_matches checks quick bounds first
+- Cache colorized SQL so repeated log views reuse it
+- Keep parsed log entries until the log file changes
+- Read only the end of the log and history files with a shared tail reader
+- Build the help, syntax, example and tables box borders once per width
+- Collect the help, syntax, example and log displays and write each at once
+- Reuse one TextWrapper per width and only wrap log queries when needed
+- Removed the printing _colorize_sql wrapper now that callers buffer its output
+- Hoisted the syntax help tables to class constants
+- Don't prompt about failed script queries without a terminal, and honor stop_on_error
+- Cache each rendered log entry by its line in the log
+- Take the help prefix of a failed query with one partition call
+- Tell keywords from identifiers with a set lookup on each word
+- Format log entry headers from prebuilt per-status templates
+- Clear the screen with an escape sequence instead of running clear
+- Added log summary, which counts successes and errors without parsing the log
+- Padded help, syntax and example boxes with ljust on their plain text width
+- Convert the tables listing's cells to strings once, for widths and padding
+- Check for a missing table with "is not None" when suggesting column names
+- Removed the unused str.translate border helpers left from drawing format_result output
 """
 
 import cmd
@@ -35,36 +81,317 @@ import traceback
 import shutil
 import readline
 import atexit
-from datetime import datetime
+import signal
+import time
 import textwrap
+import difflib
+import functools
+from types import SimpleNamespace
+from collections import OrderedDict
 
-# Import colorama for cross-platform colored terminal text
-try:
-    from colorama import init, Fore, Back, Style, AnsiToWin32
+class DummyColor:
+    """Stand-in for colorama's Fore/Back/Style that yields empty codes."""
+    def __getattr__(self, name):
+        return ''
+
+if sys.platform == 'win32':
+    # Windows consoles need colorama to enable ANSI escape sequences
+    try:
+        from colorama import Fore, Back, Style, just_fix_windows_console
+        has_colors = True
+        just_fix_windows_console()
+    except ImportError:
+        # Use dummy color objects if colorama is not available
+        has_colors = False
+        Fore = DummyColor()
+        Back = DummyColor()
+        Style = DummyColor()
+else:
+    # Other terminals understand ANSI escape sequences directly, so skip
+    # colorama and the stdout wrapper it installs
     has_colors = True
-    # Initialize colorama with parameters to maximize compatibility
-    init(strip=False, convert=True, autoreset=False)
-    
+    Fore = SimpleNamespace(BLACK='\x1b[30m', RED='\x1b[31m', GREEN='\x1b[32m', YELLOW='\x1b[33m',
+                           BLUE='\x1b[34m', MAGENTA='\x1b[35m', CYAN='\x1b[36m', WHITE='\x1b[37m')
+    Back = SimpleNamespace(BLUE='\x1b[44m', CYAN='\x1b[46m')
+    Style = SimpleNamespace(BRIGHT='\x1b[1m', NORMAL='\x1b[22m', RESET_ALL='\x1b[0m')
+
+if has_colors:
     # Force use of ANSI escape sequences for color even if terminal doesn't seem to support it
     os.environ['FORCE_COLOR'] = '1'
-    
-except ImportError:
-    # Create dummy color objects if colorama is not available
-    has_colors = False
-    class DummyColor:
-        def __getattr__(self, name):
-            return ''
-    Fore = DummyColor()
-    Back = DummyColor()
-    Style = DummyColor()
+
+# Color codes resolved once, rather than through colorama's attribute lookups on every use
+BLACK, BLUE, CYAN, GREEN = Fore.BLACK, Fore.BLUE, Fore.CYAN, Fore.GREEN
+MAGENTA, RED, WHITE, YELLOW = Fore.MAGENTA, Fore.RED, Fore.WHITE, Fore.YELLOW
+BACK_BLUE, BACK_CYAN = Back.BLUE, Back.CYAN
+BRIGHT, NORMAL, RESET = Style.BRIGHT, Style.NORMAL, Style.RESET_ALL
+
+# Wrapping for the status bar text
+_STATUS_PREFIX = f"{BLACK}{BACK_CYAN}"
+_STATUS_SUFFIX = f" {RESET}\n"
+
+def _disable_colors():
+    """Replace all color codes with empty strings."""
+    global Fore, Back, Style
+    global BLACK, BLUE, CYAN, GREEN, MAGENTA, RED, WHITE, YELLOW
+    global BACK_BLUE, BACK_CYAN, BRIGHT, NORMAL, RESET
+    global _STATUS_PREFIX, _STATUS_SUFFIX
+    Fore = Back = Style = DummyColor()
+    BLACK = BLUE = CYAN = GREEN = MAGENTA = RED = WHITE = YELLOW = ''
+    BACK_BLUE = BACK_CYAN = BRIGHT = NORMAL = RESET = ''
+    _STATUS_PREFIX = ''
+    _STATUS_SUFFIX = ' \n'
+    # Drop any SQL colorized with the old codes
+    _colorize_sql_str.cache_clear()
 
 from modules.engine.db import Database
-from modules.utils import smart_split_sql, format_result
+from modules.utils import iter_statements_streaming, format_result, format_result_structured
 
 # Constants
 VERSION = "0.3.0"
 HISTORY_FILE = os.path.expanduser('~/.sql_ish_history')
+HISTORY_LENGTH = 1000
+HISTORY_COMPACT_SIZE = 1 << 20  # Rewrite the history file once it grows past this
 QUERY_LOG_FILE = os.path.expanduser('~/.sql_ish_queries.log')
+RENDERED_LOG_CACHE_SIZE = 1024
+
+# Terminals that understand ANSI escapes are cleared (along with their scrollback,
+# as clear does) by writing the sequence; others fall back to the system command
+_CLEAR_CMD = 'cls' if os.name == 'nt' else 'clear'
+_CLEAR_SEQ = ('\x1b[H\x1b[2J\x1b[3J'
+              if os.name != 'nt' and os.environ.get('TERM', 'dumb') != 'dumb' else '')
+
+# macOS ships readline backed by libedit, which has a different history file format
+_LIBEDIT = 'libedit' in (readline.__doc__ or '')
+
+def _tail_lines(path, count, block_size=8192):
+    """
+    Read the last lines of a file without reading all of it.
+    
+    Args:
+        path (str): Path to the file
+        count (int): Maximum number of lines to return
+        block_size (int): How many bytes to read at a time, going backwards
+        
+    Returns:
+        list: The last lines, oldest first, without line endings
+    """
+    if count <= 0:
+        return []
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b''
+        newlines = 0
+        # Read blocks backwards until the lines wanted are all complete
+        while pos > 0 and newlines <= count:
+            size = min(block_size, pos)
+            pos -= size
+            f.seek(pos)
+            block = f.read(size)
+            newlines += block.count(b'\n')
+            data = block + data
+    lines = data.split(b'\n')
+    if not lines[-1]:
+        # The file ends with a newline
+        lines.pop()
+    if pos > 0:
+        # The first line was probably cut in half
+        lines = lines[1:]
+    return [line.decode('utf-8', 'ignore').rstrip('\r') for line in lines[-count:]]
+
+# Precompiled patterns for names quoted in error messages
+_TABLE_ERR_RE = re.compile(r"table ['\"](.*?)['\"]")
+_COLUMN_ERR_RE = re.compile(r"column ['\"](.*?)['\"]")
+
+# A keyword directly followed by something other than whitespace or punctuation
+_KEYWORD_GAP_RE = re.compile(
+    r'\b(?:SELECT|FROM|WHERE|INSERT|INTO|VALUES|CREATE|TABLE|UPDATE|SET|DELETE|GROUP|BY|ORDER)'
+    r'(?=[^\s;,()])', re.IGNORECASE | re.ASCII)
+
+# Common SQL keyword typos at the start of a query and their corrections
+_TYPO_CORRECTIONS = {
+    'slect': 'SELECT',
+    'selectt': 'SELECT',
+    'selet': 'SELECT',
+    'selec': 'SELECT',
+    'frmo': 'FROM',
+    'frm': 'FROM',
+    'fromm': 'FROM',
+    'wher': 'WHERE',
+    'whre': 'WHERE',
+    'wheer': 'WHERE',
+    'wheree': 'WHERE',
+    'insrt': 'INSERT',
+    'inser': 'INSERT',
+    'insrt into': 'INSERT INTO',
+    'insert nto': 'INSERT INTO',
+    'insert int': 'INSERT INTO',
+    'creat': 'CREATE',
+    'creae': 'CREATE',
+    'crete': 'CREATE',
+    'creat table': 'CREATE TABLE',
+    'create tabe': 'CREATE TABLE',
+    'create tble': 'CREATE TABLE',
+    'crate table': 'CREATE TABLE',
+    'delte': 'DELETE',
+    'delet': 'DELETE',
+    'dlte': 'DELETE',
+    'delte from': 'DELETE FROM',
+    'delete frm': 'DELETE FROM',
+    'updte': 'UPDATE',
+    'updae': 'UPDATE',
+    'updat': 'UPDATE',
+    'grup by': 'GROUP BY',
+    'group bye': 'GROUP BY',
+    'oder by': 'ORDER BY',
+    'orer by': 'ORDER BY',
+    'order bye': 'ORDER BY',
+}
+
+# Longest typos first, so that 'insrt into' wins over 'insrt'; a typo must end
+# at a word boundary so correctly spelled keywords such as 'select' don't match
+_TYPO_RE = re.compile(
+    '(' + '|'.join(sorted(map(re.escape, _TYPO_CORRECTIONS), key=len, reverse=True)) + r')\b',
+    re.IGNORECASE)
+
+# Tokens colored by _colorize_sql_str. Words are keywords if they are in
+# _SQL_COLOR_KEYWORDS, otherwise identifiers unless followed by '='
+_SQL_LEX = re.compile(
+    r'(?P<str>"[^"]*"|\'[^\']*\')'
+    r'|(?P<word>\b[a-zA-Z][a-zA-Z0-9_]*\b)'
+    r'|(?P<num>\b\d+\.?\d*\b)'
+    r'|(?P<punct>[;(),])')
+_SQL_COLOR_KEYWORDS = frozenset((
+    'SELECT', 'FROM', 'WHERE', 'INSERT', 'INTO', 'VALUES', 'CREATE', 'TABLE',
+    'UPDATE', 'SET', 'DELETE', 'AND', 'OR'
+))
+_EQUALS_AHEAD_RE = re.compile(r'\s*=')
+
+@functools.lru_cache(maxsize=512)
+def _colorize_sql_str(query):
+    """
+    Colorize SQL keywords and other parts of a query.
+    
+    Args:
+        query (str): The query to colorize
+        
+    Returns:
+        str: The query with color codes added
+    """
+    colors = {'str': GREEN, 'num': BLUE, 'punct': YELLOW}
+    parts = []
+    pos = 0
+    for m in _SQL_LEX.finditer(query):
+        kind = m.lastgroup
+        token = m.group(kind)
+        parts.append(query[pos:m.start()])
+        if kind == 'word':
+            upper = token.upper()
+            if upper in _SQL_COLOR_KEYWORDS:
+                parts.append(f"{MAGENTA}{upper}{RESET}")
+            elif _EQUALS_AHEAD_RE.match(query, m.end()):
+                parts.append(token)
+            else:
+                parts.append(f"{CYAN}{token}{RESET}")
+        else:
+            parts.append(f"{colors[kind]}{token}{RESET}")
+        pos = m.end()
+    parts.append(query[pos:])
+    return ''.join(parts)
+
+def _count_log_statuses(path, block_size=1 << 16):
+    """
+    Count the successful and failed queries in a query log.
+    
+    The file is scanned in blocks with bytes.count rather than parsed line by line.
+    
+    Args:
+        path (str): Path to the query log
+        block_size (int): How many bytes to read at a time
+        
+    Returns:
+        tuple: (successful, failed) query counts
+    """
+    succeeded = failed = 0
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            # Finish the last line, so no marker is split between blocks
+            block += f.readline()
+            succeeded += block.count(b'[SUCCESS]')
+            failed += block.count(b'[ERROR]')
+    return succeeded, failed
+
+def _parse_log_entry(entry):
+    """
+    Split a query log entry into its fields.
+    
+    Args:
+        entry (str): A line from the query log, without its line ending
+        
+    Returns:
+        tuple: (entry, fields) with the stripped entry, and fields being
+            (timestamp, status, duration, query) or None if the entry isn't
+            in the expected format. Error messages are logged on a line of
+            their own, so they come back as unparsed entries.
+    """
+    parts = entry.strip().split('] [')
+    if len(parts) >= 3:
+        duration_and_query = parts[2].split('] ', 1)
+        if len(duration_and_query) == 2:
+            # Remove the leading '[' from the timestamp
+            return entry.strip(), (parts[0][1:], parts[1], duration_and_query[0], duration_and_query[1])
+    return entry.strip(), None
+
+# Commands that leave the CLI, in any case
+_EXIT_CMDS = frozenset(('exit', 'quit'))
+
+_FORMATTED_TYPES = frozenset(('SELECT', 'INSERT', 'CREATE'))
+
+def _query_type(query):
+    """
+    Get the statement type used to format a query's result.
+    
+    Args:
+        query (str): The query text
+        
+    Returns:
+        str: 'SELECT', 'INSERT' or 'CREATE', or None for other statements
+    """
+    head = query.lstrip()[:6].upper()
+    return head if head in _FORMATTED_TYPES else None
+
+def _iter_script(filepath):
+    """
+    Yield the queries in a SQL script file, without comments.
+    
+    The file is read in chunks, so only the current query is held in memory.
+    
+    Args:
+        filepath (str): Path to the SQL script file
+        
+    Yields:
+        str: Each non-empty query, stripped of surrounding whitespace
+    """
+    with open(filepath, 'r', encoding='utf-8-sig', buffering=1 << 20) as f:
+        yield from iter_statements_streaming(f)
+
+def _count_terminators(filepath):
+    """
+    Count the semicolons in a SQL script file.
+    
+    This estimates the number of queries without splitting the script, as
+    semicolons inside strings or comments are counted too.
+    
+    Args:
+        filepath (str): Path to the SQL script file
+        
+    Returns:
+        int: Number of semicolons in the file
+    """
+    count = 0
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            count += chunk.count(b';')
+    return count
 
 class SQLishCLI(cmd.Cmd):
     """
@@ -75,62 +402,227 @@ class SQLishCLI(cmd.Cmd):
     """
     
     intro = f"""
-    {Fore.CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Style.RESET_ALL}
-    {Fore.YELLOW}Welcome to SQL-ish CLI v{VERSION}{Fore.CYAN}
-    {Fore.WHITE}A lightweight SQL implementation in Python{Fore.CYAN}
-    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Style.RESET_ALL}
+    {CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{RESET}
+    {YELLOW}Welcome to SQL-ish CLI v{VERSION}{CYAN}
+    {WHITE}A lightweight SQL implementation in Python{CYAN}
+    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{RESET}
     
-    {Fore.WHITE}Type SQL queries or commands:{Style.RESET_ALL}
-      {Fore.GREEN}help{Style.RESET_ALL}    - Show available commands
-      {Fore.GREEN}tables{Style.RESET_ALL}  - List all tables in database
-      {Fore.GREEN}syntax{Style.RESET_ALL}  - Show SQL syntax help
-      {Fore.GREEN}example{Style.RESET_ALL} - View example queries
-      {Fore.GREEN}exit{Style.RESET_ALL}    - Exit the CLI
+    {WHITE}Type SQL queries or commands:{RESET}
+      {GREEN}help{RESET}    - Show available commands
+      {GREEN}tables{RESET}  - List all tables in database
+      {GREEN}syntax{RESET}  - Show SQL syntax help
+      {GREEN}example{RESET} - View example queries
+      {GREEN}exit{RESET}    - Exit the CLI
     """
     
-    prompt = f"{Fore.CYAN}sql-ish▶{Style.RESET_ALL} "
+    prompt = f"{CYAN}sql-ish▶{RESET} "
+    
+    # SQL keywords offered for completion, in upper and lower case
+    _SQL_KEYWORDS = (
+        'SELECT', 'FROM', 'WHERE', 'INSERT', 'INTO', 'VALUES',
+        'CREATE', 'TABLE', 'UPDATE', 'SET', 'DELETE', 'AND', 'OR',
+        'JOIN', 'GROUP', 'BY', 'ORDER', 'LIMIT', 'IS', 'NULL', 'NOT'
+    )
+    _SQL_KEYWORD_COMPLETIONS = (tuple(sys.intern('do_' + k) for k in _SQL_KEYWORDS)
+                                + tuple(sys.intern('do_' + k.lower()) for k in _SQL_KEYWORDS))
     
-    def __init__(self, init_script=None):
+    # Syntax help for each SQL command, shown by syntax and help
+    _SYNTAX_HELP = {
+        "select": {
+            "syntax": "SELECT column1, column2, ... FROM table_name [WHERE condition];",
+            "example": "SELECT id, name, email FROM users WHERE age > 18;",
+            "description": "Retrieves data from one or more tables."
+        },
+        "insert": {
+            "syntax": "INSERT INTO table_name VALUES (value1, value2, ...);",
+            "example": "INSERT INTO users VALUES (1, 'John', 'john@example.com');",
+            "description": "Adds new records to a table."
+        },
+        "create": {
+            "syntax": "CREATE TABLE table_name (column1, column2, ...);",
+            "example": "CREATE TABLE users (id, name, email, age);",
+            "description": "Creates a new table in the database."
+        },
+        "update": {
+            "syntax": "UPDATE table_name SET column1 = value1, column2 = value2, ... WHERE condition;",
+            "example": "UPDATE users SET name = 'Jane' WHERE id = 1;",
+            "description": "Modifies existing records in a table."
+        },
+        "delete": {
+            "syntax": "DELETE FROM table_name WHERE condition;",
+            "example": "DELETE FROM users WHERE id = 1;",
+            "description": "Removes records from a table."
+        }
+    }
+    
+    # Syntax and example shown for the 'h' option when a script query fails
+    _PREFIX_HELP = {
+        'SELECT': ("SELECT column1, column2, ... FROM table_name [WHERE condition];",
+                   "SELECT id, name FROM users WHERE age > 18;"),
+        'INSERT': ("INSERT INTO table_name VALUES (value1, value2, ...);",
+                   "INSERT INTO users VALUES (1, 'John', 'john@example.com');"),
+        'CREATE': ("CREATE TABLE table_name (column1, column2, ...);",
+                   "CREATE TABLE users (id, name, email);"),
+        'UPDATE': ("UPDATE table_name SET column1 = value1, column2 = value2, ... WHERE condition;",
+                   "UPDATE users SET name = 'Jane' WHERE id = 1;"),
+        'DELETE': ("DELETE FROM table_name WHERE condition;",
+                   "DELETE FROM users WHERE id = 1;"),
+    }
+    
+    # Rows of the help screen's command and feature sections
+    _HELP_COMMANDS = (
+        ('exit, quit', 'Exit the CLI'),
+        ('tables', 'List all tables in the database'),
+        ('run <filepath>', 'Execute SQL commands from a file'),
+        ('run -q <filepath>', 'Run a file, showing only progress and errors'),
+        ('history', 'Show command history'),
+        ('log [n|summary|clear]', 'View, summarize or clear the query log'),
+        ('clear', 'Clear the screen'),
+        ('example [num]', 'Show or run example queries'),
+        ('syntax [cmd]', 'Show syntax help for SQL commands'),
+        ('help', 'Show this help message'),
+    )
+    _HELP_COMMAND_WIDTH = max(len(command) for command, _ in _HELP_COMMANDS) + 1
+    _HELP_FEATURES = (
+        ('Syntax error detection with ', 'auto-correction suggestions'),
+        ('Tab completion for ', 'SQL keywords and table names'),
+        ('Command history with ', 'Up/Down arrow navigation'),
+        ('Colorized output for ', 'better readability'),
+        ('Interactive examples to ', 'learn SQL-ish'),
+        ('Query logging for ', 'future reference'),
+    )
+    
+    def __init__(self, init_script=None, stop_on_error=False):
         """
         Initialize the CLI with a new database.
         
         Args:
             init_script (str, optional): Path to SQL script to run at startup
+            stop_on_error (bool): Whether to stop a script at its first failed query
         """
         super().__init__()
         self.db = Database()
+        self.stop_on_error = stop_on_error
+        # Failed script queries only prompt for what to do when a user can answer
+        self._interactive = sys.stdin.isatty()
         self.transaction_count = 0
         self.last_command_time = None
         self.command_history = []
         self.total_queries = 0
         self.successful_queries = 0
+        self._query_log_fh = None  # Opened on the first logged query
+        self._ts_cache = (0, '')  # Last logged second and its formatted timestamp
+        self._log_cache = None  # Parsed query log entries
+        self._log_cache_key = None  # Modification time and size of the log when parsed
+        self._log_cache_limit = 0  # Number of entries that were read
+        self._rendered_entries = OrderedDict()  # Rendered log entries by line, oldest first
+        # Templates for the first line of a log entry, by status
+        self._log_header_ok = f"{YELLOW}[{{timestamp}}]{RESET} {GREEN}[{{status}}]{RESET} {MAGENTA}[{{duration}}]{RESET}"
+        self._log_header_error = f"{YELLOW}[{{timestamp}}]{RESET} {RED}[{{status}}]{RESET} {MAGENTA}[{{duration}}]{RESET}"
+        self._names_tables = None  # Tables the cached completion names were built for
+        self._names = []
+        self._status_sig = None  # Contents of the last status bar printed
+        # Decorate results only for a terminal, not when output is redirected
+        self._colored = has_colors and sys.stdout.isatty()
         self.setup_history()
         
-        # Get terminal size
+        self._box_cache = {}  # Box border lines by width
+        self._wrappers = {}  # TextWrapper instances by width
+        
+        # Choices offered when a script query fails
+        self._options_banner = (
+            f"\n{YELLOW}Options:{RESET}\n"
+            f"  {GREEN}c{RESET} - Continue to next query\n"
+            f"  {GREEN}s{RESET} - Skip remaining queries\n"
+            f"  {GREEN}d{RESET} - Show detailed error info\n"
+            f"  {GREEN}h{RESET} - Show help for this query type\n"
+            f"  {GREEN}q{RESET} - Quit script execution\n"
+        )
+        
+        # Get terminal size, and keep it current when the window is resized
         self.terminal_width = shutil.get_terminal_size().columns
+        if hasattr(signal, 'SIGWINCH'):
+            try:
+                signal.signal(signal.SIGWINCH, self._refresh_terminal_width)
+            except ValueError:
+                # Signal handlers can only be set from the main thread
+                pass
         
-        print(f"\n{Fore.CYAN}✓ {Style.BRIGHT}New SQL-ish database created.{Style.NORMAL} Ready for queries.{Style.RESET_ALL}")
+        print(f"\n{CYAN}✓ {BRIGHT}New SQL-ish database created.{NORMAL} Ready for queries.{RESET}")
         self.print_status_bar()
         
         # Run init script if provided
         if init_script:
             self.do_run(init_script)
     
+    def _refresh_terminal_width(self, signum=None, frame=None):
+        """Update the cached terminal width after the window is resized."""
+        self.terminal_width = shutil.get_terminal_size().columns
+        self._box_cache.clear()
+    
+    def _wrap(self, text, width):
+        """
+        Wrap text to the given width, reusing one TextWrapper per width.
+        
+        Args:
+            text (str): The text to wrap
+            width (int): Maximum line length
+            
+        Returns:
+            list: The wrapped lines
+        """
+        wrapper = self._wrappers.get(width)
+        if wrapper is None:
+            wrapper = self._wrappers[width] = textwrap.TextWrapper(width=width)
+        return wrapper.wrap(text)
+    
+    def _box(self, width):
+        """
+        Get the border lines for a box of the given width.
+        
+        Args:
+            width (int): Width of the box, including its sides
+            
+        Returns:
+            SimpleNamespace: The top, middle and bottom border lines
+        """
+        box = self._box_cache.get(width)
+        if box is None:
+            bar = '─' * (width - 2)
+            box = SimpleNamespace(top=f"{CYAN}┌{bar}┐{RESET}",
+                                  middle=f"{CYAN}├{bar}┤{RESET}",
+                                  bottom=f"{CYAN}└{bar}┘{RESET}")
+            self._box_cache[width] = box
+        return box
+    
     def setup_history(self):
         """Set up command history with readline."""
         # Set up command history
         try:
             if os.path.exists(HISTORY_FILE):
-                readline.read_history_file(HISTORY_FILE)
-            readline.set_history_length(1000)
+                if _LIBEDIT:
+                    # libedit uses its own file format, so let it parse the file
+                    readline.read_history_file(HISTORY_FILE)
+                else:
+                    for entry in _tail_lines(HISTORY_FILE, HISTORY_LENGTH):
+                        readline.add_history(entry)
+            readline.set_history_length(HISTORY_LENGTH)
         except (ImportError, IOError):
             pass
+        self._history_start = readline.get_current_history_length()
         atexit.register(self.save_history)
         
     def save_history(self):
         """Save command history at exit."""
         try:
-            readline.write_history_file(HISTORY_FILE)
+            new_entries = readline.get_current_history_length() - self._history_start
+            if (_LIBEDIT or not os.path.exists(HISTORY_FILE)
+                    or os.path.getsize(HISTORY_FILE) > HISTORY_COMPACT_SIZE):
+                # Rewriting the file also trims it to the history length
+                readline.write_history_file(HISTORY_FILE)
+            elif new_entries > 0:
+                readline.append_history_file(new_entries, HISTORY_FILE)
+            self._history_start += new_entries
         except (ImportError, IOError):
             pass
             
@@ -145,7 +637,11 @@ class SQLishCLI(cmd.Cmd):
             duration (float, optional): Execution time in seconds
         """
         try:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            # Format the timestamp only once per second
+            now = int(time.time())
+            if now != self._ts_cache[0]:
+                self._ts_cache = (now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+            timestamp = self._ts_cache[1]
             status = "SUCCESS" if success else "ERROR"
             duration_str = f"{duration:.3f}s" if duration is not None else "N/A"
             
@@ -154,44 +650,49 @@ class SQLishCLI(cmd.Cmd):
             if error:
                 log_entry += f"\n    ERROR: {error}"
                 
-            # Append to log file
-            with open(QUERY_LOG_FILE, 'a') as f:
-                f.write(log_entry + "\n")
+            # Append to log file, keeping it open (line buffered) for later queries
+            if self._query_log_fh is None:
+                self._query_log_fh = open(QUERY_LOG_FILE, 'a', buffering=1)
+                atexit.register(self._query_log_fh.close)
+            self._query_log_fh.write(log_entry + "\n")
                 
         except Exception:
             # Silently ignore logging errors
             pass
     
+    def _close_query_log(self):
+        """Close the query log file if it is open."""
+        if self._query_log_fh is not None:
+            self._query_log_fh.close()
+            self._query_log_fh = None
+    
     def print_status_bar(self):
         """Print a status bar with database information."""
         tables = self.db.list_tables() or []
         width = self.terminal_width
         
+        # Nothing to show if the status is the same as the last one printed
+        sig = (len(tables), self.total_queries, self.successful_queries, self.last_command_time, width)
+        if sig == self._status_sig:
+            return
+        self._status_sig = sig
+        
         status = f" Tables: {len(tables)} │ Queries: {self.total_queries} │ Success: {self.successful_queries}"
         if self.last_command_time:
             elapsed = f"Last query: {self.last_command_time:.3f}s"
             status += f" │ {elapsed}"
         
         # Create a more visually appealing status bar with gradient colors
-        print(f"{Fore.BLACK}{Back.CYAN}{status.ljust(width-1)} {Style.RESET_ALL}")
+        sys.stdout.write(_STATUS_PREFIX + status.ljust(width-1) + _STATUS_SUFFIX)
     
     def get_names(self):
         """Get completable command and SQL keyword names."""
-        names = super().get_names()
-        
-        # Add SQL keywords for better completion
-        sql_keywords = [
-            'SELECT', 'FROM', 'WHERE', 'INSERT', 'INTO', 'VALUES',
-            'CREATE', 'TABLE', 'UPDATE', 'SET', 'DELETE', 'AND', 'OR',
-            'JOIN', 'GROUP', 'BY', 'ORDER', 'LIMIT', 'IS', 'NULL', 'NOT'
-        ]
-        
-        # Add table names for completion
-        tables = self.db.list_tables() or []
-        
-        # Complete keywords in lowercase too
-        completable = (sql_keywords + [k.lower() for k in sql_keywords] + tables)
-        return names + ['do_' + item for item in completable]
+        # Rebuild the names only when the tables have changed since the last call
+        tables = tuple(self.db.list_tables() or ())
+        if tables != self._names_tables:
+            self._names = super().get_names() + list(self._SQL_KEYWORD_COMPLETIONS) + ['do_' + t for t in tables]
+            self._names_tables = tables
+        return self._names
 
     def default(self, line):
         """
@@ -200,7 +701,7 @@ class SQLishCLI(cmd.Cmd):
         Args:
             line (str): The query to execute
         """
-        if line.lower() in ('exit', 'quit'):
+        if len(line) == 4 and line.lower() in _EXIT_CMDS:
             return self.do_exit(line)
             
         try:
@@ -208,23 +709,16 @@ class SQLishCLI(cmd.Cmd):
             self.last_command = line
             
             # Record start time for performance measurement
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
             # Detect query type for formatting
-            query_type = None
-            if line.strip().upper().startswith('SELECT'):
-                query_type = 'SELECT'
-            elif line.strip().upper().startswith('INSERT'):
-                query_type = 'INSERT'
-            elif line.strip().upper().startswith('CREATE'):
-                query_type = 'CREATE'
+            query_type = _query_type(line)
                 
             # Execute the query
             result = self.db.query(line)
             
             # Record end time and calculate duration
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             self.last_command_time = duration
             self.total_queries += 1
             self.successful_queries += 1
@@ -236,7 +730,7 @@ class SQLishCLI(cmd.Cmd):
             if result is not None:
                 self._format_result(result, query_type)
             else:
-                print(f"{Fore.GREEN}Query executed successfully{Style.RESET_ALL}")
+                print(f"{GREEN}Query executed successfully{RESET}")
                 
             # Add to command history
             self.command_history.append(line)
@@ -251,69 +745,56 @@ class SQLishCLI(cmd.Cmd):
             
     def _format_result(self, result, query_type=None):
         """Format and display query results with improved visual presentation."""
-        formatted = format_result(result, query_type)
+        structured = format_result_structured(result) if self._colored else None
+        if structured is None:
+            # Messages, empty results and redirected output are printed as plain text
+            print("\n" + format_result(result, query_type))
+            return
+        columns, rows, widths = structured
         
         # Add some color based on query type
         if query_type == 'SELECT':
-            header_color = Fore.CYAN
-            border_color = Fore.BLUE
+            header_color = CYAN
+            border_color = BLUE
         elif query_type == 'INSERT':
-            header_color = Fore.GREEN
-            border_color = Fore.GREEN
+            header_color = GREEN
+            border_color = GREEN
         elif query_type == 'CREATE':
-            header_color = Fore.YELLOW
-            border_color = Fore.YELLOW
+            header_color = YELLOW
+            border_color = YELLOW
         else:
-            header_color = Fore.WHITE
-            border_color = Fore.CYAN
-            
-        # Colorize the output with minimal box drawing characters
-        lines = formatted.split('\n')
-        if len(lines) > 2:  # We have at least a header and separator
-            # Replace basic characters with box drawing characters for better visibility
-            # even without color support
-            lines[0] = lines[0].replace('+', '┌').replace('-', '─').replace('+', '┬')
-            if lines[0].endswith('+'):
-                lines[0] = lines[0][:-1] + '┐'
-            lines[0] = f"{border_color}{lines[0]}{Style.RESET_ALL}"  # Top separator
-            
-            # Header row with background
-            lines[1] = f"{Fore.WHITE}{Back.BLUE}{lines[1].replace('|', '│')}{Style.RESET_ALL}"  # Header
-            
-            # Middle separator
-            lines[2] = lines[2].replace('+', '├').replace('-', '─').replace('+', '┼')
-            if lines[2].endswith('+'):
-                lines[2] = lines[2][:-1] + '┤'
-            lines[2] = f"{border_color}{lines[2]}{Style.RESET_ALL}"  # Separator below header
-            
-            # Data rows with alternating colors
-            for i in range(3, len(lines)-1):
-                if '|' in lines[i]:  # Ensure it's a data row
-                    if i % 2 == 1:  # Odd rows
-                        lines[i] = f"{Fore.WHITE}{lines[i].replace('|', '│')}{Style.RESET_ALL}"
-                    else:  # Even rows
-                        lines[i] = f"{Fore.CYAN}{lines[i].replace('|', '│')}{Style.RESET_ALL}"
-                
-            # Bottom separator
-            if len(lines) > 3 and '+' in lines[-1]:
-                lines[-1] = lines[-1].replace('+', '└').replace('-', '─').replace('+', '┴')
-                if lines[-1].endswith('+'):
-                    lines[-1] = lines[-1][:-1] + '┘'
-                lines[-1] = f"{border_color}{lines[-1]}{Style.RESET_ALL}"
-                
-        print("\n" + "\n".join(lines))
+            header_color = WHITE
+            border_color = CYAN
+            
+        # Draw the table with box drawing characters for better visibility
+        # even without color support
+        bars = ["─" * width for width in widths]
+        lines = [
+            f"\n{border_color}┌{'┬'.join(bars)}┐{RESET}",
+            f"{WHITE}{BACK_BLUE}│ {' │ '.join(col.ljust(width-2) for col, width in zip(columns, widths))} │{RESET}",
+            f"{border_color}├{'┼'.join(bars)}┤{RESET}",
+        ]
+        
+        # Data rows with alternating colors
+        for i, row in enumerate(rows):
+            row_color = CYAN if i % 2 else WHITE
+            lines.append(f"{row_color}│ {' │ '.join(val.ljust(width-2) for val, width in zip(row, widths))} │{RESET}")
+            
+        lines.append(f"{border_color}└{'┴'.join(bars)}┘{RESET}")
+        if len(result.rows) > len(rows):
+            lines.append(f"Showing {len(rows)} of {len(result.rows)} rows.")
+        print("\n".join(lines))
                 
     def _handle_error(self, error, show_trace=False):
         """Handle and display errors with improved formatting and syntax suggestions."""
         error_msg = str(error)
-        print(f"\n{Fore.RED}ERROR{Style.RESET_ALL}")
-        print(f"{Fore.RED}{error_msg}{Style.RESET_ALL}")
+        print(f"\n{RED}ERROR{RESET}")
+        print(f"{RED}{error_msg}{RESET}")
         
         # Try to provide more context based on error type
         if "table" in error_msg.lower() and "not found" in error_msg.lower():
             # Extract table name from error message using regex
-            import re
-            table_match = re.search(r"table ['\"](.*?)['\"]", error_msg.lower())
+            table_match = _TABLE_ERR_RE.search(error_msg.lower())
             table_name = table_match.group(1) if table_match else ""
             
             tables = self.db.list_tables() or []
@@ -322,28 +803,27 @@ class SQLishCLI(cmd.Cmd):
                 similar_tables = self._find_similar_names(table_name, tables)
                 if similar_tables:
                     suggestions = ", ".join([f"'{t}'" for t in similar_tables])
-                    print(f"{Fore.YELLOW}Did you mean one of these tables? {suggestions}{Style.RESET_ALL}")
+                    print(f"{YELLOW}Did you mean one of these tables? {suggestions}{RESET}")
                 else:
-                    print(f"{Fore.YELLOW}Available tables: {', '.join(tables)}{Style.RESET_ALL}")
+                    print(f"{YELLOW}Available tables: {', '.join(tables)}{RESET}")
             else:
-                print(f"{Fore.YELLOW}No tables exist yet. Use CREATE TABLE to create one.{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}Example: CREATE TABLE {table_name} (id, name, value);{Style.RESET_ALL}")
+                print(f"{YELLOW}No tables exist yet. Use CREATE TABLE to create one.{RESET}")
+                print(f"{CYAN}Example: CREATE TABLE {table_name} (id, name, value);{RESET}")
             
         elif "syntax" in error_msg.lower():
             # Try to suggest corrections for the last command
             if hasattr(self, 'last_command') and self.last_command:
                 suggestion = self._suggest_syntax_correction(self.last_command)
                 if suggestion:
-                    print(f"{Fore.YELLOW}Suggested correction:{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}{suggestion}{Style.RESET_ALL}")
+                    print(f"{YELLOW}Suggested correction:{RESET}")
+                    print(f"{CYAN}{suggestion}{RESET}")
             
-            print(f"{Fore.YELLOW}Tip: Check your SQL syntax. Use 'help' for examples.{Style.RESET_ALL}")
+            print(f"{YELLOW}Tip: Check your SQL syntax. Use 'help' for examples.{RESET}")
             
         elif "column" in error_msg.lower() and "not found" in error_msg.lower():
             # Extract column and table info
-            import re
-            col_match = re.search(r"column ['\"](.*?)['\"]", error_msg.lower())
-            table_match = re.search(r"table ['\"](.*?)['\"]", error_msg.lower())
+            col_match = _COLUMN_ERR_RE.search(error_msg.lower())
+            table_match = _TABLE_ERR_RE.search(error_msg.lower())
             
             col_name = col_match.group(1) if col_match else ""
             table_name = table_match.group(1) if table_match else ""
@@ -351,23 +831,23 @@ class SQLishCLI(cmd.Cmd):
             if table_name:
                 try:
                     table = self.db.get_table(table_name)
-                    if table and hasattr(table, 'columns'):
+                    if table is not None and hasattr(table, 'columns'):
                         columns = table.columns
                         similar_cols = self._find_similar_names(col_name, columns)
                         
                         if similar_cols:
                             suggestions = ", ".join([f"'{c}'" for c in similar_cols])
-                            print(f"{Fore.YELLOW}Did you mean one of these columns? {suggestions}{Style.RESET_ALL}")
+                            print(f"{YELLOW}Did you mean one of these columns? {suggestions}{RESET}")
                         else:
-                            print(f"{Fore.YELLOW}Available columns in '{table_name}': {', '.join(columns)}{Style.RESET_ALL}")
+                            print(f"{YELLOW}Available columns in '{table_name}': {', '.join(columns)}{RESET}")
                 except:
                     pass
             
         elif "missing" in error_msg.lower() and "parenthesis" in error_msg.lower():
-            print(f"{Fore.YELLOW}Tip: Check for balanced parentheses in your query.{Style.RESET_ALL}")
+            print(f"{YELLOW}Tip: Check for balanced parentheses in your query.{RESET}")
             
         if show_trace:
-            print(f"\n{Fore.RED}Traceback:{Style.RESET_ALL}")
+            print(f"\n{RED}Traceback:{RESET}")
             traceback.print_exc()
             
     def _find_similar_names(self, name, candidates, threshold=0.6):
@@ -390,7 +870,6 @@ class SQLishCLI(cmd.Cmd):
         try:
             # Use difflib for fuzzy matching if name is long enough
             if len(name) > 2:
-                import difflib
                 matches = difflib.get_close_matches(name, candidates, n=3, cutoff=threshold)
                 if matches:
                     return matches
@@ -408,72 +887,25 @@ class SQLishCLI(cmd.Cmd):
         query = query.strip()
         query_lower = query.lower()
         
-        # Common SQL keyword typos and corrections
-        keyword_corrections = {
-            'slect': 'SELECT',
-            'selectt': 'SELECT',
-            'selet': 'SELECT',
-            'selec': 'SELECT',
-            'frmo': 'FROM',
-            'frm': 'FROM',
-            'fromm': 'FROM',
-            'wher': 'WHERE',
-            'whre': 'WHERE',
-            'wheer': 'WHERE',
-            'wheree': 'WHERE',
-            'insrt': 'INSERT',
-            'inser': 'INSERT',
-            'insrt into': 'INSERT INTO',
-            'insert nto': 'INSERT INTO',
-            'insert int': 'INSERT INTO',
-            'creat': 'CREATE',
-            'creae': 'CREATE',
-            'crete': 'CREATE',
-            'creat table': 'CREATE TABLE',
-            'create tabe': 'CREATE TABLE',
-            'create tble': 'CREATE TABLE',
-            'crate table': 'CREATE TABLE',
-            'delte': 'DELETE',
-            'delet': 'DELETE',
-            'dlte': 'DELETE',
-            'delte from': 'DELETE FROM',
-            'delete frm': 'DELETE FROM',
-            'updte': 'UPDATE',
-            'updae': 'UPDATE',
-            'updat': 'UPDATE',
-            'grup by': 'GROUP BY',
-            'group bye': 'GROUP BY',
-            'oder by': 'ORDER BY',
-            'orer by': 'ORDER BY',
-            'order bye': 'ORDER BY',
-        }
-        
         # Check for missing semicolons at the end
         if not query.endswith(';') and not query.endswith(')'):
             suggested_query = query + ';'
             return suggested_query
             
         # Look for common typos at the beginning of the query
-        for typo, correction in keyword_corrections.items():
-            if query_lower.startswith(typo):
-                # Replace only at the beginning to avoid replacing inside strings
-                suggested_query = correction + query[len(typo):]
-                return suggested_query
+        typo = _TYPO_RE.match(query)
+        if typo:
+            # Replace only at the beginning to avoid replacing inside strings
+            suggested_query = _TYPO_CORRECTIONS[typo.group(1).lower()] + query[typo.end():]
+            return suggested_query
                 
-        # Check for missing spaces after keywords
-        keywords = ['SELECT', 'FROM', 'WHERE', 'INSERT', 'INTO', 'VALUES', 
-                   'CREATE', 'TABLE', 'UPDATE', 'SET', 'DELETE', 'GROUP', 'BY', 'ORDER']
-        
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            pos = query_lower.find(keyword_lower)
-            if pos >= 0:
-                # Check if there's no space after keyword (unless it's at the end or followed by punctuation)
-                end_pos = pos + len(keyword_lower)
-                if end_pos < len(query_lower) and query_lower[end_pos] not in ' \t\n\r\f\v;,()':
-                    # Add a space after the keyword
-                    suggested_query = query[:end_pos] + ' ' + query[end_pos:]
-                    return suggested_query
+        # Check for missing spaces after keywords (unless followed by punctuation)
+        gap = _KEYWORD_GAP_RE.search(query)
+        if gap:
+            # Add a space after the keyword
+            end_pos = gap.end()
+            suggested_query = query[:end_pos] + ' ' + query[end_pos:]
+            return suggested_query
         
         # Check for unbalanced parentheses
         open_count = query.count('(')
@@ -513,76 +945,83 @@ class SQLishCLI(cmd.Cmd):
         
     def do_exit(self, arg):
         """Exit the CLI."""
-        print(f"\n{Fore.CYAN}Goodbye! Thanks for using SQL-ish.{Style.RESET_ALL}")
+        print(f"\n{CYAN}Goodbye! Thanks for using SQL-ish.{RESET}")
         return True
         
-    def do_quit(self, arg):
-        """Exit the CLI."""
-        return self.do_exit(arg)
+    do_quit = do_exit
         
     def do_tables(self, arg):
         """List all tables in the database."""
         tables = self.db.list_tables()
         if tables:
             header_width = self.terminal_width - 4
-            print(f"\n{Fore.CYAN}┌{'─' * (header_width-2)}┐{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}│{Fore.WHITE}{Back.BLUE}{' Tables in database '.center(header_width-2)}{Style.RESET_ALL}{Fore.CYAN}│{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}└{'─' * (header_width-2)}┘{Style.RESET_ALL}")
+            box = self._box(header_width)
+            if self._colored:
+                lines = [
+                    f"\n{box.top}",
+                    f"{CYAN}│{WHITE}{BACK_BLUE}{' Tables in database '.center(header_width-2)}{RESET}{CYAN}│{RESET}",
+                    f"{box.bottom}",
+                ]
+            else:
+                lines = ['']
             
-            # Format table info in a nice table
+            # Format table info in a nice table, with every cell converted to a string once
             headers = ["Table", "Columns", "Rows"]
             rows = []
             
             for table in tables:
                 try:
                     tbl = self.db.get_table(table)
-                    rows.append([table, len(tbl.columns), len(tbl.rows)])
+                    rows.append([table, str(len(tbl.columns)), str(len(tbl.rows))])
                 except:
                     rows.append([table, "?", "?"])
             
-            # Find column widths
-            col_widths = []
-            for i, col in enumerate(headers):
-                # Start with header width
-                width = len(str(col))
-                # Check all row values
-                for row in rows:
-                    width = max(width, len(str(row[i])))
-                col_widths.append(width + 2)  # Add padding
+            # Find column widths, starting with the header widths, plus padding
+            col_widths = [max(len(col), *(len(row[i]) for row in rows)) + 2
+                          for i, col in enumerate(headers)]
             
             # Build header with box drawing characters
-            total_width = sum(col_widths) + len(col_widths) + 1
-            header = "│ " + " │ ".join(str(col).ljust(width-2) for col, width in zip(headers, col_widths)) + " │"
+            header = "│ " + " │ ".join(col.ljust(width-2) for col, width in zip(headers, col_widths)) + " │"
             top_separator = "┌" + "┬".join("─" * width for width in col_widths) + "┐"
             middle_separator = "├" + "┼".join("─" * width for width in col_widths) + "┤"
             bottom_separator = "└" + "┴".join("─" * width for width in col_widths) + "┘"
             
-            # Print the table
-            print(f"{Fore.CYAN}{top_separator}{Style.RESET_ALL}")
-            print(f"{Fore.WHITE}{Back.BLUE}{header}{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}{middle_separator}{Style.RESET_ALL}")
+            # Build the table and write it out in one go
+            lines.append(f"{CYAN}{top_separator}{RESET}")
+            lines.append(f"{WHITE}{BACK_BLUE}{header}{RESET}")
+            lines.append(f"{CYAN}{middle_separator}{RESET}")
             
             for i, row in enumerate(rows):
                 if i % 2 == 0:  # Even rows
-                    row_color = Fore.WHITE
+                    row_color = WHITE
                 else:  # Odd rows
-                    row_color = Fore.CYAN
-                row_str = f"{row_color}│ " + f" │ ".join(str(val).ljust(width-2) for val, width in zip(row, col_widths)) + f" │{Style.RESET_ALL}"
-                print(row_str)
+                    row_color = CYAN
+                row_str = f"{row_color}│ " + f" │ ".join(val.ljust(width-2) for val, width in zip(row, col_widths)) + f" │{RESET}"
+                lines.append(row_str)
                 
-            print(f"{Fore.CYAN}{bottom_separator}{Style.RESET_ALL}")
+            lines.append(f"{CYAN}{bottom_separator}{RESET}")
+            lines.append('')
+            sys.stdout.write('\n'.join(lines))
         else:
-            print(f"\n{Fore.YELLOW}⚠ No tables defined. Use CREATE TABLE to create one.{Style.RESET_ALL}")
+            print(f"\n{YELLOW}⚠ No tables defined. Use CREATE TABLE to create one.{RESET}")
     
     def do_run(self, filepath):
         """
         Run SQL commands from a file.
         
+        With -q (or --quiet) before the path, only a progress line, errors and
+        the summary are shown.
+        
         Args:
-            filepath (str): Path to the SQL script file
+            filepath (str): Path to the SQL script file, optionally prefixed with -q
         """
+        option, _, rest = filepath.partition(' ')
+        quiet = option in ('-q', '--quiet')
+        if quiet:
+            filepath = rest.strip()
+            
         if not filepath:
-            print(f"{Fore.RED}Error: Missing filepath. Usage: run <filepath>{Style.RESET_ALL}")
+            print(f"{RED}Error: Missing filepath. Usage: run [-q] <filepath>{RESET}")
             return
             
         # Support for relative paths
@@ -591,67 +1030,60 @@ class SQLishCLI(cmd.Cmd):
             filepath = os.path.abspath(filepath)
             
         if not os.path.exists(filepath):
-            print(f"{Fore.RED}Error: File not found: {filepath}{Style.RESET_ALL}")
+            print(f"{RED}Error: File not found: {filepath}{RESET}")
             return
             
         try:
             header_width = self.terminal_width - 4
-            print(f"\n{Fore.CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Style.RESET_ALL}")
-            print(f"{Fore.WHITE}{Back.BLUE} Executing SQL script {Style.RESET_ALL}")
-            print(f"{Fore.CYAN}{filepath}{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Style.RESET_ALL}")
-            
-            with open(filepath, 'r') as f:
-                content = f.read()
-                
-            # Remove comments
-            content = re.sub(r'--.*$', '', content, flags=re.MULTILINE)
-                
-            # Split content into queries, respecting string literals
-            queries = smart_split_sql(content)
+            print(f"\n{CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{RESET}")
+            print(f"{WHITE}{BACK_BLUE} Executing SQL script {RESET}")
+            print(f"{CYAN}{filepath}{RESET}")
+            print(f"{CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{RESET}")
             
-            # Filter out empty queries
-            queries = [q.strip() for q in queries if q.strip()]
-            total_queries = len(queries)
+            # Estimate the query count for the progress display from the
+            # terminators, so the script is only split once as it runs
+            total_queries = _count_terminators(filepath)
             
-            if total_queries == 0:
-                print(f"{Fore.YELLOW}No valid SQL queries found in the file.{Style.RESET_ALL}")
-                return
-                
             successful_queries = 0
             error_queries = 0
+            query_num = 0
             
-            # Create a progress bar
+            # Create a progress bar, shown about 50 times over long scripts
             progress_width = min(50, self.terminal_width - 20)
+            progress_step = max(1, total_queries // 50)
             
-            for i, query in enumerate(queries):
+            for i, query in enumerate(_iter_script(filepath)):
                 try:
                     query_num = i + 1
+                    if query_num > total_queries:
+                        # A final query without a semicolon
+                        total_queries = query_num
                     
-                    # Display progress
-                    progress = int(query_num / total_queries * progress_width)
-                    progress_bar = f"[{'=' * progress}{' ' * (progress_width - progress)}]"
-                    progress_text = f"{Fore.CYAN}{progress_bar} {query_num}/{total_queries}{Style.RESET_ALL}"
-                    print(f"\n{progress_text}")
+                    # Display progress and the query with a single write
+                    header = ''
+                    if query_num % progress_step == 0 or query_num == total_queries:
+                        progress = int(query_num / total_queries * progress_width)
+                        progress_bar = f"[{'=' * progress}{' ' * (progress_width - progress)}]"
+                        header = f"{CYAN}{progress_bar} {query_num}/{total_queries}{RESET}"
+                        if quiet:
+                            # Redraw the progress line in place
+                            sys.stdout.write('\r' + header)
+                            sys.stdout.flush()
+                        else:
+                            header = f"\n{header}\n"
                     
-                    print(f"\n{Fore.YELLOW}Query {query_num}/{total_queries}:{Style.RESET_ALL}")
-                    print(query)
-                    print(f"{Fore.CYAN}{'-' * 40}{Style.RESET_ALL}")
+                    if not quiet:
+                        sys.stdout.write(f"{header}\n{YELLOW}Query {query_num}/{total_queries}:{RESET}\n"
+                                         f"{query}\n{CYAN}{'-' * 40}{RESET}\n")
                     
                     # Save query for error handling
                     self.last_command = query
                     
                     # Record start time for performance measurement
-                    start_time = datetime.now()
+                    start_time = time.perf_counter()
                     
                     # Detect query type for formatting
-                    query_type = None
-                    if query.strip().upper().startswith('SELECT'):
-                        query_type = 'SELECT'
-                    elif query.strip().upper().startswith('INSERT'):
-                        query_type = 'INSERT'
-                    elif query.strip().upper().startswith('CREATE'):
-                        query_type = 'CREATE'
+                    query_type = _query_type(query)
                     
                     # Execute the query
                     result = self.db.query(query)
@@ -659,37 +1091,41 @@ class SQLishCLI(cmd.Cmd):
                     self.total_queries += 1
                     
                     # Record end time and calculate duration
-                    end_time = datetime.now()
-                    duration = (end_time - start_time).total_seconds()
+                    duration = time.perf_counter() - start_time
                     self.last_command_time = duration
                     
                     # Format and display the result
-                    if result is not None:
-                        print(f"{Fore.GREEN}Result:{Style.RESET_ALL}")
-                        self._format_result(result, query_type)
-                    else:
-                        print(f"{Fore.GREEN}Query executed successfully{Style.RESET_ALL}")
+                    if not quiet:
+                        if result is not None:
+                            print(f"{GREEN}Result:{RESET}")
+                            self._format_result(result, query_type)
+                        else:
+                            print(f"{GREEN}Query executed successfully{RESET}")
                         
                 except Exception as e:
                     error_queries += 1
-                    print(f"{Fore.RED}Error in query {query_num}:{Style.RESET_ALL}")
+                    if quiet:
+                        # Move off the progress line and show the failing query
+                        print(f"\n\n{YELLOW}Query {query_num}/{total_queries}:{RESET}")
+                        print(query)
+                    print(f"{RED}Error in query {query_num}:{RESET}")
                     
                     # Apply enhanced error handling with syntax suggestions
                     error_msg = str(e)
-                    print(f"\n{Fore.RED}ERROR: {error_msg}{Style.RESET_ALL}")
+                    print(f"\n{RED}ERROR: {error_msg}{RESET}")
                     
                     # Try to suggest a correction
                     suggestion = self._suggest_syntax_correction(query)
                     if suggestion:
-                        print(f"\n{Fore.YELLOW}Suggested correction:{Style.RESET_ALL}")
-                        print(f"{Fore.CYAN}{suggestion}{Style.RESET_ALL}")
+                        print(f"\n{YELLOW}Suggested correction:{RESET}")
+                        print(f"{CYAN}{suggestion}{RESET}")
                         
                         # Offer to execute the suggested correction
-                        if input(f"\n{Fore.GREEN}Execute suggested correction? (y/n):{Style.RESET_ALL} ").lower() == 'y':
+                        if self._interactive and input(f"\n{GREEN}Execute suggested correction? (y/n):{RESET} ").lower() == 'y':
                             try:
-                                print(f"\n{Fore.YELLOW}Executing suggested correction:{Style.RESET_ALL}")
+                                print(f"\n{YELLOW}Executing suggested correction:{RESET}")
                                 print(suggestion)
-                                print(f"{Fore.CYAN}{'-' * 40}{Style.RESET_ALL}")
+                                print(f"{CYAN}{'-' * 40}{RESET}")
                                 
                                 # Execute the suggestion
                                 result = self.db.query(suggestion)
@@ -698,100 +1134,109 @@ class SQLishCLI(cmd.Cmd):
                                 
                                 # Format and display the result
                                 if result is not None:
-                                    print(f"{Fore.GREEN}Result:{Style.RESET_ALL}")
+                                    print(f"{GREEN}Result:{RESET}")
                                     self._format_result(result, query_type)
                                 else:
-                                    print(f"{Fore.GREEN}Query executed successfully{Style.RESET_ALL}")
+                                    print(f"{GREEN}Query executed successfully{RESET}")
                                     
                                 # Continue to next query
                                 continue
                             except Exception as e2:
-                                print(f"{Fore.RED}Error executing suggested correction: {str(e2)}{Style.RESET_ALL}")
+                                print(f"{RED}Error executing suggested correction: {str(e2)}{RESET}")
+                    
+                    if self.stop_on_error:
+                        print(f"\n{YELLOW}Skipping remaining queries.{RESET}")
+                        break
+                    if not self._interactive:
+                        # Nobody to ask, so carry on with the next query
+                        continue
                     
                     # Add options for error handling
-                    print(f"\n{Fore.YELLOW}Options:{Style.RESET_ALL}")
-                    print(f"  {Fore.GREEN}c{Style.RESET_ALL} - Continue to next query")
-                    print(f"  {Fore.GREEN}s{Style.RESET_ALL} - Skip remaining queries")
-                    print(f"  {Fore.GREEN}d{Style.RESET_ALL} - Show detailed error info")
-                    print(f"  {Fore.GREEN}h{Style.RESET_ALL} - Show help for this query type")
-                    print(f"  {Fore.GREEN}q{Style.RESET_ALL} - Quit script execution")
+                    sys.stdout.write(self._options_banner)
                     
                     while True:
-                        choice = input(f"\n{Fore.GREEN}Choice [c/s/d/h/q]:{Style.RESET_ALL} ").lower()
+                        try:
+                            choice = input(f"\n{GREEN}Choice [c/s/d/h/q]:{RESET} ").lower()
+                        except EOFError:
+                            choice = 'q'
                         if choice == 'c':
                             break
                         elif choice == 's':
-                            print(f"\n{Fore.YELLOW}Skipping remaining queries.{Style.RESET_ALL}")
+                            print(f"\n{YELLOW}Skipping remaining queries.{RESET}")
                             break
                         elif choice == 'd':
-                            print(f"\n{Fore.YELLOW}Detailed error information:{Style.RESET_ALL}")
+                            print(f"\n{YELLOW}Detailed error information:{RESET}")
                             traceback.print_exc()
                             continue
                         elif choice == 'h':
                             # Show help specific to the query type
-                            query_prefix = query.strip().split(' ')[0].upper() if query.strip() else ""
-                            print(f"\n{Fore.YELLOW}Help for {query_prefix} queries:{Style.RESET_ALL}")
+                            query_prefix = query.lstrip().partition(' ')[0].upper()
+                            print(f"\n{YELLOW}Help for {query_prefix} queries:{RESET}")
                             
-                            if query_prefix == 'SELECT':
-                                print(f"\n{Fore.CYAN}Syntax: SELECT column1, column2, ... FROM table_name [WHERE condition];{Style.RESET_ALL}")
-                                print(f"{Fore.WHITE}Example: SELECT id, name FROM users WHERE age > 18;{Style.RESET_ALL}")
-                            elif query_prefix == 'INSERT':
-                                print(f"\n{Fore.CYAN}Syntax: INSERT INTO table_name VALUES (value1, value2, ...);{Style.RESET_ALL}")
-                                print(f"{Fore.WHITE}Example: INSERT INTO users VALUES (1, 'John', 'john@example.com');{Style.RESET_ALL}")
-                            elif query_prefix == 'CREATE':
-                                print(f"\n{Fore.CYAN}Syntax: CREATE TABLE table_name (column1, column2, ...);{Style.RESET_ALL}")
-                                print(f"{Fore.WHITE}Example: CREATE TABLE users (id, name, email);{Style.RESET_ALL}")
-                            elif query_prefix == 'UPDATE':
-                                print(f"\n{Fore.CYAN}Syntax: UPDATE table_name SET column1 = value1, column2 = value2, ... WHERE condition;{Style.RESET_ALL}")
-                                print(f"{Fore.WHITE}Example: UPDATE users SET name = 'Jane' WHERE id = 1;{Style.RESET_ALL}")
-                            elif query_prefix == 'DELETE':
-                                print(f"\n{Fore.CYAN}Syntax: DELETE FROM table_name WHERE condition;{Style.RESET_ALL}")
-                                print(f"{Fore.WHITE}Example: DELETE FROM users WHERE id = 1;{Style.RESET_ALL}")
+                            prefix_help = self._PREFIX_HELP.get(query_prefix)
+                            if prefix_help:
+                                syntax, example = prefix_help
+                                print(f"\n{CYAN}Syntax: {syntax}{RESET}")
+                                print(f"{WHITE}Example: {example}{RESET}")
                             else:
                                 # Generic SQL help
                                 self.do_help(None)
                             
                             continue
                         elif choice == 'q':
-                            print(f"\n{Fore.YELLOW}Script execution halted by user.{Style.RESET_ALL}")
+                            print(f"\n{YELLOW}Script execution halted by user.{RESET}")
                             return
                         else:
-                            print(f"{Fore.RED}Invalid choice. Please enter c, s, d, h, or q.{Style.RESET_ALL}")
+                            print(f"{RED}Invalid choice. Please enter c, s, d, h, or q.{RESET}")
                     
                     if choice == 's':
                         break
+            else:
+                # Semicolons in strings or comments inflate the estimate
+                if quiet and 0 < query_num < total_queries:
+                    sys.stdout.write(f"\r{CYAN}[{'=' * progress_width}] {query_num}/{query_num}{RESET}"
+                                     f"{' ' * len(str(total_queries))}")
+                total_queries = query_num
+            
+            if query_num == 0:
+                print(f"{YELLOW}No valid SQL queries found in the file.{RESET}")
+                return
             
             # Report results
-            print(f"\n{Fore.CYAN}Script execution summary:{Style.RESET_ALL}")
+            print(f"\n{CYAN}Script execution summary:{RESET}")
             print(f"- Total queries: {total_queries}")
             print(f"- Successful: {successful_queries}")
             print(f"- Failed: {error_queries}")
             
             if error_queries == 0:
-                print(f"\n{Fore.GREEN}All queries executed successfully!{Style.RESET_ALL}")
+                print(f"\n{GREEN}All queries executed successfully!{RESET}")
             else:
-                print(f"\n{Fore.YELLOW}Script completed with {error_queries} error(s).{Style.RESET_ALL}")
+                print(f"\n{YELLOW}Script completed with {error_queries} error(s).{RESET}")
                 
             # Update the status bar
             self.print_status_bar()
                 
         except Exception as e:
-            print(f"\n{Fore.RED}Error reading or processing script: {e}{Style.RESET_ALL}")
+            print(f"\n{RED}Error reading or processing script: {e}{RESET}")
     
     def do_history(self, arg):
         """Show command history."""
         if not self.command_history:
-            print(f"{Fore.YELLOW}No commands in history yet.{Style.RESET_ALL}")
+            print(f"{YELLOW}No commands in history yet.{RESET}")
             return
             
-        print(f"\n{Fore.CYAN}Command History:{Style.RESET_ALL}")
+        print(f"\n{CYAN}Command History:{RESET}")
         for i, cmd in enumerate(self.command_history[-20:], 1):
             print(f"{i:2d}: {cmd}")
     
     def do_clear(self, arg):
         """Clear the screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if _CLEAR_SEQ:
+            sys.stdout.write(_CLEAR_SEQ)
+        else:
+            os.system(_CLEAR_CMD)
         print(self.intro)
+        self._status_sig = None
         self.print_status_bar()
 
     def do_example(self, arg):
@@ -810,13 +1255,16 @@ class SQLishCLI(cmd.Cmd):
             if 1 <= example_num <= len(examples):
                 example = examples[example_num - 1]
                 header_width = self.terminal_width - 4
+                box = self._box(header_width)
                 
-                print(f"\n{Fore.CYAN}┌{'─' * (header_width-2)}┐{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}│{Fore.WHITE}{Back.BLUE}{f' Running Example {example_num}: {example[0]} '.center(header_width-2)}{Style.RESET_ALL}{Fore.CYAN}│{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}└{'─' * (header_width-2)}┘{Style.RESET_ALL}")
-                
-                # Colorize example query
-                self._colorize_sql(example[1])
+                # Show the title and the colorized example query
+                out = [
+                    f"\n{box.top}",
+                    f"{CYAN}│{WHITE}{BACK_BLUE}{f' Running Example {example_num}: {example[0]} '.center(header_width-2)}{RESET}{CYAN}│{RESET}",
+                    f"{box.bottom}",
+                    _colorize_sql_str(example[1]),
+                ]
+                sys.stdout.write('\n'.join(out) + '\n')
                 
                 # Execute the example
                 try:
@@ -825,161 +1273,80 @@ class SQLishCLI(cmd.Cmd):
                     self._handle_error(e)
                 return
             else:
-                print(f"{Fore.RED}Invalid example number. Choose 1-{len(examples)}.{Style.RESET_ALL}")
+                print(f"{RED}Invalid example number. Choose 1-{len(examples)}.{RESET}")
                 
         # Display all examples
         header_width = self.terminal_width - 4
-        print(f"\n{Fore.CYAN}┌{'─' * (header_width-2)}┐{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Fore.WHITE}{Back.BLUE}{' SQL-ish Example Queries '.center(header_width-2)}{Style.RESET_ALL}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}└{'─' * (header_width-2)}┘{Style.RESET_ALL}")
+        inner_width = header_width - 2
+        box = self._box(header_width)
+        out = []
+        out.append(f"\n{box.top}")
+        out.append(f"{CYAN}│{WHITE}{BACK_BLUE}{' SQL-ish Example Queries '.center(inner_width)}{RESET}{CYAN}│{RESET}")
+        out.append(f"{box.bottom}")
         
         for i, (description, query) in enumerate(examples, 1):
-            print(f"\n{Fore.CYAN}┌{'─' * (header_width-2)}┐{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}│{Fore.YELLOW} Example {i}: {Fore.WHITE}{description}{' ' * (header_width - len(f' Example {i}: {description}') - 2)}{Fore.CYAN}│{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}├{'─' * (header_width-2)}┤{Style.RESET_ALL}")
+            out.append(f"\n{box.top}")
+            label = f" Example {i}: "
+            out.append(f"{CYAN}│{YELLOW}{label}{WHITE}{description.ljust(inner_width - len(label))}{CYAN}│{RESET}")
+            out.append(f"{box.middle}")
             
             # Try to show colorized SQL, but ensure it fits in the box
-            print(f"{Fore.CYAN}│{Style.RESET_ALL} ", end="")
             if len(query) > header_width - 4:
                 # Handle long queries by wrapping them
-                wrapped_lines = textwrap.wrap(query, width=header_width-4)
-                print(wrapped_lines[0] + " " * (header_width - len(wrapped_lines[0]) - 4) + f"{Fore.CYAN}│{Style.RESET_ALL}")
-                for line in wrapped_lines[1:]:
-                    print(f"{Fore.CYAN}│{Style.RESET_ALL} " + line + " " * (header_width - len(line) - 4) + f"{Fore.CYAN}│{Style.RESET_ALL}")
+                wrapped_lines = self._wrap(query, header_width-4)
             else:
-                print(query + " " * (header_width - len(query) - 4) + f"{Fore.CYAN}│{Style.RESET_ALL}")
+                wrapped_lines = [query]
+            for line in wrapped_lines:
+                out.append(f"{CYAN}│{RESET} {line.ljust(inner_width - 1)}{CYAN}│{RESET}")
             
-            print(f"{Fore.CYAN}├{'─' * (header_width-2)}┤{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}│{Style.RESET_ALL} Type {Fore.GREEN}example {i}{Style.RESET_ALL} to run this example{' ' * (header_width - len(' Type example X to run this example') - 2)}{Fore.CYAN}│{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}└{'─' * (header_width-2)}┘{Style.RESET_ALL}")
+            out.append(f"{box.middle}")
+            run_hint = ' to run this example'.ljust(inner_width - len(f" Type example {i}"))
+            out.append(f"{CYAN}│{RESET} Type {GREEN}example {i}{RESET}{run_hint}{CYAN}│{RESET}")
+            out.append(f"{box.bottom}")
             
-    def _colorize_sql(self, query):
-        """Colorize SQL keywords and other parts of the query."""
-        keywords = ['SELECT', 'FROM', 'WHERE', 'INSERT', 'INTO', 'VALUES', 'CREATE', 'TABLE', 'UPDATE', 'SET', 'DELETE', 'AND', 'OR']
-        
-        # First replace literals to protect them
-        import re
-        
-        # Function to process each token
-        def process_token(token):
-            # Check if token is a keyword
-            upper_token = token.upper()
-            if upper_token in keywords:
-                return f"{Fore.MAGENTA}{upper_token}{Style.RESET_ALL}"
-            
-            # Check if token is a number
-            if token.replace('.', '', 1).isdigit():
-                return f"{Fore.BLUE}{token}{Style.RESET_ALL}"
-                
-            # Check if token could be a column or table name (alphanumeric)
-            if re.match(r'^[a-zA-Z0-9_\.]+$', token):
-                return f"{Fore.CYAN}{token}{Style.RESET_ALL}"
-                
-            # Return token as is for everything else
-            return token
-        
-        # Protect string literals to prevent colorizing their contents
-        protected_query = query
-        string_literals = re.finditer(r'"[^"]*"|\'[^\']*\'', query)
-        replacements = {}
-        
-        for match in string_literals:
-            placeholder = f"__STR{len(replacements)}__"
-            replacements[placeholder] = match.group(0)
-            protected_query = protected_query.replace(match.group(0), placeholder)
-        
-        # Colorize keywords and other elements
-        for keyword in keywords:
-            pattern = r'\b' + keyword + r'\b'
-            replacement = f"{Fore.MAGENTA}{keyword}{Style.RESET_ALL}"
-            protected_query = re.sub(pattern, replacement, protected_query, flags=re.IGNORECASE)
-        
-        # Colorize numbers
-        protected_query = re.sub(r'\b\d+\.?\d*\b', lambda m: f"{Fore.BLUE}{m.group(0)}{Style.RESET_ALL}", protected_query)
-        
-        # Colorize identifiers (table/column names)
-        protected_query = re.sub(r'\b[a-zA-Z][a-zA-Z0-9_]*\b(?!\s*=)', 
-                              lambda m: f"{Fore.CYAN}{m.group(0)}{Style.RESET_ALL}", 
-                              protected_query)
-        
-        # Restore string literals with special color
-        for placeholder, original in replacements.items():
-            colored_str = f"{Fore.GREEN}{original}{Style.RESET_ALL}"
-            protected_query = protected_query.replace(placeholder, colored_str)
+        sys.stdout.write('\n'.join(out) + '\n')
             
-        # Colorize semicolons
-        protected_query = protected_query.replace(';', f"{Fore.YELLOW};{Style.RESET_ALL}")
-        
-        # Colorize parentheses and commas
-        protected_query = protected_query.replace('(', f"{Fore.YELLOW}({Style.RESET_ALL}")
-        protected_query = protected_query.replace(')', f"{Fore.YELLOW}){Style.RESET_ALL}")
-        protected_query = protected_query.replace(',', f"{Fore.YELLOW},{Style.RESET_ALL}")
-        
-        print(f"{protected_query}")
-
     def do_syntax(self, arg):
         """Show proper syntax for SQL commands with examples."""
-        syntax_help = {
-            "select": {
-                "syntax": "SELECT column1, column2, ... FROM table_name [WHERE condition];",
-                "example": "SELECT id, name, email FROM users WHERE age > 18;",
-                "description": "Retrieves data from one or more tables."
-            },
-            "insert": {
-                "syntax": "INSERT INTO table_name VALUES (value1, value2, ...);",
-                "example": "INSERT INTO users VALUES (1, 'John', 'john@example.com');",
-                "description": "Adds new records to a table."
-            },
-            "create": {
-                "syntax": "CREATE TABLE table_name (column1, column2, ...);",
-                "example": "CREATE TABLE users (id, name, email, age);",
-                "description": "Creates a new table in the database."
-            },
-            "update": {
-                "syntax": "UPDATE table_name SET column1 = value1, column2 = value2, ... WHERE condition;",
-                "example": "UPDATE users SET name = 'Jane' WHERE id = 1;",
-                "description": "Modifies existing records in a table."
-            },
-            "delete": {
-                "syntax": "DELETE FROM table_name WHERE condition;",
-                "example": "DELETE FROM users WHERE id = 1;",
-                "description": "Removes records from a table."
-            }
-        }
+        syntax_help = self._SYNTAX_HELP
         
         # If no argument provided, show all syntax help
         if not arg:
             header_width = self.terminal_width - 4
-            print(f"\n{Fore.CYAN}┌{'─' * (header_width-2)}┐{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}│{Fore.WHITE}{Back.BLUE}{' SQL-ish Syntax Reference '.center(header_width-2)}{Style.RESET_ALL}{Fore.CYAN}│{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}└{'─' * (header_width-2)}┘{Style.RESET_ALL}")
+            inner_width = header_width - 2
+            box = self._box(header_width)
+            out = []
+            out.append(f"\n{box.top}")
+            out.append(f"{CYAN}│{WHITE}{BACK_BLUE}{' SQL-ish Syntax Reference '.center(inner_width)}{RESET}{CYAN}│{RESET}")
+            out.append(f"{box.bottom}")
             
             for cmd, help_info in syntax_help.items():
-                print(f"\n{Fore.CYAN}┌{'─' * (header_width-2)}┐{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}│{Fore.YELLOW}{cmd.upper()}{' ' * (header_width - len(cmd.upper()) - 2)}{Fore.CYAN}│{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}├{'─' * (header_width-2)}┤{Style.RESET_ALL}")
+                out.append(f"\n{box.top}")
+                out.append(f"{CYAN}│{YELLOW}{cmd.upper().ljust(inner_width)}{CYAN}│{RESET}")
+                out.append(f"{box.middle}")
                 
-                desc_wrapped = textwrap.wrap(f"Description: {help_info['description']}", width=header_width-4)
+                desc_wrapped = self._wrap(f"Description: {help_info['description']}", header_width-4)
                 for line in desc_wrapped:
-                    print(f"{Fore.CYAN}│{Style.RESET_ALL} {Fore.WHITE}{line}{' ' * (header_width - len(line) - 2)}{Fore.CYAN}│{Style.RESET_ALL}")
+                    out.append(f"{CYAN}│{RESET} {WHITE}{line.ljust(inner_width - 1)}{CYAN}│{RESET}")
                 
-                print(f"{Fore.CYAN}├{'─' * (header_width-2)}┤{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}│{Fore.GREEN} Syntax:{' ' * (header_width - 9)}{Fore.CYAN}│{Style.RESET_ALL}")
+                out.append(f"{box.middle}")
+                out.append(f"{CYAN}│{GREEN}{' Syntax:'.ljust(inner_width)}{CYAN}│{RESET}")
                 
-                syntax_wrapped = textwrap.wrap(help_info['syntax'], width=header_width-4)
+                syntax_wrapped = self._wrap(help_info['syntax'], header_width-4)
                 for line in syntax_wrapped:
-                    print(f"{Fore.CYAN}│{Style.RESET_ALL}  {Fore.CYAN}{line}{' ' * (header_width - len(line) - 4)}{Fore.CYAN}│{Style.RESET_ALL}")
+                    out.append(f"{CYAN}│{RESET}  {CYAN}{line.ljust(inner_width - 2)}{CYAN}│{RESET}")
                 
-                print(f"{Fore.CYAN}├{'─' * (header_width-2)}┤{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}│{Fore.GREEN} Example:{' ' * (header_width - 10)}{Fore.CYAN}│{Style.RESET_ALL}")
+                out.append(f"{box.middle}")
+                out.append(f"{CYAN}│{GREEN}{' Example:'.ljust(inner_width)}{CYAN}│{RESET}")
                 
-                example_wrapped = textwrap.wrap(help_info['example'], width=header_width-4)
+                example_wrapped = self._wrap(help_info['example'], header_width-4)
                 for line in example_wrapped:
-                    print(f"{Fore.CYAN}│{Style.RESET_ALL}  {Fore.CYAN}{line}{' ' * (header_width - len(line) - 4)}{Fore.CYAN}│{Style.RESET_ALL}")
+                    out.append(f"{CYAN}│{RESET}  {CYAN}{line.ljust(inner_width - 2)}{CYAN}│{RESET}")
                 
-                print(f"{Fore.CYAN}└{'─' * (header_width-2)}┘{Style.RESET_ALL}")
+                out.append(f"{box.bottom}")
                 
-            print(f"\n{Fore.YELLOW}For more details on a specific command, type: {Fore.GREEN}syntax <command>{Style.RESET_ALL}")
+            out.append(f"\n{YELLOW}For more details on a specific command, type: {GREEN}syntax <command>{RESET}")
+            sys.stdout.write('\n'.join(out) + '\n')
             return
             
         # Show syntax help for a specific command
@@ -987,49 +1354,52 @@ class SQLishCLI(cmd.Cmd):
         if cmd in syntax_help:
             help_info = syntax_help[cmd]
             header_width = self.terminal_width - 4
+            inner_width = header_width - 2
+            box = self._box(header_width)
+            out = []
             
-            print(f"\n{Fore.CYAN}┌{'─' * (header_width-2)}┐{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}│{Fore.WHITE}{Back.BLUE}{f' SQL-ish {cmd.upper()} Syntax '.center(header_width-2)}{Style.RESET_ALL}{Fore.CYAN}│{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}├{'─' * (header_width-2)}┤{Style.RESET_ALL}")
+            out.append(f"\n{box.top}")
+            out.append(f"{CYAN}│{WHITE}{BACK_BLUE}{f' SQL-ish {cmd.upper()} Syntax '.center(inner_width)}{RESET}{CYAN}│{RESET}")
+            out.append(f"{box.middle}")
             
-            desc_wrapped = textwrap.wrap(f"Description: {help_info['description']}", width=header_width-4)
+            desc_wrapped = self._wrap(f"Description: {help_info['description']}", header_width-4)
             for line in desc_wrapped:
-                print(f"{Fore.CYAN}│{Style.RESET_ALL} {Fore.WHITE}{line}{' ' * (header_width - len(line) - 2)}{Fore.CYAN}│{Style.RESET_ALL}")
+                out.append(f"{CYAN}│{RESET} {WHITE}{line.ljust(inner_width - 1)}{CYAN}│{RESET}")
             
-            print(f"{Fore.CYAN}├{'─' * (header_width-2)}┤{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}│{Fore.GREEN} Syntax:{' ' * (header_width - 9)}{Fore.CYAN}│{Style.RESET_ALL}")
+            out.append(f"{box.middle}")
+            out.append(f"{CYAN}│{GREEN}{' Syntax:'.ljust(inner_width)}{CYAN}│{RESET}")
             
-            syntax_wrapped = textwrap.wrap(help_info['syntax'], width=header_width-4)
+            syntax_wrapped = self._wrap(help_info['syntax'], header_width-4)
             for line in syntax_wrapped:
-                print(f"{Fore.CYAN}│{Style.RESET_ALL}  {line}{' ' * (header_width - len(line) - 4)}{Fore.CYAN}│{Style.RESET_ALL}")
+                out.append(f"{CYAN}│{RESET}  {line.ljust(inner_width - 2)}{CYAN}│{RESET}")
             
-            print(f"{Fore.CYAN}├{'─' * (header_width-2)}┤{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}│{Fore.GREEN} Example:{' ' * (header_width - 10)}{Fore.CYAN}│{Style.RESET_ALL}")
+            out.append(f"{box.middle}")
+            out.append(f"{CYAN}│{GREEN}{' Example:'.ljust(inner_width)}{CYAN}│{RESET}")
             
-            example_wrapped = textwrap.wrap(help_info['example'], width=header_width-4)
+            example_wrapped = self._wrap(help_info['example'], header_width-4)
             for line in example_wrapped:
-                print(f"{Fore.CYAN}│{Style.RESET_ALL}  {line}{' ' * (header_width - len(line) - 4)}{Fore.CYAN}│{Style.RESET_ALL}")
+                out.append(f"{CYAN}│{RESET}  {line.ljust(inner_width - 2)}{CYAN}│{RESET}")
             
-            print(f"{Fore.CYAN}├{'─' * (header_width-2)}┤{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}│{Fore.YELLOW} Would you like to run this example? (y/n){' ' * (header_width - 40)}{Fore.CYAN}│{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}└{'─' * (header_width-2)}┘{Style.RESET_ALL}")
+            out.append(f"{box.middle}")
+            out.append(f"{CYAN}│{YELLOW}{' Would you like to run this example? (y/n)'.ljust(inner_width)}{CYAN}│{RESET}")
+            out.append(f"{box.bottom}")
+            sys.stdout.write('\n'.join(out) + '\n')
             
-            if input(f"{Fore.GREEN}Run example? (y/n):{Style.RESET_ALL} ").lower() == 'y':
+            if input(f"{GREEN}Run example? (y/n):{RESET} ").lower() == 'y':
                 try:
                     self.default(help_info['example'])
                 except Exception as e:
                     self._handle_error(e)
         else:
-            print(f"{Fore.RED}Unknown command: {cmd}{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}Available commands: {', '.join(syntax_help.keys())}{Style.RESET_ALL}")
+            print(f"{RED}Unknown command: {cmd}{RESET}")
+            print(f"{YELLOW}Available commands: {', '.join(syntax_help.keys())}{RESET}")
 
     def do_help(self, arg):
         """Show help message."""
         # Handle command specific help
         if arg:
             # Check if it's a SQL command for better help
-            sql_commands = ['select', 'insert', 'create', 'update', 'delete']
-            if arg.lower() in sql_commands:
+            if arg.lower() in self._SYNTAX_HELP:
                 return self.do_syntax(arg)
                 
             # Otherwise use standard help
@@ -1038,69 +1408,128 @@ class SQLishCLI(cmd.Cmd):
                 
         # General help with better formatting
         term_width = self.terminal_width
+        inner_width = term_width - 2
+        box = self._box(term_width)
+        out = []
         
-        print(f"\n{Fore.CYAN}┌{'─' * (term_width-2)}┐{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Fore.WHITE}{Back.BLUE}{' SQL-ish CLI Help '.center(term_width-2)}{Style.RESET_ALL}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}├{'─' * (term_width-2)}┤{Style.RESET_ALL}")
+        out.append(f"\n{box.top}")
+        out.append(f"{CYAN}│{WHITE}{BACK_BLUE}{' SQL-ish CLI Help '.center(inner_width)}{RESET}{CYAN}│{RESET}")
+        out.append(f"{box.middle}")
         
-        print(f"{Fore.CYAN}│{Fore.YELLOW} Basic Commands:{' ' * (term_width-17)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  {Fore.GREEN}exit, quit{Style.RESET_ALL}        {Fore.CYAN}Exit the CLI{' ' * (term_width-31)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  {Fore.GREEN}tables{Style.RESET_ALL}            {Fore.CYAN}List all tables in the database{' ' * (term_width-46)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  {Fore.GREEN}run <filepath>{Style.RESET_ALL}    {Fore.CYAN}Execute SQL commands from a file{' ' * (term_width-50)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  {Fore.GREEN}history{Style.RESET_ALL}           {Fore.CYAN}Show command history{' ' * (term_width-37)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  {Fore.GREEN}log [n|clear]{Style.RESET_ALL}     {Fore.CYAN}View or clear the query log{' ' * (term_width-44)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  {Fore.GREEN}clear{Style.RESET_ALL}             {Fore.CYAN}Clear the screen{' ' * (term_width-33)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  {Fore.GREEN}example [num]{Style.RESET_ALL}     {Fore.CYAN}Show or run example queries{' ' * (term_width-44)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  {Fore.GREEN}syntax [cmd]{Style.RESET_ALL}      {Fore.CYAN}Show syntax help for SQL commands{' ' * (term_width-49)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  {Fore.GREEN}help{Style.RESET_ALL}              {Fore.CYAN}Show this help message{' ' * (term_width-37)}{Fore.CYAN}│{Style.RESET_ALL}")
+        # Pad only the plain text, since ljust would count the color codes too
+        out.append(f"{CYAN}│{YELLOW}{' Basic Commands:'.ljust(inner_width)}{CYAN}│{RESET}")
+        name_width = self._HELP_COMMAND_WIDTH
+        for command, description in self._HELP_COMMANDS:
+            description = description.ljust(inner_width - 2 - name_width)
+            out.append(f"{CYAN}│{RESET}  {GREEN}{command.ljust(name_width)}{CYAN}{description}{CYAN}│{RESET}")
         
-        print(f"{Fore.CYAN}├{'─' * (term_width-2)}┤{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Fore.YELLOW} SQL Commands:{' ' * (term_width-15)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  Type {Fore.GREEN}syntax <command>{Style.RESET_ALL} for detailed help on:{' ' * (term_width-47)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  {Fore.MAGENTA}SELECT{Style.RESET_ALL}, {Fore.MAGENTA}INSERT{Style.RESET_ALL}, {Fore.MAGENTA}CREATE{Style.RESET_ALL}, {Fore.MAGENTA}UPDATE{Style.RESET_ALL}, {Fore.MAGENTA}DELETE{Style.RESET_ALL}{' ' * (term_width-44)}{Fore.CYAN}│{Style.RESET_ALL}")
+        out.append(f"{box.middle}")
+        out.append(f"{CYAN}│{YELLOW}{' SQL Commands:'.ljust(inner_width)}{CYAN}│{RESET}")
+        detail_hint = ' for detailed help on:'.ljust(inner_width - len('  Type syntax <command>'))
+        out.append(f"{CYAN}│{RESET}  Type {GREEN}syntax <command>{RESET}{detail_hint}{CYAN}│{RESET}")
+        sql_commands = ('SELECT', 'INSERT', 'CREATE', 'UPDATE', 'DELETE')
+        command_list = f"{RESET}, ".join(f"{MAGENTA}{name}" for name in sql_commands)
+        command_pad = ''.ljust(inner_width - 2 - len(', '.join(sql_commands)))
+        out.append(f"{CYAN}│{RESET}  {command_list}{RESET}{command_pad}{CYAN}│{RESET}")
         
-        print(f"{Fore.CYAN}├{'─' * (term_width-2)}┤{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Fore.YELLOW} Quick Reference:{' ' * (term_width-18)}{Fore.CYAN}│{Style.RESET_ALL}")
+        out.append(f"{box.middle}")
+        out.append(f"{CYAN}│{YELLOW}{' Quick Reference:'.ljust(inner_width)}{CYAN}│{RESET}")
         
         # Quick reference examples with proper padding
         create_ex = "CREATE TABLE users (id, name, email);"
         insert_ex = "INSERT INTO users VALUES (1, \"John\", \"john@example.com\");"
         select_ex = "SELECT * FROM users WHERE id = 1;"
         
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  {create_ex}{' ' * (term_width-len(create_ex)-4)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  {insert_ex}{' ' * (term_width-len(insert_ex)-4)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  {select_ex}{' ' * (term_width-len(select_ex)-4)}{Fore.CYAN}│{Style.RESET_ALL}")
+        for example in (create_ex, insert_ex, select_ex):
+            out.append(f"{CYAN}│{RESET}  {example.ljust(inner_width - 2)}{CYAN}│{RESET}")
         
-        print(f"{Fore.CYAN}├{'─' * (term_width-2)}┤{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Fore.YELLOW} SQL-ish Features:{' ' * (term_width-18)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  • {Fore.WHITE}Syntax error detection with {Fore.CYAN}auto-correction suggestions{' ' * (term_width-60)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  • {Fore.WHITE}Tab completion for {Fore.CYAN}SQL keywords and table names{' ' * (term_width-52)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  • {Fore.WHITE}Command history with {Fore.CYAN}Up/Down arrow navigation{' ' * (term_width-52)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  • {Fore.WHITE}Colorized output for {Fore.CYAN}better readability{' ' * (term_width-45)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  • {Fore.WHITE}Interactive examples to {Fore.CYAN}learn SQL-ish{' ' * (term_width-43)}{Fore.CYAN}│{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  • {Fore.WHITE}Query logging for {Fore.CYAN}future reference{' ' * (term_width-40)}{Fore.CYAN}│{Style.RESET_ALL}")
+        out.append(f"{box.middle}")
+        out.append(f"{CYAN}│{YELLOW}{' SQL-ish Features:'.ljust(inner_width)}{CYAN}│{RESET}")
+        for lead, highlight in self._HELP_FEATURES:
+            highlight = highlight.ljust(inner_width - len(f"  • {lead}"))
+            out.append(f"{CYAN}│{RESET}  • {WHITE}{lead}{CYAN}{highlight}{CYAN}│{RESET}")
         
-        print(f"{Fore.CYAN}├{'─' * (term_width-2)}┤{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}│{Style.RESET_ALL}  Type {Fore.GREEN}example{Style.RESET_ALL} to see and run example queries{' ' * (term_width-47)}{Fore.CYAN}│{Style.RESET_ALL}")
+        out.append(f"{box.middle}")
+        example_hint = ' to see and run example queries'.ljust(inner_width - len('  Type example'))
+        out.append(f"{CYAN}│{RESET}  Type {GREEN}example{RESET}{example_hint}{CYAN}│{RESET}")
         
-        print(f"{Fore.CYAN}└{'─' * (term_width-2)}┘{Style.RESET_ALL}")
+        out.append(f"{box.bottom}")
+        sys.stdout.write('\n'.join(out) + '\n')
+
+    def _render_log_entry(self, entry, fields):
+        """
+        Render a query log entry for display, without its number.
+        
+        Log lines don't change once written, so the rendering is cached by line.
+        
+        Args:
+            entry (str): The log line
+            fields (tuple): The parsed fields of the line, or None
+            
+        Returns:
+            str: The rendered entry, ending with a separator line
+        """
+        rendered = self._rendered_entries.get(entry)
+        if rendered is not None:
+            self._rendered_entries.move_to_end(entry)
+            return rendered
+            
+        if fields:
+            timestamp, status, duration, query = fields
+            
+            # Apply colors based on status
+            template = self._log_header_ok if 'SUCCESS' in status else self._log_header_error
+            lines = [template.format(timestamp=timestamp, status=status, duration=duration)]
+            
+            # Try to colorize the query
+            try:
+                lines.append(_colorize_sql_str(query))
+            except:
+                # Fall back to plain output if colorizing fails, wrapping
+                # long queries for better readability
+                for line in self._wrap(query, self.terminal_width-8):
+                    lines.append(f"   {CYAN}{line}{RESET}")
+        else:
+            # Just show the raw entry if parsing failed
+            lines = [entry]
+        lines.append(f"{CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{RESET}")
+        
+        rendered = '\n'.join(lines)
+        self._rendered_entries[entry] = rendered
+        if len(self._rendered_entries) > RENDERED_LOG_CACHE_SIZE:
+            self._rendered_entries.popitem(last=False)
+        return rendered
 
     def do_log(self, arg):
-        """View or clear the query log. Usage: log [n|clear]"""
+        """View, summarize or clear the query log. Usage: log [n|summary|clear]"""
         # Check if log file exists
         if not os.path.exists(QUERY_LOG_FILE):
-            print(f"{Fore.YELLOW}No query log found. Run some queries first.{Style.RESET_ALL}")
+            print(f"{YELLOW}No query log found. Run some queries first.{RESET}")
             return
 
         # Clear log if requested
         if arg and arg.lower() == 'clear':
-            confirm = input(f"{Fore.YELLOW}Are you sure you want to clear the query log? (y/n):{Style.RESET_ALL} ")
+            confirm = input(f"{YELLOW}Are you sure you want to clear the query log? (y/n):{RESET} ")
             if confirm.lower() == 'y':
                 try:
+                    # Close the log first so later queries start a new file
+                    self._close_query_log()
                     os.remove(QUERY_LOG_FILE)
-                    print(f"{Fore.GREEN}Query log cleared.{Style.RESET_ALL}")
+                    print(f"{GREEN}Query log cleared.{RESET}")
                 except Exception as e:
-                    print(f"{Fore.RED}Error clearing log: {e}{Style.RESET_ALL}")
+                    print(f"{RED}Error clearing log: {e}{RESET}")
+            return
+
+        # Count successes and errors if requested
+        if arg and arg.lower() == 'summary':
+            try:
+                succeeded, failed = _count_log_statuses(QUERY_LOG_FILE)
+                print(f"\n{CYAN}Query log summary:{RESET}")
+                print(f"- Total queries: {succeeded + failed}")
+                print(f"- Successful: {GREEN}{succeeded}{RESET}")
+                print(f"- Failed: {RED}{failed}{RESET}")
+            except Exception as e:
+                print(f"{RED}Error reading log: {e}{RESET}")
             return
 
         # Determine how many log entries to show
@@ -1109,71 +1538,37 @@ class SQLishCLI(cmd.Cmd):
             limit = int(arg)
 
         try:
-            # Read log entries (most recent first)
-            with open(QUERY_LOG_FILE, 'r') as f:
-                log_entries = f.readlines()
+            # Read and parse the end of the log, unless it hasn't changed since
+            # it was last read with at least as many entries
+            st = os.stat(QUERY_LOG_FILE)
+            cache_key = (st.st_mtime_ns, st.st_size)
+            if cache_key != self._log_cache_key or limit > self._log_cache_limit:
+                self._log_cache = [_parse_log_entry(entry) for entry in _tail_lines(QUERY_LOG_FILE, limit)]
+                self._log_cache_key = cache_key
+                self._log_cache_limit = limit
 
-            if not log_entries:
-                print(f"{Fore.YELLOW}Log file exists but is empty.{Style.RESET_ALL}")
+            if st.st_size == 0:
+                print(f"{YELLOW}Log file exists but is empty.{RESET}")
                 return
 
-            # Reverse to get most recent first and limit
-            log_entries = log_entries[::-1][:limit]
+            # Most recent first, up to the limit
+            log_entries = reversed(self._log_cache[-limit:]) if limit else []
 
             # Display log entries
             header_width = self.terminal_width - 4
-            print(f"\n{Fore.CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Style.RESET_ALL}")
-            print(f"{Fore.WHITE}{Back.BLUE} Query Log (Most Recent {limit} Entries) {Style.RESET_ALL}")
-            print(f"{Fore.CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Style.RESET_ALL}")
+            out = []
+            out.append(f"\n{CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{RESET}")
+            out.append(f"{WHITE}{BACK_BLUE} Query Log (Most Recent {limit} Entries) {RESET}")
+            out.append(f"{CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{RESET}")
 
-            import textwrap
-            for i, entry in enumerate(log_entries, 1):
-                # Parse log entry parts
-                parts = entry.strip().split('] [')
-                if len(parts) >= 3:
-                    # Extract timestamp, status, and duration
-                    timestamp = parts[0][1:]  # Remove leading '['
-                    status = parts[1]
-                    duration_and_query = parts[2].split('] ', 1)
-                    
-                    if len(duration_and_query) == 2:
-                        duration = duration_and_query[0]
-                        query = duration_and_query[1]
-                        
-                        # Apply colors based on status
-                        status_color = Fore.GREEN if 'SUCCESS' in status else Fore.RED
-                        
-                        # Display formatted log entry
-                        print(f"{Fore.CYAN}{i}.{Style.RESET_ALL} {Fore.YELLOW}[{timestamp}]{Style.RESET_ALL} {status_color}[{status}]{Style.RESET_ALL} {Fore.MAGENTA}[{duration}]{Style.RESET_ALL}")
-                        
-                        # Wrap long queries for better readability
-                        wrapped_query = textwrap.fill(query, width=self.terminal_width-8)
-                        
-                        # Try to colorize the query
-                        try:
-                            self._colorize_sql(query)
-                        except:
-                            # Fall back to plain output if colorizing fails
-                            for line in wrapped_query.split('\n'):
-                                print(f"   {Fore.CYAN}{line}{Style.RESET_ALL}")
-                        
-                        # If there's an error message, display it
-                        if 'ERROR' in entry and '\n' in entry:
-                            error_msg = entry.split('\n')[1].strip()
-                            if error_msg.startswith("    ERROR:"):
-                                error_msg = error_msg[10:]  # Remove "    ERROR: "
-                                print(f"   {Fore.RED}Error: {error_msg}{Style.RESET_ALL}")
-                        
-                        print(f"{Fore.CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Style.RESET_ALL}")
-                else:
-                    # Just print the raw entry if parsing fails
-                    print(f"{Fore.CYAN}{i}.{Style.RESET_ALL} {entry.strip()}")
-                    print(f"{Fore.CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Style.RESET_ALL}")
+            for i, (entry, fields) in enumerate(log_entries, 1):
+                out.append(f"{CYAN}{i}.{RESET} {self._render_log_entry(entry, fields)}")
 
-            print(f"{Fore.YELLOW}Tip: Type 'log <number>' to see more entries or 'log clear' to clear the log.{Style.RESET_ALL}")
+            out.append(f"{YELLOW}Tip: Type 'log <number>' to see more entries or 'log clear' to clear the log.{RESET}")
+            sys.stdout.write('\n'.join(out) + '\n')
 
         except Exception as e:
-            print(f"{Fore.RED}Error reading log: {e}{Style.RESET_ALL}")
+            print(f"{RED}Error reading log: {e}{RESET}")
 
 def parse_args():
     """Parse command line arguments."""
@@ -1211,42 +1606,31 @@ def run_cli(no_color=False, script=None, execute=None, stop_on_error=False, debu
         debug = args.debug
     
     # Handle color setup
-    if has_colors and not no_color:
-        try:
-            # Re-initialize colorama
-            init(strip=False, convert=True)
-            # Set environment variable to force color
-            os.environ['FORCE_COLOR'] = '1'
-        except:
-            pass
-    elif no_color:
-        global Fore, Back, Style
-        Fore = DummyColor()
-        Back = DummyColor()
-        Style = DummyColor()
+    if no_color:
+        _disable_colors()
     
     # Handle direct command execution mode
     if execute:
         db = Database()
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             result = db.query(execute)
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
             print(format_result(result))
-            print(f"{Fore.CYAN}Execution time: {duration:.3f}s{Style.RESET_ALL}")
+            print(f"{CYAN}Execution time: {duration:.3f}s{RESET}")
         except Exception as e:
-            print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+            print(f"{RED}Error: {e}{RESET}")
             if debug:
                 traceback.print_exc()
         return
     
     # Interactive mode (with optional script)
-    cli = SQLishCLI(init_script=script)
+    cli = SQLishCLI(init_script=script, stop_on_error=stop_on_error)
     try:
         cli.cmdloop()
     except KeyboardInterrupt:
-        print(f"\n{Fore.CYAN}Goodbye! Thanks for using SQL-ish.{Style.RESET_ALL}")
+        print(f"\n{CYAN}Goodbye! Thanks for using SQL-ish.{RESET}")
         sys.exit(0)
 
 if __name__ == '__main__':
@@ -8,6 +8,8 @@ Changes:
 - Initial implementation of CLI
 - Support for executing SQL queries from the command line
 - Result formatting and display
+- Convert result cells to strings once and format rows from one format string
+- Pad the header with ljust and join prebuilt lists
 """
 
 import sys
@@ -62,21 +64,19 @@ class CLI:
         if not columns or not rows:
             return "Empty result set"
         
-        # Calculate column widths
-        col_widths = [len(str(col)) for col in columns]
-        for row in rows:
-            for i, val in enumerate(row):
-                col_widths[i] = max(col_widths[i], len(str(val)))
+        # Convert each cell to a string once, for both the widths and the output
+        str_columns = [str(col) for col in columns]
+        str_rows = [tuple(map(str, row)) for row in rows]
+        col_widths = [max(len(col), *(len(row[i]) for row in str_rows))
+                      for i, col in enumerate(str_columns)]
         
         # Format header
-        header = " | ".join(f"{str(col):{col_widths[i]}}" for i, col in enumerate(columns))
-        separator = "-+-".join("-" * width for width in col_widths)
-        
-        # Format rows
-        formatted_rows = []
-        for row in rows:
-            formatted_row = " | ".join(f"{str(val):{col_widths[i]}}" for i, val in enumerate(row))
-            formatted_rows.append(formatted_row)
+        header = " | ".join(map(str.ljust, str_columns, col_widths))
+        separator = "-+-".join(["-" * width for width in col_widths])
+        
+        # Format rows, parsing the padding format once rather than once per cell
+        row_format = " | ".join(["{:%d}" % width for width in col_widths])
+        formatted_rows = [row_format.format(*row) for row in str_rows]
         
         # Combine all parts
         result = [header, separator] + formatted_rows
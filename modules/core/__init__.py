@@ -8,6 +8,7 @@ Changes:
 - Initial implementation of the core module
 - Expose the Table class and WHERE condition classes
 - Updated as part of package restructuring
+- Expose the Constant condition
 """
 
 from modules.core.table import Table
@@ -17,6 +18,7 @@ from modules.core.where import (
     And,
     Or,
     Not,
+    Constant,
     build_condition_function
 )
 
@@ -27,5 +29,6 @@ __all__ = [
     'And',
     'Or',
     'Not',
+    'Constant',
     'build_condition_function'
 ] 
\ No newline at end of file
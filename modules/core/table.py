@@ -11,15 +11,33 @@ Changes:
 - Updated as part of package restructuring
 - Added __bool__ method to ensure tables are always truthy, even when empty
 - Added update and delete methods for data manipulation
+- Added cached per-column value lists and mask selection for column-wise WHERE evaluation
+- Project columns by zipping the cached column lists
+- Copy the row list instead of deep copying rows, since rows are immutable tuples
+- Added cached hash indexes on columns and selection by row position
+- Set operations reuse a cached set of each table's rows and filter in C
+- Added hash_join for equality joins without building the cartesian product
+- Project rows with operator.itemgetter instead of the cached column lists
+- Added iter_select and projection so selections can be projected without an intermediate table
+- Membership tests (row in table) use the cached row set
+- Added column_numbers, caching the float conversion of columns that mix numbers and text
+- Added insert_many to validate and append a batch of rows at once
+- Documented that rows are tuples, which joins rely on to concatenate them
+- Removed select_mask and select_positions, since SELECT collects masked or indexed rows directly
 """
 
-import copy
+from functools import partial
+from itertools import filterfalse
+from operator import itemgetter
 
 class Table:
     """
     Represents a relational database table with columns and rows.
     
-    This is the core data structure in the SQL-ish implementation.
+    This is the core data structure in the SQL-ish implementation. Rows are
+    tuples, one value per column. insert, insert_many and update enforce
+    this, and code that assigns rows directly must keep it, since copies of
+    the row list share rows and joins concatenate them.
     """
     
     def __init__(self, name, columns):
@@ -32,7 +50,9 @@ class Table:
         """
         self.name = name
         self.columns = tuple(columns)  # Immutable
-        self.rows = []
+        self.rows = []  # Tuples, so copies of the list can share them
+        self._column_cache = {}  # Column value lists, indexes and the row set
+        self._cached_rows = (None, 0)  # Rows list and length the cache was built from
         
     def insert(self, values):
         """
@@ -49,9 +69,33 @@ class Table:
         self.rows.append(tuple(values))  # Immutable
         return self
     
+    def insert_many(self, rows):
+        """
+        Insert several rows into the table at once.
+        
+        Either every row is inserted or, if one has the wrong number of
+        values, none of them are.
+        
+        Args:
+            rows (iterable): Rows to insert, each with one value per column
+            
+        Returns:
+            Table: Self for method chaining
+        """
+        new_rows = list(map(tuple, rows))
+        width = len(self.columns)
+        for row in new_rows:
+            if len(row) != width:
+                raise ValueError(f"Expected {width} values, got {len(row)}")
+        self.rows.extend(new_rows)
+        return self
+    
     def clone(self, name=None):
         """
-        Create a deep copy of this table with optional new name.
+        Create a copy of this table with optional new name.
+        
+        Rows are tuples, which insert() enforces, so the copy shares them
+        and only the list of rows is copied.
         
         Args:
             name (str, optional): New name for the cloned table
@@ -60,7 +104,7 @@ class Table:
             Table: A new table with the same schema and data
         """
         new_table = Table(name or self.name, self.columns)
-        new_table.rows = copy.deepcopy(self.rows)
+        new_table.rows = list(self.rows)
         return new_table
     
     def select(self, condition_func=None):
@@ -77,7 +121,7 @@ class Table:
         
         if condition_func is None:
             # Select all rows if no condition given
-            result.rows = copy.deepcopy(self.rows)
+            result.rows = list(self.rows)
         else:
             # Select rows that match the condition
             for row in self.rows:
@@ -86,6 +130,117 @@ class Table:
                     
         return result
     
+    def _column_cache_for_rows(self):
+        """
+        Get the cache of column lists and indexes for the current rows.
+        
+        Returns:
+            dict: The cache, emptied first if rows were added, removed or updated
+        """
+        rows = self.rows
+        if self._cached_rows[0] is not rows or self._cached_rows[1] != len(rows):
+            self._column_cache = {}
+            self._cached_rows = (rows, len(rows))
+        return self._column_cache
+    
+    def _row_set(self):
+        """
+        Get the set of rows, cached like column_values for repeated set operations.
+        
+        Returns:
+            frozenset: The distinct rows
+        """
+        cache = self._column_cache_for_rows()
+        if 'rows' not in cache:
+            cache['rows'] = frozenset(self.rows)
+        return cache['rows']
+    
+    def column_values(self, column, numeric=False):
+        """
+        Get the values of one column, in row order.
+        
+        The lists are cached until rows are added, removed or updated, so
+        repeated scans of a column reuse them. They must not be modified.
+        
+        Args:
+            column (str): Column name
+            numeric (bool): Whether to convert the values to float
+            
+        Returns:
+            list: The values, or None if numeric and some value is not a number
+        """
+        cache = self._column_cache_for_rows()
+        key = ('values', column, numeric)
+        if key not in cache:
+            if numeric:
+                try:
+                    values = list(map(float, self.column_values(column)))
+                except (ValueError, TypeError):
+                    values = None
+            else:
+                values = list(map(itemgetter(self.columns.index(column)), self.rows))
+            cache[key] = values
+        return cache[key]
+    
+    def column_numbers(self, column):
+        """
+        Get the values of one column converted to float, in row order.
+        
+        Values that are not numbers are converted once per cache, rather
+        than every time a condition compares them.
+        
+        Args:
+            column (str): Column name
+            
+        Returns:
+            list: The converted values, with None for values that are not numbers
+        """
+        numbers = self.column_values(column, numeric=True)
+        if numbers is not None:
+            return numbers
+        
+        cache = self._column_cache_for_rows()
+        key = ('numbers', column)
+        if key not in cache:
+            numbers = []
+            for value in self.column_values(column):
+                try:
+                    numbers.append(float(value))
+                except (ValueError, TypeError):
+                    numbers.append(None)
+            cache[key] = numbers
+        return cache[key]
+    
+    def column_index(self, column, numeric=False):
+        """
+        Get a hash index from the values of one column to their row positions.
+        
+        Indexes are built on first use and cached like column_values.
+        
+        Args:
+            column (str): Column name
+            numeric (bool): Whether to key the index on the values converted
+                to float, leaving out values that are not numbers
+            
+        Returns:
+            dict: Ascending row positions by value
+        """
+        cache = self._column_cache_for_rows()
+        key = ('index', column, numeric)
+        if key not in cache:
+            values = self.column_numbers(column) if numeric else self.column_values(column)
+            index = {}
+            for i, value in enumerate(values):
+                positions = index.get(value)
+                if positions is None:
+                    index[value] = [i]
+                else:
+                    positions.append(i)
+            if numeric:
+                index.pop(None, None)
+            cache[key] = index
+        return cache[key]
+    
     def project(self, *proj_columns):
         """
         Project specific columns from the table.
@@ -101,16 +256,51 @@ class Table:
             
         # Create a new table with the projected columns
         result = Table(self.name, proj_columns)
+        result.rows = list(self.projection(proj_columns)(self.rows))
+        return result
+    
+    def projection(self, proj_columns):
+        """
+        Get a function that projects rows of this table onto some columns.
+        
+        Columns the table doesn't have are left out of the projected rows.
         
+        Args:
+            proj_columns (list): Names of columns to include
+            
+        Returns:
+            callable: Takes an iterable of rows and returns an iterator of projected rows
+        """
         # Create a mapping from original column indices to new column indices
         indices = [self.columns.index(col) for col in proj_columns if col in self.columns]
         
-        # Project only the specified columns
-        for row in self.rows:
-            new_row = tuple(row[i] for i in indices)
-            result.rows.append(new_row)
+        # Project only the specified columns, with the loop over rows running in C
+        if len(indices) > 1:
+            return partial(map, itemgetter(*indices))
+        if indices:
+            # A single index gives bare values, so zip them back into 1-tuples
+            getter = itemgetter(indices[0])
+            return lambda rows: zip(map(getter, rows))
+        return lambda rows: (() for _ in rows)
+    
+    def iter_select(self, condition_func=None, proj_columns=None):
+        """
+        Iterate over the rows that match a condition, without building a table.
+        
+        Args:
+            condition_func: Function that takes (row, columns) and returns bool
+            proj_columns (list, optional): Names of columns to project the rows onto
             
-        return result
+        Returns:
+            iterator: The matching rows, projected if columns were given
+        """
+        rows = self.rows
+        if condition_func is not None:
+            columns = self.columns
+            rows = (row for row in rows if condition_func(row, columns))
+        if proj_columns:
+            return self.projection(proj_columns)(rows)
+        return iter(rows)
     
     def update(self, updates, condition_func=None):
         """
@@ -131,8 +321,9 @@ class Table:
         # Get column indices for updates
         col_indices = {col: self.columns.index(col) for col in updates}
         
-        # Count updated rows
+        # Count updated rows, and drop cached columns as rows are replaced in place
         count = 0
+        self._cached_rows = (None, 0)
         
         # Update matching rows
         for i, row in enumerate(self.rows):
@@ -193,10 +384,7 @@ class Table:
         result = self.clone(f"{self.name}_union_{other.name}")
         
         # Add rows from other table, avoiding duplicates
-        existing_rows = set(self.rows)
-        for row in other.rows:
-            if row not in existing_rows:
-                result.rows.append(row)
+        result.rows.extend(filterfalse(self._row_set().__contains__, other.rows))
                 
         return result
     
@@ -218,10 +406,7 @@ class Table:
         result = Table(f"{self.name}_intersect_{other.name}", self.columns)
         
         # Add rows that exist in both tables
-        other_rows = set(other.rows)
-        for row in self.rows:
-            if row in other_rows:
-                result.rows.append(row)
+        result.rows = list(filter(other._row_set().__contains__, self.rows))
                 
         return result
     
@@ -243,10 +428,7 @@ class Table:
         result = Table(f"{self.name}_diff_{other.name}", self.columns)
         
         # Add rows that exist in this table but not in the other
-        other_rows = set(other.rows)
-        for row in self.rows:
-            if row not in other_rows:
-                result.rows.append(row)
+        result.rows = list(filterfalse(other._row_set().__contains__, self.rows))
                 
         return result
     
@@ -260,7 +442,70 @@ class Table:
         Returns:
             Table: A new table with combined columns and all combinations of rows
         """
-        # Create column names for the product table, avoiding duplicates
+        # Create a new table for the product
+        result = Table(f"{self.name}_product_{other.name}", self._product_columns(other))
+        
+        # Generate all combinations of rows
+        for row1 in self.rows:
+            for row2 in other.rows:
+                result.rows.append(row1 + row2)
+                
+        return result
+    
+    def hash_join(self, other, left_column, right_column):
+        """
+        Combinations of rows from two tables whose join columns are equal.
+        
+        The result is the cartesian product filtered on the two columns being
+        equal, but the rows of the smaller table are hashed by their join
+        value instead of pairing every row with every other row.
+        
+        Args:
+            other (Table): Another table
+            left_column (str): Column of this table to join on
+            right_column (str): Column of the other table to join on
+            
+        Returns:
+            Table: A new table with the columns of both tables and the matching rows
+        """
+        if left_column not in self.columns:
+            raise ValueError(f"Join column '{left_column}' not found in left table")
+        if right_column not in other.columns:
+            raise ValueError(f"Join column '{right_column}' not found in right table")
+        left_idx = self.columns.index(left_column)
+        right_idx = other.columns.index(right_column)
+        
+        if len(self.rows) <= len(other.rows):
+            # Hash this table, then collect its rows' matches in the other table's order
+            positions = {}
+            for i, row in enumerate(self.rows):
+                positions.setdefault(row[left_idx], []).append(i)
+            matches = [[] for _ in self.rows]
+            for row in other.rows:
+                for i in positions.get(row[right_idx], ()):
+                    matches[i].append(row)
+        else:
+            other_rows = {}
+            for row in other.rows:
+                other_rows.setdefault(row[right_idx], []).append(row)
+            matches = [other_rows.get(row[left_idx], ()) for row in self.rows]
+        
+        # Same row order as the cartesian product
+        result = Table(f"{self.name}_join_{other.name}", self._product_columns(other))
+        result.rows = [row1 + row2 for row1, rows2 in zip(self.rows, matches) for row2 in rows2]
+        return result
+    
+    def _product_columns(self, other):
+        """
+        Column names for rows combining this table and another.
+        
+        Args:
+            other (Table): The other table
+            
+        Returns:
+            list: Columns of both tables, with the other table's duplicates
+                prefixed by its name
+        """
         duplicate_cols = set(self.columns) & set(other.columns)
         all_columns = list(self.columns)
         
@@ -270,16 +515,7 @@ class Table:
             else:
                 new_col = col
             all_columns.append(new_col)
-            
-        # Create a new table for the product
-        result = Table(f"{self.name}_product_{other.name}", all_columns)
-        
-        # Generate all combinations of rows
-        for row1 in self.rows:
-            for row2 in other.rows:
-                result.rows.append(row1 + row2)
-                
-        return result
+        return all_columns
     
     def __str__(self):
         """Return a string representation of the table."""
@@ -297,6 +533,18 @@ class Table:
         """Return the number of rows in the table."""
         return len(self.rows)
     
+    def __contains__(self, row):
+        """
+        Check whether the table has a row, using the cached row set.
+        
+        Args:
+            row (tuple): The row to look for
+            
+        Returns:
+            bool: True if the row is in the table
+        """
+        return row in self._row_set()
+    
     def __bool__(self):
         """
         Truth value testing for Table objects.
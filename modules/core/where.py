@@ -9,8 +9,66 @@ Changes:
 - Support for AND, OR, NOT logical operators
 - Support for =, <, >, <=, >=, != comparison operators
 - Updated as part of package restructuring
+- Added structural keys so equivalent conditions can share memoized results
+- Compile condition trees into a single Python expression for faster row filtering
+- Bind comparisons to their column index, operator and numeric literal once per schema
+- Added column-wise evaluation of conditions into row masks
+- Look up equality conditions in hash indexes instead of scanning rows
+- Fold conditions on missing columns and order cheaper AND/OR terms first before compiling
+- Specialize each comparison's per-row check for its operator when it is bound
+- Vectorize numeric comparisons on columns mixing numbers and text, converting each column once
 """
 
+import operator
+from itertools import repeat
+
+# Comparison operators as functions, and as Python source for compiled conditions
+_OPERATORS = {
+    '=': operator.eq,
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+    '!=': operator.ne,
+}
+_SOURCE_OPERATORS = {'=': '==', '<': '<', '>': '>', '<=': '<=', '>=': '>=', '!=': '!='}
+
+def _build_checks(symbol):
+    """
+    Build the per-row check factories for one comparison operator.
+    
+    The operator is written into the generated source, so a check runs a
+    comparison instruction rather than calling an operator function.
+    
+    Args:
+        symbol (str): The Python comparison operator, e.g. '<='
+        
+    Returns:
+        tuple: (numeric, plain) factories. numeric(number, value) compares
+            row values that convert to float numerically and the others with
+            the literal as written, like Comparison.evaluate does.
+            plain(value) always compares with the literal as written.
+    """
+    namespace = {}
+    exec(f"""
+def numeric(number, value):
+    def check(row_value):
+        try:
+            row_number = float(row_value)
+        except (ValueError, TypeError):
+            return row_value {symbol} value
+        return row_number {symbol} number
+    return check
+
+def plain(value):
+    return lambda row_value: row_value {symbol} value
+""", namespace)
+    return namespace['numeric'], namespace['plain']
+
+# Check factories for each comparison operator, see _build_checks
+_CHECKS = {op: _build_checks(symbol) for op, symbol in _SOURCE_OPERATORS.items()}
+
+
 class Condition:
     """Base class for all condition types."""
     def evaluate(self, row, columns):
@@ -25,6 +83,105 @@ class Condition:
             bool: True if condition is satisfied, False otherwise
         """
         raise NotImplementedError("Subclasses must implement evaluate()")
+    
+    def bind(self, columns):
+        """
+        Resolve column lookups once for rows with the given columns.
+        
+        Args:
+            columns (tuple): The column names
+            
+        Returns:
+            Condition: Self for method chaining
+        """
+        raise NotImplementedError("Subclasses must implement bind()")
+    
+    def vectorize(self, table):
+        """
+        Evaluate the condition for all rows of a table at once, a column at a time.
+        
+        Only conditions that can't raise for any row are evaluated this way,
+        so the result always matches evaluating the rows one by one.
+        
+        Args:
+            table (Table): The table whose rows to evaluate
+            
+        Returns:
+            list: One bool per row, or None if the condition must be evaluated per row
+        """
+        raise NotImplementedError("Subclasses must implement vectorize()")
+    
+    def lookup(self, table):
+        """
+        Find the rows satisfying the condition through hash indexes on a table.
+        
+        Only equality comparisons, alone or joined by AND, can be looked up.
+        
+        Args:
+            table (Table): The table whose rows to find
+            
+        Returns:
+            list: Ascending positions of the matching rows, or None if the
+                condition can't be looked up
+        """
+        raise NotImplementedError("Subclasses must implement lookup()")
+    
+    def compile(self, columns, constants):
+        """
+        Compile the condition into a Python expression over a row named row.
+        
+        Args:
+            columns (tuple): The column names, used to resolve column indices
+            constants (dict): Names used by the expression, filled in by this call
+            
+        Returns:
+            str: Expression that is True when the condition is satisfied
+        """
+        raise NotImplementedError("Subclasses must implement compile()")
+    
+    def simplify(self, columns):
+        """
+        Fold the parts of the condition whose result is known for the given columns.
+        
+        Comparisons on missing columns are always false, and fold into the
+        logical operators around them. Children of AND and OR that can't raise
+        are put in order of cost, so the cheaper one short-circuits the other.
+        The condition itself is left unchanged.
+        
+        Args:
+            columns (tuple): The column names
+            
+        Returns:
+            Condition: A condition selecting the same rows, with the same errors
+        """
+        raise NotImplementedError("Subclasses must implement simplify()")
+    
+    def cost(self):
+        """
+        Estimate the relative cost of evaluating the condition for a row.
+        
+        Returns:
+            int: Higher for conditions that take longer to evaluate
+        """
+        raise NotImplementedError("Subclasses must implement cost()")
+    
+    def can_raise(self):
+        """
+        Check whether evaluating the condition might raise for some row.
+        
+        Returns:
+            bool: False if the condition evaluates for any row without errors
+        """
+        raise NotImplementedError("Subclasses must implement can_raise()")
+    
+    def key(self):
+        """
+        Get a hashable key describing the structure of the condition.
+        
+        Returns:
+            tuple: Equal for conditions that select the same rows by construction
+        """
+        raise NotImplementedError("Subclasses must implement key()")
 
 
 class Comparison(Condition):
@@ -44,6 +201,37 @@ class Comparison(Condition):
         self.column = column
         self.operator = operator
         self.value = value
+        self._columns = None  # Columns the comparison was last bound to
+        
+    def bind(self, columns):
+        """
+        Resolve the column index, operator and numeric literal for some columns.
+        
+        evaluate() binds the comparison again whenever it is given other
+        columns, so this only needs to be called after changing its fields.
+        
+        Args:
+            columns (tuple): The column names
+            
+        Returns:
+            Comparison: Self for method chaining
+        """
+        self._columns = columns
+        self._col_idx = columns.index(self.column) if self.column in columns else None
+        self._op = _OPERATORS.get(self.operator)
+        try:
+            self._number = float(self.value)
+        except (ValueError, TypeError):
+            self._number = None  # Rows are always compared with the literal as written
+        
+        # Specialize the per-row check for the operator and the literal
+        if self._op is None:
+            self._check = None
+        elif self._number is None:
+            self._check = _CHECKS[self.operator][1](self.value)
+        else:
+            self._check = _CHECKS[self.operator][0](self._number, self.value)
+        return self
         
     def evaluate(self, row, columns):
         """
@@ -56,47 +244,88 @@ class Comparison(Condition):
         Returns:
             bool: True if comparison is satisfied, False otherwise
         """
-        if self.column not in columns:
+        if columns is not self._columns:
+            self.bind(columns)
+        if self._col_idx is None or self._check is None:
             return False
         
-        col_idx = columns.index(self.column)
-        row_value = row[col_idx]
+        # All values are stored as strings, so the check converts if comparing numerically
+        return self._check(row[self._col_idx])
         
-        # All values are stored as strings, so convert if comparing numerically
-        try:
-            # Try to convert both to float for numeric comparison
-            row_val_numeric = float(row_value)
-            comp_val_numeric = float(self.value)
+    def vectorize(self, table):
+        """Evaluate the comparison for all rows of a table, see Condition.vectorize."""
+        self.bind(table.columns)
+        if self._col_idx is None or self._op is None:
+            return [False] * len(table.rows)
+        
+        if self._number is not None:
+            numbers = table.column_values(self.column, numeric=True)
+            if numbers is not None:
+                return list(map(self._op, numbers, repeat(self._number)))
             
-            # Use numeric comparison
-            if self.operator == '=':
-                return row_val_numeric == comp_val_numeric
-            elif self.operator == '<':
-                return row_val_numeric < comp_val_numeric
-            elif self.operator == '>':
-                return row_val_numeric > comp_val_numeric
-            elif self.operator == '<=':
-                return row_val_numeric <= comp_val_numeric
-            elif self.operator == '>=':
-                return row_val_numeric >= comp_val_numeric
-            elif self.operator == '!=':
-                return row_val_numeric != comp_val_numeric
+            # Values that are not numbers are compared as written, like evaluate does
+            op, number, value = self._op, self._number, self.value
+            try:
+                return [op(row_value, value) if row_number is None else op(row_number, number)
+                        for row_number, row_value in zip(table.column_numbers(self.column),
+                                                         table.column_values(self.column))]
+            except TypeError:
+                return None  # Per row, only some of them might reach the comparison
+        
+        # Compared as written, which only raises when ordering mixed types
+        try:
+            return list(map(self._op, table.column_values(self.column), repeat(self.value)))
+        except TypeError:
+            return None  # Per row, only some of them might reach the comparison
+        
+    def lookup(self, table):
+        """Find the rows satisfying the comparison, see Condition.lookup."""
+        if self.operator != '=':
+            return None
+        self.bind(table.columns)
+        if self._col_idx is None:
+            return []
+        
+        # Values that aren't numbers never equal a numeric literal
+        if self._number is not None:
+            return table.column_index(self.column, numeric=True).get(self._number, [])
+        return table.column_index(self.column).get(self.value, [])
+        
+    def compile(self, columns, constants):
+        """Compile the comparison into a Python expression over a row named row."""
+        self.bind(columns)
+        if self._col_idx is None or self._op is None:
+            return 'False'
+        name = f"_c{len(constants)}"
+        
+        if self._number is None:
+            # Never numeric, so rows are always compared as written
+            constants[name] = self.value
+            return f"(row[{self._col_idx}] {_SOURCE_OPERATORS[self.operator]} {name})"
+        constants[name] = self._check
+        return f"{name}(row[{self._col_idx}])"
+        
+    def simplify(self, columns):
+        """Fold the comparison for the given columns, see Condition.simplify."""
+        if self.column not in columns or self.operator not in _OPERATORS:
+            return Constant(False)
+        return self
+        
+    def cost(self):
+        """Estimate the cost of the comparison, see Condition.cost."""
+        try:
+            float(self.value)
         except (ValueError, TypeError):
-            # Fall back to string comparison
-            if self.operator == '=':
-                return row_value == self.value
-            elif self.operator == '<':
-                return row_value < self.value
-            elif self.operator == '>':
-                return row_value > self.value
-            elif self.operator == '<=':
-                return row_value <= self.value
-            elif self.operator == '>=':
-                return row_value >= self.value
-            elif self.operator == '!=':
-                return row_value != self.value
-                
-        return False
+            return 1  # Compared inline when compiled
+        return 2
+        
+    def can_raise(self):
+        """Only ordering values of mixed types can raise, see Condition.can_raise."""
+        return self.operator not in ('=', '!=')
+        
+    def key(self):
+        """Get a hashable key describing the structure of the condition."""
+        return ('cmp', self.column, self.operator, self.value)
 
 
 class And(Condition):
@@ -130,6 +359,56 @@ class And(Condition):
         """
         # Logical AND (∧) - both conditions must be true
         return self.left.evaluate(row, columns) and self.right.evaluate(row, columns)
+        
+    def bind(self, columns):
+        """Bind both conditions to the given columns, see Comparison.bind."""
+        self.left.bind(columns)
+        self.right.bind(columns)
+        return self
+        
+    def vectorize(self, table):
+        """Evaluate the AND condition for all rows of a table, see Condition.vectorize."""
+        left = self.left.vectorize(table)
+        right = self.right.vectorize(table) if left is not None else None
+        if right is None:
+            return None
+        return list(map(operator.and_, left, right))
+        
+    def lookup(self, table):
+        """Find the rows satisfying the AND condition, see Condition.lookup."""
+        left = self.left.lookup(table)
+        right = self.right.lookup(table) if left is not None else None
+        if right is None:
+            return None
+        return sorted(set(left).intersection(right))
+        
+    def compile(self, columns, constants):
+        """Compile the AND condition into a Python expression over a row named row."""
+        return f"({self.left.compile(columns, constants)} and {self.right.compile(columns, constants)})"
+        
+    def simplify(self, columns):
+        """Fold the AND condition for the given columns, see Condition.simplify."""
+        left = self.left.simplify(columns)
+        right = self.right.simplify(columns)
+        if isinstance(left, Constant):
+            return right if left.value else left
+        if isinstance(right, Constant) and (right.value or not left.can_raise()):
+            return left if right.value else right
+        if right.cost() < left.cost() and not (left.can_raise() or right.can_raise()):
+            left, right = right, left
+        return And(left, right)
+        
+    def cost(self):
+        """Estimate the cost of the AND condition, see Condition.cost."""
+        return self.left.cost() + self.right.cost() + 1
+        
+    def can_raise(self):
+        """Check whether either condition can raise, see Condition.can_raise."""
+        return self.left.can_raise() or self.right.can_raise()
+        
+    def key(self):
+        """Get a hashable key describing the structure of the condition."""
+        return ('and', self.left.key(), self.right.key())
 
 
 class Or(Condition):
@@ -163,6 +442,52 @@ class Or(Condition):
         """
         # Logical OR (∨) - at least one condition must be true
         return self.left.evaluate(row, columns) or self.right.evaluate(row, columns)
+        
+    def bind(self, columns):
+        """Bind both conditions to the given columns, see Comparison.bind."""
+        self.left.bind(columns)
+        self.right.bind(columns)
+        return self
+        
+    def vectorize(self, table):
+        """Evaluate the OR condition for all rows of a table, see Condition.vectorize."""
+        left = self.left.vectorize(table)
+        right = self.right.vectorize(table) if left is not None else None
+        if right is None:
+            return None
+        return list(map(operator.or_, left, right))
+        
+    def lookup(self, table):
+        """OR conditions are not looked up, see Condition.lookup."""
+        return None
+        
+    def compile(self, columns, constants):
+        """Compile the OR condition into a Python expression over a row named row."""
+        return f"({self.left.compile(columns, constants)} or {self.right.compile(columns, constants)})"
+        
+    def simplify(self, columns):
+        """Fold the OR condition for the given columns, see Condition.simplify."""
+        left = self.left.simplify(columns)
+        right = self.right.simplify(columns)
+        if isinstance(left, Constant):
+            return left if left.value else right
+        if isinstance(right, Constant) and (not right.value or not left.can_raise()):
+            return right if right.value else left
+        if right.cost() < left.cost() and not (left.can_raise() or right.can_raise()):
+            left, right = right, left
+        return Or(left, right)
+        
+    def cost(self):
+        """Estimate the cost of the OR condition, see Condition.cost."""
+        return self.left.cost() + self.right.cost() + 1
+        
+    def can_raise(self):
+        """Check whether either condition can raise, see Condition.can_raise."""
+        return self.left.can_raise() or self.right.can_raise()
+        
+    def key(self):
+        """Get a hashable key describing the structure of the condition."""
+        return ('or', self.left.key(), self.right.key())
 
 
 class Not(Condition):
@@ -194,19 +519,125 @@ class Not(Condition):
         """
         # Logical NOT (¬) - negation of the condition
         return not self.condition.evaluate(row, columns)
+        
+    def bind(self, columns):
+        """Bind the negated condition to the given columns, see Comparison.bind."""
+        self.condition.bind(columns)
+        return self
+        
+    def vectorize(self, table):
+        """Evaluate the NOT condition for all rows of a table, see Condition.vectorize."""
+        mask = self.condition.vectorize(table)
+        if mask is None:
+            return None
+        return list(map(operator.not_, mask))
+        
+    def lookup(self, table):
+        """NOT conditions are not looked up, see Condition.lookup."""
+        return None
+        
+    def compile(self, columns, constants):
+        """Compile the NOT condition into a Python expression over a row named row."""
+        return f"(not {self.condition.compile(columns, constants)})"
+        
+    def simplify(self, columns):
+        """Fold the NOT condition for the given columns, see Condition.simplify."""
+        condition = self.condition.simplify(columns)
+        if isinstance(condition, Constant):
+            return Constant(not condition.value)
+        if isinstance(condition, Not):
+            return condition.condition
+        return Not(condition)
+        
+    def cost(self):
+        """Estimate the cost of the NOT condition, see Condition.cost."""
+        return self.condition.cost() + 1
+        
+    def can_raise(self):
+        """Check whether the negated condition can raise, see Condition.can_raise."""
+        return self.condition.can_raise()
+        
+    def key(self):
+        """Get a hashable key describing the structure of the condition."""
+        return ('not', self.condition.key())
 
 
-def build_condition_function(condition):
+class Constant(Condition):
+    """
+    Represents a condition that is always true or always false.
+    e.g., a comparison on a column the table doesn't have
+    
+    In set theory, this is either the universal set or the empty set.
+    """
+    def __init__(self, value):
+        """
+        Initialize a constant condition.
+        
+        Args:
+            value (bool): The result of the condition for every row
+        """
+        self.value = bool(value)
+        
+    def evaluate(self, row, columns):
+        """Evaluate the constant condition, which ignores the row."""
+        return self.value
+        
+    def bind(self, columns):
+        """Constant conditions have nothing to bind, see Condition.bind."""
+        return self
+        
+    def vectorize(self, table):
+        """Evaluate the constant for all rows of a table, see Condition.vectorize."""
+        return [self.value] * len(table.rows)
+        
+    def lookup(self, table):
+        """Find the rows satisfying the constant, see Condition.lookup."""
+        return list(range(len(table.rows))) if self.value else []
+        
+    def compile(self, columns, constants):
+        """Compile the constant into a Python expression."""
+        return repr(self.value)
+        
+    def simplify(self, columns):
+        """Constants are already as simple as they get, see Condition.simplify."""
+        return self
+        
+    def cost(self):
+        """Constants cost nothing to evaluate, see Condition.cost."""
+        return 0
+        
+    def can_raise(self):
+        """Constants never raise, see Condition.can_raise."""
+        return False
+        
+    def key(self):
+        """Get a hashable key describing the structure of the condition."""
+        return ('const', self.value)
+
+
+def build_condition_function(condition, columns=None):
     """
     Build a function that evaluates a condition for a row.
     
+    When the columns are given, the condition tree is simplified for them and
+    compiled once into a single expression with the column indices already
+    resolved, so rows are checked without walking the tree. The compiled function only works for
+    rows with those columns.
+    
     Args:
         condition (Condition): The condition to evaluate
+        columns (tuple, optional): Column names of the rows to be checked
         
     Returns:
         callable: Function that takes (row, columns) and returns bool
     """
+    if columns is not None:
+        columns = tuple(columns)
+        constants = {}
+        source = condition.simplify(columns).compile(columns, constants)
+        return eval(f"lambda row, columns: {source}", constants)
+    
     def condition_func(row, columns):
         return condition.evaluate(row, columns)
     
-    return condition_func 
\ No newline at end of file
+    return condition_func
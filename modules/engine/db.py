@@ -14,13 +14,29 @@ Changes:
 - Removed debug print statements after resolving issues
 - Standardized error handling and table validation
 - Improved query method to handle more SQL operations
+- Split query execution from parsing and added query_prepared for templates
+- Added an optional per-script memo so repeated SELECTs reuse earlier results
+- Bounded the template cache as an LRU and flush it on schema changes
+- Pass the table columns when building WHERE functions so conditions are compiled
+- Evaluate SELECT conditions a column at a time when they can't raise for any row
+- Answer SELECTs on equality conditions from hash indexes
+- Cache parsed queries by query string and compiled WHERE functions by structure
+- Project SELECT rows while collecting them, without an intermediate table
+- Added prepare and execute_prepared for named query templates
+- Check for missing tables with "is None" rather than relying on Table.__bool__
 """
 
+from collections import OrderedDict
+from itertools import compress
+
 from modules.core.table import Table
 from modules.core.where import build_condition_function
-from modules.parser.parser import parse_query
+from modules.parser.parser import parse_query, parse_value, bind_parameters, PLACEHOLDER
 from modules.engine.join import inner_join, left_join, right_join, full_join
 
+# Maximum number of parsed query templates kept by a database
+MAX_TEMPLATES = 1000
+
 class Database:
     """
     Represents a simple in-memory relational database.
@@ -31,6 +47,10 @@ class Database:
     def __init__(self):
         """Initialize an empty database."""
         self.tables = {}  # Dictionary of tables by name
+        self._templates = OrderedDict()  # Parsed query templates (LRU), or None if not bindable
+        self._plans = OrderedDict()  # Parsed queries by query string (LRU)
+        self._condition_funcs = OrderedDict()  # Compiled WHERE functions by condition and columns (LRU)
+        self._prepared = {}  # Query templates by statement name, see prepare
         
     def create_table(self, name, columns):
         """
@@ -48,6 +68,7 @@ class Database:
             
         table = Table(name, columns)
         self.tables[name] = table
+        self._templates.clear()  # Schema changed
         return table
         
     def drop_table(self, name):
@@ -62,6 +83,7 @@ class Database:
         """
         if name in self.tables:
             del self.tables[name]
+            self._templates.clear()  # Schema changed
             return True
         return False
         
@@ -100,82 +122,257 @@ class Database:
             ValueError: If the table doesn't exist
         """
         table = self.get_table(table_name)
-        if not table:
+        if table is None:
             raise ValueError(f"Table '{table_name}' does not exist")
         return table
         
-    def query(self, sql_query):
+    def query(self, sql_query, memo=None):
         """
         Execute a SQL-ish query.
         
         Args:
             sql_query (str): SQL query to execute
+            memo (dict, optional): Memo shared by a run of statements, see _memoized
             
         Returns:
             Various: Result depends on the query type
         """
         try:
-            query_type, parsed_data = parse_query(sql_query)
-            
-            if query_type == 'CREATE':
-                table_name, columns = parsed_data
-                self.create_table(table_name, columns)
-                return "Table created successfully"
-                
-            elif query_type == 'INSERT':
-                table_name, values = parsed_data
-                table = self._validate_table_exists(table_name)
-                table.insert(values)
-                return "Row inserted successfully"
-                
-            elif query_type == 'SELECT':
-                table_name, columns, condition = parsed_data
-                table = self._validate_table_exists(table_name)
-                
-                # Apply WHERE clause if present
-                if condition:
-                    condition_func = build_condition_function(condition)
-                    result = table.select(condition_func)
-                else:
-                    result = table.select()
-                
-                # Apply projection if columns specified
-                if columns:
-                    result = result.project(*columns)
-                
-                return result
-            
-            elif query_type == 'DELETE':
-                table_name, condition = parsed_data
-                table = self._validate_table_exists(table_name)
-                
-                # Apply WHERE clause if present
-                if condition:
-                    condition_func = build_condition_function(condition)
-                    count = table.delete(condition_func)
-                else:
-                    count = table.delete()
-                
-                return f"{count} row(s) deleted"
-            
-            elif query_type == 'UPDATE':
-                table_name, updates, condition = parsed_data
-                table = self._validate_table_exists(table_name)
-                
-                # Apply WHERE clause if present
-                if condition:
-                    condition_func = build_condition_function(condition)
-                    count = table.update(updates, condition_func)
-                else:
-                    count = table.update(updates)
-                
-                return f"{count} row(s) updated"
-                
-            else:
-                raise ValueError(f"Unsupported query type: {query_type}")
-                
+            query_type, parsed_data = self._plan(sql_query)
+            return self._memoized(query_type, parsed_data, memo)
         except Exception as e:
             raise ValueError(f"Error executing query: {e}")
+    
+    def _plan(self, sql_query):
+        """
+        Parse a query, reusing the result for a query string seen before.
+        
+        The most recently used MAX_TEMPLATES parsed queries are kept. Parsing
+        doesn't depend on the schema, so they stay valid when tables change.
+        
+        Args:
+            sql_query (str): SQL query to parse
+            
+        Returns:
+            tuple: (query_type, parsed_data) as returned by parse_query
+        """
+        key = sql_query.strip()
+        plans = self._plans
+        plan = plans.get(key)
+        if plan is not None:
+            plans.move_to_end(key)
+            return plan
+        
+        plan = plans[key] = parse_query(key)
+        if len(plans) > MAX_TEMPLATES:
+            plans.popitem(last=False)
+        return plan
+    
+    def _condition_function(self, condition, table):
+        """
+        Build the row function for a WHERE condition on a table.
+        
+        Compiled functions are kept by condition structure and columns, so
+        a repeated query doesn't compile its condition again.
+        
+        Args:
+            condition (Condition): The condition to evaluate
+            table (Table): The table whose rows will be checked
+            
+        Returns:
+            callable: Function that takes (row, columns) and returns bool
+        """
+        key = (condition.key(), table.columns)
+        funcs = self._condition_funcs
+        func = funcs.get(key)
+        if func is not None:
+            funcs.move_to_end(key)
+            return func
+        
+        func = funcs[key] = build_condition_function(condition, table.columns)
+        if len(funcs) > MAX_TEMPLATES:
+            funcs.popitem(last=False)
+        return func
+    
+    def query_prepared(self, template, params, memo=None):
+        """
+        Execute a query given as a template and its literal values.
+        
+        The template is the query with each literal replaced by "?", and
+        params are the literals as written (quotes included), in order.
+        Templates are parsed once and reused, so repeated queries that only
+        differ in their literals skip the parser. The most recently used
+        MAX_TEMPLATES templates are kept, and creating or dropping a table
+        clears them. Templates whose "?" slots are not all values (e.g. a
+        literal in a column list) fall back to a normal query.
+        
+        Args:
+            template (str): Query with literals replaced by "?"
+            params (list): Literal strings, in order of appearance
+            memo (dict, optional): Memo shared by a run of statements, see _memoized
+            
+        Returns:
+            Various: Result depends on the query type
+        """
+        templates = self._templates
+        if template in templates:
+            templates.move_to_end(template)
+        else:
+            try:
+                templates[template] = parse_query(template)
+            except Exception:
+                templates[template] = None
+            if len(templates) > MAX_TEMPLATES:
+                templates.popitem(last=False)
+        
+        plan = templates[template]
+        if plan is not None:
+            query_type, parsed_data = plan
+            bound, count = bind_parameters(query_type, parsed_data,
+                                           [parse_value(p) for p in params])
+            if count == len(params):
+                try:
+                    return self._memoized(query_type, bound, memo)
+                except Exception as e:
+                    raise ValueError(f"Error executing query: {e}")
+            self._templates[template] = None
+        
+        # Not bindable: rebuild the original query and run it normally
+        pieces = template.split(PLACEHOLDER)
+        query = pieces[0] + ''.join(p + piece for p, piece in zip(params, pieces[1:]))
+        return self.query(query, memo=memo)
+    
+    def prepare(self, name, template):
+        """
+        Register a query template under a name, like SQL PREPARE.
+        
+        Args:
+            name (str): Statement name, replacing any template prepared under it
+            template (str): Query with literals replaced by "?", see query_prepared
+        """
+        self._prepared[name] = template
+    
+    def execute_prepared(self, name, params, memo=None):
+        """
+        Execute a template registered with prepare, like SQL EXECUTE.
+        
+        Args:
+            name (str): Statement name given to prepare
+            params (list): Literal strings, in order of appearance
+            memo (dict, optional): Memo shared by a run of statements, see _memoized
+            
+        Returns:
+            Various: Result depends on the query type
+        """
+        template = self._prepared.get(name)
+        if template is None:
+            raise ValueError(f"Prepared statement '{name}' does not exist")
+        return self.query_prepared(template, params, memo=memo)
+    
+    def _memoized(self, query_type, parsed_data, memo):
+        """
+        Execute a parsed query, reusing SELECT results from the memo.
+        
+        SELECT results are keyed on the table, projection and condition
+        structure. Any other statement can change data or schema, so it
+        clears the memo. Memoized results are shared between queries and
+        must not be modified by the caller.
+        
+        Args:
+            query_type (str): Query type returned by parse_query
+            parsed_data (tuple): Parsed query returned by parse_query
+            memo (dict): Memo to use, or None to execute directly
+            
+        Returns:
+            Various: Result depends on the query type
+        """
+        if memo is None:
+            return self._execute(query_type, parsed_data)
+        if query_type != 'SELECT':
+            memo.clear()
+            return self._execute(query_type, parsed_data)
+        
+        table_name, columns, condition = parsed_data
+        key = (query_type, table_name, tuple(columns) if columns else None,
+               condition.key() if condition else None)
+        result = memo.get(key)
+        if result is None:
+            result = memo[key] = self._execute(query_type, parsed_data)
+        return result
+    
+    def _execute(self, query_type, parsed_data):
+        """
+        Execute a parsed query.
+        
+        Args:
+            query_type (str): Query type returned by parse_query
+            parsed_data (tuple): Parsed query returned by parse_query
+            
+        Returns:
+            Various: Result depends on the query type
+        """
+        if query_type == 'CREATE':
+            table_name, columns = parsed_data
+            self.create_table(table_name, columns)
+            return "Table created successfully"
+        
+        elif query_type == 'INSERT':
+            table_name, values = parsed_data
+            table = self._validate_table_exists(table_name)
+            table.insert(values)
+            return "Row inserted successfully"
+        
+        elif query_type == 'SELECT':
+            table_name, columns, condition = parsed_data
+            table = self._validate_table_exists(table_name)
+        
+            # Apply WHERE clause if present, through indexes or a column at a time when possible
+            rows = table.rows
+            if condition:
+                positions = condition.lookup(table)
+                mask = condition.vectorize(table) if positions is None else None
+                if positions is not None:
+                    rows = map(rows.__getitem__, positions)
+                elif mask is not None:
+                    rows = compress(rows, mask)
+                else:
+                    rows = table.iter_select(self._condition_function(condition, table))
+        
+            # Apply projection if columns specified, as the matching rows are collected
+            if columns:
+                rows = table.projection(columns)(rows)
+            result = Table(table.name, columns or table.columns)
+            result.rows = list(rows)
+            return result
+        
+        elif query_type == 'DELETE':
+            table_name, condition = parsed_data
+            table = self._validate_table_exists(table_name)
+        
+            # Apply WHERE clause if present
+            if condition:
+                condition_func = self._condition_function(condition, table)
+                count = table.delete(condition_func)
+            else:
+                count = table.delete()
+        
+            return f"{count} row(s) deleted"
+        
+        elif query_type == 'UPDATE':
+            table_name, updates, condition = parsed_data
+            table = self._validate_table_exists(table_name)
+        
+            # Apply WHERE clause if present
+            if condition:
+                condition_func = self._condition_function(condition, table)
+                count = table.update(updates, condition_func)
+            else:
+                count = table.update(updates)
+        
+            return f"{count} row(s) updated"
+        
+        else:
+            raise ValueError(f"Unsupported query type: {query_type}")
             
     def join(self, left_table_name, right_table_name, join_type, join_column):
         """
@@ -11,8 +11,23 @@ Changes:
 - Fixed join functions to handle different column names in left and right tables
 - Updated as part of package restructuring
 - Refactored to remove duplicate code for column mapping and join preparation
+- Hash the smaller table's rows when matching join keys
+- Build the join hash tables with defaultdict(list) in a single lookup per row
+- Drop the right join column once per right row instead of once per joined row
+- Build joined rows by concatenating tuples instead of converting lists
+- Bind the hot lookups of the join loops to locals
+- Build joined rows in comprehensions rather than appending them one at a time
+- Probe the right table's join hash table with map over the left join values
+- Drop the right join column with an itemgetter built once per join
+- Cache the resolution of right join columns by table name and columns
+- Match join keys through the tables' cached column indexes, so repeated joins skip the build
+- Skip matching join keys when either table is empty
 """
 
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
+
 from modules.core.table import Table
 
 def _find_join_column(left_table, right_table, join_column):
@@ -30,28 +45,49 @@ def _find_join_column(left_table, right_table, join_column):
     Raises:
         ValueError: If no matching column can be found
     """
+    right_join_column = _resolve_join_column(left_table.name, right_table.columns, join_column)
+    if right_join_column is None:
+        raise ValueError(f"Join column '{join_column}' must exist in both tables")
+    return right_join_column
+
+@lru_cache(maxsize=256)
+def _resolve_join_column(left_name, right_columns, join_column):
+    """
+    Find the right table's join column from the table names and columns.
+    
+    Results are cached, since repeated joins of the same tables resolve the
+    same column.
+    
+    Args:
+        left_name (str): Name of the left table
+        right_columns (tuple): Columns of the right table
+        join_column (str): The column in the left table to join on
+        
+    Returns:
+        str: The matching column name in the right table, or None if there is none
+    """
     # Check if join_column exists in right_table
-    if join_column in right_table.columns:
+    if join_column in right_columns:
         return join_column
     # Check if there's a column with the pattern "table_name.column_name"
-    elif f"{left_table.name}_{join_column}" in right_table.columns:
-        return f"{left_table.name}_{join_column}"
+    elif f"{left_name}_{join_column}" in right_columns:
+        return f"{left_name}_{join_column}"
     # Check for a column ending with _id
-    elif f"{join_column}_id" in right_table.columns:
+    elif f"{join_column}_id" in right_columns:
         return f"{join_column}_id"
     # Check for a column starting with table_name and ending with _id
-    elif f"{left_table.name}_id" in right_table.columns:
-        return f"{left_table.name}_id"
+    elif f"{left_name}_id" in right_columns:
+        return f"{left_name}_id"
     # Check for student_id if join_column is id
-    elif join_column == 'id' and 'student_id' in right_table.columns:
+    elif join_column == 'id' and 'student_id' in right_columns:
         return 'student_id'
     # Try to find a matching column in the right table
     else:
-        for col in right_table.columns:
+        for col in right_columns:
             if col.endswith(join_column) or col.endswith(f"_{join_column}"):
                 return col
     
-    raise ValueError(f"Join column '{join_column}' must exist in both tables")
+    return None
 
 def _prepare_join(left_table, right_table, join_column, right_join_column=None, join_type="inner"):
     """
@@ -106,6 +142,77 @@ def _prepare_join(left_table, right_table, join_column, right_join_column=None,
     
     return result, left_join_idx, right_join_idx, right_col_names
 
+def _row_trimmer(width, skip_idx):
+    """
+    Get a function that drops one value from rows, such as a join column.
+    
+    Args:
+        width (int): Number of values in each row
+        skip_idx (int): Index of the value to drop
+        
+    Returns:
+        callable: Takes a row and returns a tuple of its other values
+    """
+    indices = [i for i in range(width) if i != skip_idx]
+    
+    # Pick the values with itemgetter, so each row is trimmed in C
+    if len(indices) > 1:
+        return itemgetter(*indices)
+    if indices:
+        # A single index gives a bare value, so wrap it back into a 1-tuple
+        index = indices[0]
+        return lambda row: (row[index],)
+    return lambda row: ()
+
+def _match_rows(left_table, right_table, left_join_idx, right_join_idx):
+    """
+    Find the right rows matching each left row on the join columns.
+    
+    The smaller table's hash index on its join column is probed with the
+    other table's join values, so either side can be the build side without
+    changing the order of the matches. Indexes are cached by the tables
+    until their rows change, so repeated joins, including a right join of
+    the same tables, don't hash the build side again. Right rows are trimmed
+    of their join column once each, and matches refer to them by position.
+    
+    Args:
+        left_table (Table): The left table
+        right_table (Table): The right table
+        left_join_idx (int): Index of the join column in the left table
+        right_join_idx (int): Index of the join column in the right table
+        
+    Returns:
+        tuple: (matches, right_values) where matches has, for each left row,
+            a sequence of positions in right_values of its matching right
+            rows in their table order, and right_values holds right rows
+            without the right join column
+    """
+    right_rows = right_table.rows
+    if not left_table.rows or not right_rows:
+        # Nothing can match, so skip building and probing an index
+        return [()] * len(left_table.rows), []
+    
+    trim = _row_trimmer(len(right_table.columns), right_join_idx)
+    if len(left_table.rows) < len(right_rows):
+        # Probe the left index with each right row, collecting matches in right table order
+        get_positions = left_table.column_index(left_table.columns[left_join_idx]).get
+        matches = [[] for _ in left_table.rows]
+        right_values = []  # Only the matching right rows
+        for right_row in right_rows:
+            positions = get_positions(right_row[right_join_idx])
+            if positions:
+                for i in positions:
+                    matches[i].append(len(right_values))
+                right_values.append(trim(right_row))
+        return matches, right_values
+    
+    # Probe the right index with every left row's join value, looping in C
+    # rather than in a comprehension
+    right_index = right_table.column_index(right_table.columns[right_join_idx])
+    matches = list(map(right_index.get, map(itemgetter(left_join_idx), left_table.rows),
+                       repeat(())))
+    return matches, list(map(trim, right_rows))
+
 def inner_join(left_table, right_table, join_column, right_join_column=None):
     """
     Perform an inner join between two tables based on a common column.
@@ -125,29 +232,14 @@ def inner_join(left_table, right_table, join_column, right_join_column=None):
         left_table, right_table, join_column, right_join_column, "inner"
     )
     
-    # Create map for right table rows by join key
-    right_rows_by_key = {}
-    for right_row in right_table.rows:
-        key = right_row[right_join_idx]
-        if key not in right_rows_by_key:
-            right_rows_by_key[key] = []
-        right_rows_by_key[key].append(right_row)
-    
-    # Perform the join
-    for left_row in left_table.rows:
-        left_key = left_row[left_join_idx]
-        
-        if left_key in right_rows_by_key:
-            # Join with matching right rows
-            for right_row in right_rows_by_key[left_key]:
-                # Create a new row with values from both tables (excluding duplicate join column)
-                joined_row = list(left_row)
-                for i, val in enumerate(right_row):
-                    # Skip the join column from the right table
-                    if i != right_join_idx:
-                        joined_row.append(val)
-                        
-                result.rows.append(tuple(joined_row))
+    # Find matching right rows through the smaller table's index
+    matches, right_values = _match_rows(left_table, right_table, left_join_idx, right_join_idx)
+    
+    # Perform the join, joining each left row with its matching right rows
+    # (values from both tables excluding duplicate join column, rows being tuples)
+    result.rows = [left_row + right_values[i]
+                   for left_row, positions in zip(left_table.rows, matches)
+                   for i in positions]
     
     return result
 
@@ -170,36 +262,17 @@ def left_join(left_table, right_table, join_column, right_join_column=None):
         left_table, right_table, join_column, right_join_column, "left"
     )
     
-    # Create map for right table rows by join key
-    right_rows_by_key = {}
-    for right_row in right_table.rows:
-        key = right_row[right_join_idx]
-        if key not in right_rows_by_key:
-            right_rows_by_key[key] = []
-        right_rows_by_key[key].append(right_row)
-    
-    # Perform the join
-    for left_row in left_table.rows:
-        left_key = left_row[left_join_idx]
-        
-        if left_key in right_rows_by_key:
-            # Join with matching right rows
-            for right_row in right_rows_by_key[left_key]:
-                # Create a new row with values from both tables
-                joined_row = list(left_row)
-                for i, val in enumerate(right_row):
-                    # Skip the join column from the right table
-                    if i != right_join_idx:
-                        joined_row.append(val)
-                        
-                result.rows.append(tuple(joined_row))
-        else:
-            # No matching row in right table, include nulls
-            joined_row = list(left_row)
-            for _ in range(len(right_col_names)):
-                joined_row.append(None)
-                
-            result.rows.append(tuple(joined_row))
+    # Find matching right rows through the smaller table's index
+    matches, right_values = _match_rows(left_table, right_table, left_join_idx, right_join_idx)
+    
+    # Nulls for the right columns of unmatched left rows, as one more right value
+    unmatched = (len(right_values),)
+    right_values.append((None,) * len(right_col_names))
+    
+    # Perform the join, with nulls for left rows that have no matching right row
+    result.rows = [left_row + right_values[i]
+                   for left_row, positions in zip(left_table.rows, matches)
+                   for i in (positions or unmatched)]
     
     return result
 
@@ -252,19 +325,14 @@ def full_join(left_table, right_table, join_column, right_join_column=None):
     # Create set of keys from left table for checking duplicates
     left_keys = {row[left_join_idx] for row in left_table.rows}
     
-    # Add rows from right table that don't have a match in left table
-    for right_row in right_table.rows:
-        right_key = right_row[right_join_idx]
-        
-        if right_key not in left_keys:
-            # Create a row with nulls for the left table columns and values for the right
-            joined_row = [None] * len(left_table.columns)
-            col_idx = len(joined_row)
-            
-            for i, val in enumerate(right_row):
-                if i != right_join_idx:
-                    joined_row.append(val)
-            
-            result.rows.append(tuple(joined_row))
+    # Nulls for the left columns of unmatched right rows
+    null_pad = (None,) * len(left_table.columns)
+    trim = _row_trimmer(len(right_table.columns), right_join_idx)
+    
+    # Add rows from right table that don't have a match in left table, with
+    # nulls for the left table columns and values for the right
+    result.rows.extend([null_pad + trim(right_row)
+                        for right_row in right_table.rows
+                        if right_row[right_join_idx] not in left_keys])
     
     return result 
\ No newline at end of file
@@ -5,8 +5,10 @@ This module implements an MCP server that exposes SQL-ish functionality to AI as
 It provides capabilities for executing SQL queries, exploring database schema, and managing tables.
 
 Changes:
-- Fixed get_logger call by providing the required name parameter
+- Added a batch_execute tool that runs a whole script in one call
+- Moved the batch loop into run_batch so it can be tested without a server
 - Previous changes:
+  - Fixed get_logger call by providing the required name parameter
   - Implemented WebSocket transport instead of SSE for more stable connections
   - Added reconnection handling and keepalive mechanisms
   - Added error handling to improve stability
@@ -44,12 +46,46 @@ from mcp.server.fastmcp.resources import TextResource
 from mcp.types import TextContent
 
 from modules.engine.db import Database
-from modules.utils import format_result
+from modules.utils import format_result, iter_statements
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("sqlish-mcp")
 
+def run_batch(db, script):
+    """
+    Execute a script of SQL-ish queries, returning one result per query.
+    
+    A failing query is reported in its result and the remaining queries
+    still run.
+    
+    Args:
+        db (Database): The database to query
+        script (str): SQL-ish queries separated by semicolons
+        
+    Returns:
+        List[TextContent]: The formatted result or error of each query
+    """
+    # Share SELECT results between the queries of the batch
+    memo = {}
+    contents = []
+    for query_num, query in enumerate(iter_statements(script), 1):
+        try:
+            result = db.query(query, memo=memo)
+            contents.append(TextContent(
+                type="text",
+                text=format_result(result),
+                title=f"Query {query_num} Result",
+            ))
+        except Exception as e:
+            logger.error(f"Error executing query {query_num}: {e}")
+            contents.append(TextContent(
+                type="text",
+                text=f"Error: {str(e)}",
+                title=f"Query {query_num} Error",
+            ))
+    return contents
+
 class SqlishMcpServer:
     """
     MCP Server implementation for SQL-ish engine.
@@ -207,6 +243,16 @@ class SqlishMcpServer:
                         )
                     ]
             
+            # Batch execution tool
+            @self.server.tool(name="batch_execute",
+                              description="Execute several semicolon-separated SQL-ish queries in one call")
+            def batch_execute(
+                script: Annotated[str, Field(description="The SQL-ish queries to execute, separated by semicolons")]
+            ) -> List[TextContent]:
+                """Execute a script of SQL-ish queries, returning one result per query."""
+                logger.info("Executing batch")
+                return run_batch(self.db, script)
+            
             # Create database tool
             @self.server.tool(name="create_database", description="Create a new database")
             def create_database() -> List[TextContent]:
@@ -9,6 +9,7 @@ Changes:
 - Expose the parse_query function for external use
 - Updated as part of package restructuring
 - Added parse_update and parse_delete functions
+- Added parse_value and bind_parameters for parameterized templates
 """
 
 from modules.parser.parser import (
@@ -18,7 +19,9 @@ from modules.parser.parser import (
     parse_select,
     parse_where_clause,
     parse_update,
-    parse_delete
+    parse_delete,
+    parse_value,
+    bind_parameters
 )
 
 __all__ = [
@@ -28,5 +31,7 @@ __all__ = [
     'parse_select',
     'parse_where_clause',
     'parse_update',
-    'parse_delete'
+    'parse_delete',
+    'parse_value',
+    'bind_parameters'
 ] 
\ No newline at end of file
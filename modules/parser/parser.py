@@ -13,11 +13,44 @@ Changes:
 - Updated as part of package restructuring
 - Fixed parse_select to parse WHERE clause into a Condition object
 - Added parse_update function to support UPDATE commands
+- Factored literal conversion into parse_value
+- Added bind_parameters to fill "?" placeholders of a parsed template
 """
 
 import re
 from modules.core.where import Condition, Comparison, And, Or, Not
 
+# Marks a literal slot in a query template
+PLACEHOLDER = '?'
+
+def parse_value(val):
+    """
+    Convert a literal from a query into a Python value.
+    
+    Quoted strings lose their quotes, NULL becomes None and numbers are
+    converted to int or float. Anything else is kept as a string.
+    
+    Args:
+        val (str): The literal as written in the query
+        
+    Returns:
+        Various: The converted value
+    """
+    if (val.startswith('"') and val.endswith('"')) or (val.startswith("'") and val.endswith("'")):
+        # String value - remove quotes
+        return val[1:-1]
+    elif val.lower() == 'null':
+        # NULL value
+        return None
+    # Try to convert to numeric
+    try:
+        if '.' in val:
+            return float(val)
+        return int(val)
+    except ValueError:
+        # Keep as string if not numeric
+        return val
+
 def parse_create_table(query):
     """
     Parse a CREATE TABLE statement.
@@ -92,24 +125,7 @@ def parse_insert(query):
         values.append(current.strip())
     
     # Clean up values
-    cleaned_values = []
-    for val in values:
-        if (val.startswith('"') and val.endswith('"')) or (val.startswith("'") and val.endswith("'")):
-            # String value - remove quotes
-            cleaned_values.append(val[1:-1])
-        elif val.lower() == 'null':
-            # NULL value
-            cleaned_values.append(None)
-        else:
-            # Try to convert to numeric
-            try:
-                if '.' in val:
-                    cleaned_values.append(float(val))
-                else:
-                    cleaned_values.append(int(val))
-            except ValueError:
-                # Keep as string if not numeric
-                cleaned_values.append(val)
+    cleaned_values = [parse_value(val) for val in values]
                 
     return (table_name, cleaned_values)
 
@@ -178,23 +194,7 @@ def parse_where_clause(where_clause):
         if op in where_clause:
             col, val = where_clause.split(op, 1)
             col = col.strip()
-            val = val.strip()
-            
-            # Handle quoted values
-            if (val.startswith('"') and val.endswith('"')) or (val.startswith("'") and val.endswith("'")):
-                val = val[1:-1]  # Remove the quotes
-            elif val.lower() == 'null':
-                val = None
-            else:
-                # Try to convert to numeric if possible
-                try:
-                    if '.' in val:
-                        val = float(val)
-                    else:
-                        val = int(val)
-                except ValueError:
-                    # Keep as string if not numeric
-                    pass
+            val = parse_value(val.strip())
                     
             return Comparison(col, op, val)
     
@@ -230,25 +230,7 @@ def parse_update(query):
         
         col, val = item.split('=', 1)
         col = col.strip()
-        val = val.strip()
-        
-        # Handle quoted strings
-        if (val.startswith('"') and val.endswith('"')) or (val.startswith("'") and val.endswith("'")):
-            val = val[1:-1]  # Remove quotes
-        elif val.lower() == 'null':
-            val = None
-        else:
-            # Try to convert to numeric
-            try:
-                if '.' in val:
-                    val = float(val)
-                else:
-                    val = int(val)
-            except ValueError:
-                # Keep as string if not numeric
-                pass
-                
-        updates[col] = val
+        updates[col] = parse_value(val.strip())
     
     # Parse WHERE clause if present
     condition = None
@@ -312,4 +294,67 @@ def parse_query(query):
         return ('DELETE', parse_delete(query))
     
     else:
-        raise ValueError(f"Unsupported query type: {query}") 
\ No newline at end of file
+        raise ValueError(f"Unsupported query type: {query}")
+
+def _bind_condition(condition, take):
+    """
+    Rebuild a condition tree with its comparison values passed through take.
+    
+    Args:
+        condition (Condition): The template condition, or None
+        take (callable): Maps a template value to its bound value
+        
+    Returns:
+        Condition: A new condition tree with the values bound
+    """
+    if isinstance(condition, Comparison):
+        return Comparison(condition.column, condition.operator, take(condition.value))
+    elif isinstance(condition, (And, Or)):
+        left = _bind_condition(condition.left, take)
+        return type(condition)(left, _bind_condition(condition.right, take))
+    elif isinstance(condition, Not):
+        return Not(_bind_condition(condition.condition, take))
+    return condition
+
+def bind_parameters(query_type, parsed_data, params):
+    """
+    Bind parameter values into a query parsed from a template.
+    
+    The template is a query with its literals replaced by "?". Parsing it
+    leaves the string "?" wherever a literal value was; those slots are
+    filled from params in the order they appear in the query.
+    
+    Args:
+        query_type (str): Query type returned by parse_query
+        parsed_data (tuple): Parsed template returned by parse_query
+        params (list): Values to bind, already converted with parse_value
+        
+    Returns:
+        tuple: (parsed_data, count) with the bound data and the number of
+            placeholders that were filled
+    """
+    remaining = iter(params)
+    count = 0
+    
+    def take(value):
+        nonlocal count
+        if value != PLACEHOLDER:
+            return value
+        count += 1
+        return next(remaining, PLACEHOLDER)
+    
+    if query_type == 'INSERT':
+        table_name, values = parsed_data
+        parsed_data = (table_name, [take(val) for val in values])
+    elif query_type == 'SELECT':
+        table_name, columns, condition = parsed_data
+        parsed_data = (table_name, columns, _bind_condition(condition, take))
+    elif query_type == 'UPDATE':
+        table_name, updates, condition = parsed_data
+        updates = {col: take(val) for col, val in updates.items()}
+        parsed_data = (table_name, updates, _bind_condition(condition, take))
+    elif query_type == 'DELETE':
+        table_name, condition = parsed_data
+        parsed_data = (table_name, _bind_condition(condition, take))
+    
+    return parsed_data, count
@@ -10,12 +10,25 @@ Changes:
 - Tests for SQL query parsing and execution
 - Fixed test_sql_query to use direct API calls
 - Added as part of package restructuring
+- Tests for prepared query templates
+- Tests for memoized SELECT results
+- Tests for compiled WHERE conditions
+- Tests for rebinding comparisons to other columns
+- Tests for column-wise condition evaluation
+- Tests for projecting repeated and unknown columns
+- Tests for equality lookups through column indexes
+- Tests for reusing parsed queries
+- Tests for simplifying conditions before compiling them
+- Tests for iterating over selected rows
+- Tests for vectorizing numeric comparisons on mixed columns
+- Tests for named prepared statements
+- Tests for batch inserts
 """
 
 import unittest
 from modules.engine.db import Database
 from modules.core.table import Table
-from modules.core.where import Comparison, build_condition_function
+from modules.core.where import Comparison, And, Or, Not, Constant, build_condition_function
 
 class BasicTests(unittest.TestCase):
     """Basic tests for SQL-ish functionality."""
@@ -39,6 +52,21 @@ class BasicTests(unittest.TestCase):
         table.insert(('2', 'Bob', '25'))
         self.assertEqual(len(table.rows), 2)
         
+    def test_insert_many(self):
+        """Test inserting a batch of rows, all or nothing."""
+        table = self.db.create_table('test', ['id', 'name'])
+        table.insert_many([['1', 'Alice'], ('2', 'Bob')])
+        self.assertEqual(table.rows, [('1', 'Alice'), ('2', 'Bob')])
+        self.assertEqual(Comparison('id', '=', '2').lookup(table), [1])
+        
+        with self.assertRaises(ValueError):
+            table.insert_many([('3', 'Carol'), ('4',)])
+        self.assertEqual(len(table.rows), 2)
+        
+        # Cached indexes follow the new rows
+        table.insert_many([('2', 'Dan')])
+        self.assertEqual(Comparison('id', '=', '2').lookup(table), [1, 2])
+        
     def test_select_all(self):
         """Test selecting all rows."""
         table = self.db.create_table('test', ['id', 'name', 'age'])
@@ -67,6 +95,13 @@ class BasicTests(unittest.TestCase):
         self.assertEqual(len(result.rows), 2)
         self.assertEqual(len(result.rows[0]), 2)
         
+    def test_project_repeated_columns(self):
+        """Test projecting a column twice and projecting unknown columns."""
+        table = self.db.create_table('test', ['id', 'name'])
+        table.insert(('1', 'Alice'))
+        self.assertEqual(table.project('name', 'id', 'name').rows, [('Alice', '1', 'Alice')])
+        self.assertEqual(table.project('missing').rows, [()])
+        
     def test_sql_query(self):
         """Test SQL query execution."""
         # Create a table directly
@@ -84,6 +119,143 @@ class BasicTests(unittest.TestCase):
         result = self.db.query("SELECT name, age FROM test WHERE age > 25")
         self.assertEqual(len(result.rows), 1)
         self.assertEqual(result.rows[0][0], 'Alice')
+        
+    def test_query_prepared(self):
+        """Test running queries through a parameterized template."""
+        self.db.query("CREATE TABLE test (id, name)")
+        for i, name in enumerate(['Alice', 'Bob'], 1):
+            self.db.query_prepared("INSERT INTO test VALUES (?, ?)", (str(i), f"'{name}'"))
+        result = self.db.query_prepared("SELECT name FROM test WHERE id = ?", ('2',))
+        self.assertEqual(result.rows, [('Bob',)])
+        
+        # A template that does not bind cleanly falls back to the full query
+        result = self.db.query_prepared("SELECT name FROM test WHERE id = -?", ('1',))
+        self.assertEqual(len(result.rows), 0)
+        
+        # Schema changes flush the cached templates
+        self.db.query("CREATE TABLE other (id)")
+        self.assertEqual(len(self.db._templates), 0)
+        
+    def test_execute_prepared(self):
+        """Test running named query templates."""
+        self.db.query("CREATE TABLE test (id, name)")
+        self.db.prepare('add', "INSERT INTO test VALUES (?, ?)")
+        self.db.prepare('find', "SELECT name FROM test WHERE id = ?")
+        self.db.execute_prepared('add', ('1', "'Alice'"))
+        self.db.execute_prepared('add', ('2', "'Bob'"))
+        self.assertEqual(self.db.execute_prepared('find', ('2',)).rows, [('Bob',)])
+        with self.assertRaises(ValueError):
+            self.db.execute_prepared('missing', ())
+        
+    def test_query_memo(self):
+        """Test reusing SELECT results until the data changes."""
+        memo = {}
+        self.db.query("CREATE TABLE test (id, name)", memo=memo)
+        self.db.query("INSERT INTO test VALUES (1, 'Alice')", memo=memo)
+        first = self.db.query("SELECT name FROM test WHERE id = 1", memo=memo)
+        self.assertIs(self.db.query("SELECT  name FROM test WHERE id = 1", memo=memo), first)
+        
+        self.db.query("INSERT INTO test VALUES (1, 'Bob')", memo=memo)
+        result = self.db.query("SELECT name FROM test WHERE id = 1", memo=memo)
+        self.assertEqual(len(result.rows), 2)
+        
+    def test_compiled_condition(self):
+        """Test that compiled conditions match evaluating the condition tree."""
+        columns = ('id', 'name', 'age')
+        condition = And(Comparison('age', '>', 18),
+                        Not(Comparison('name', '=', 'Bob')))
+        compiled = build_condition_function(condition, columns)
+        walked = build_condition_function(condition)
+        for row in [(1, 'Alice', '30'), (2, 'Bob', '40'), (3, 'Carol', '17.5'), (4, 'Dan', 9)]:
+            self.assertEqual(compiled(row, columns), walked(row, columns))
+        
+        # Unknown columns never match, like Comparison.evaluate
+        compiled = build_condition_function(Comparison('missing', '=', 1), columns)
+        self.assertFalse(compiled((1, 'Alice', '30'), columns))
+        
+    def test_comparison_rebinds(self):
+        """Test that a comparison follows the columns it is evaluated with."""
+        comparison = Comparison('age', '>=', '18')
+        self.assertTrue(comparison.evaluate(('Alice', 30), ('name', 'age')))
+        self.assertFalse(comparison.evaluate((9, 'Bob'), ('age', 'name')))
+        self.assertFalse(comparison.evaluate(('Carol',), ('name',)))
+        
+    def test_vectorized_condition(self):
+        """Test evaluating conditions a column at a time."""
+        table = self.db.create_table('test', ['id', 'name', 'age'])
+        table.insert(('1', 'Alice', '30'))
+        table.insert(('2', 'Bob', '25'))
+        condition = And(Comparison('age', '>', 25), Not(Comparison('name', '=', 'Bob')))
+        self.assertEqual(condition.vectorize(table), [True, False])
+        
+        # Column values are rebuilt once the rows change
+        table.update({'age': '20'})
+        self.assertEqual(condition.vectorize(table), [False, False])
+        
+        # Ordering mixed types is left to per-row evaluation
+        table.insert(('3', None, '40'))
+        self.assertIsNone(Comparison('name', '<', 'B').vectorize(table))
+        
+        # Numeric literals compare text values as written, matching evaluate
+        table.update({'age': ''}, lambda row, columns: row[0] == '2')
+        condition = Comparison('age', '>', '25')
+        expected = [condition.evaluate(row, table.columns) for row in table.rows]
+        self.assertEqual(condition.vectorize(table), expected)
+        
+    def test_indexed_lookup(self):
+        """Test finding equality matches through column indexes."""
+        table = self.db.create_table('test', ['id', 'name'])
+        for row in [('1', 'Alice'), ('2', 'Bob'), ('2.0', 'Bob'), ('x', 'Carol')]:
+            table.insert(row)
+        self.assertEqual(Comparison('id', '=', 2).lookup(table), [1, 2])
+        self.assertEqual(And(Comparison('id', '=', 2), Comparison('name', '=', 'Bob')).lookup(table), [1, 2])
+        self.assertEqual(Comparison('id', '=', 'x').lookup(table), [3])
+        self.assertIsNone(Not(Comparison('id', '=', 2)).lookup(table))
+        
+        # Indexes follow new rows
+        table.insert(('2', 'Dan'))
+        result = self.db.query("SELECT name FROM test WHERE id = 2")
+        self.assertEqual(result.rows, [('Bob',), ('Bob',), ('Dan',)])
+        
+    def test_plan_cache(self):
+        """Test that repeated queries reuse their parsed form and see new data."""
+        self.db.query("CREATE TABLE test (id, name)")
+        self.db.query("INSERT INTO test VALUES (1, 'Alice')")
+        query = "UPDATE test SET name = 'Bob' WHERE id > 0"
+        self.assertEqual(self.db.query(query), "1 row(s) updated")
+        plan = self.db._plans[query]
+        
+        self.db.query("INSERT INTO test VALUES (2, 'Carol')")
+        self.assertEqual(self.db.query(f"  {query}  "), "2 row(s) updated")
+        self.assertIs(self.db._plans[query], plan)
+        self.assertEqual(len(self.db._condition_funcs), 1)
+        
+    def test_simplify_condition(self):
+        """Test folding missing columns and ordering cheaper terms first."""
+        columns = ('id', 'name')
+        cheap = Comparison('name', '=', 'Bob')
+        numeric = Comparison('id', '=', 2)
+        self.assertIs(And(Comparison('age', '=', 1), numeric).simplify(columns).value, False)
+        self.assertIs(Or(Comparison('age', '=', 1), numeric).simplify(columns), numeric)
+        self.assertIs(Not(Not(cheap)).simplify(columns), cheap)
+        
+        reordered = And(numeric, cheap).simplify(columns)
+        self.assertEqual(reordered.key(), And(cheap, numeric).key())
+        
+        # Terms that can raise keep their order, so short-circuiting still guards them
+        ordered = And(Comparison('id', '<', 2), cheap).simplify(columns)
+        self.assertEqual(ordered.key(), And(Comparison('id', '<', 2), cheap).key())
+        self.assertIsInstance(Constant(True).simplify(columns), Constant)
+        
+    def test_iter_select(self):
+        """Test iterating over matching rows, with and without a projection."""
+        table = self.db.create_table('test', ['id', 'name', 'age'])
+        table.insert(('1', 'Alice', '30'))
+        table.insert(('2', 'Bob', '25'))
+        older = build_condition_function(Comparison('age', '>', 26), table.columns)
+        self.assertEqual(list(table.iter_select(older)), [('1', 'Alice', '30')])
+        self.assertEqual(list(table.iter_select(None, ['name'])), [('Alice',), ('Bob',)])
+        self.assertEqual(list(table.iter_select(older, ['age', 'id'])), [('30', '1')])
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -11,6 +11,9 @@ Changes:
 - Fixed join tests to use the correct column names
 - Fixed test_right_join to check the correct columns based on actual output
 - Added as part of package restructuring
+- Test that hashing either table gives the same rows in the same order
+- Test repeated joins after inserting rows
+- Test joins with an empty table
 """
 
 import unittest
@@ -93,5 +96,36 @@ class JoinTests(unittest.TestCase):
         # All students and all grades (4 unique IDs)
         self.assertEqual(len(result.rows), 4)
 
+    def test_join_build_side(self):
+        """Test that row order doesn't depend on which table is hashed."""
+        for i in range(5, 9):
+            self.grades.insert((str(i % 3), f'CS{i}', 'B'))
+        expected = [student + grade[1:] for student in self.students.rows
+                    for grade in self.grades.rows if student[0] == grade[0]]
+        self.assertEqual(inner_join(self.students, self.grades, 'id').rows, expected)
+        
+        # With the left table now larger than the right one
+        for i in range(5, 10):
+            self.students.insert((str(i), f'Student{i}', 'CS'))
+        self.assertEqual(inner_join(self.students, self.grades, 'id').rows, expected)
+
+    def test_join_after_insert(self):
+        """Test that repeated joins see rows added since the last one."""
+        self.assertEqual(len(left_join(self.students, self.grades, 'id').rows), 3)
+        self.grades.insert(('3', 'CS102', 'C'))
+        self.grades.insert(('3', 'CS103', 'B+'))
+        result = left_join(self.students, self.grades, 'id')
+        self.assertEqual([row for row in result.rows if row[0] == '3'],
+                         [('3', 'Charlie', 'CS', 'CS102', 'C'), ('3', 'Charlie', 'CS', 'CS103', 'B+')])
+
+    def test_join_empty_table(self):
+        """Test joins where one of the tables has no rows."""
+        empty = Table('grades', ['student_id', 'course', 'grade'])
+        self.assertEqual(inner_join(self.students, empty, 'id').rows, [])
+        self.assertEqual(left_join(self.students, empty, 'id').rows,
+                         [row + (None, None) for row in self.students.rows])
+        self.assertEqual(full_join(Table('students', ['id', 'name', 'major']), self.grades, 'id').rows,
+                         [(None, None, None) + row[1:] for row in self.grades.rows])
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+test_main.py - Tests for the SQL-ish command line entry point
+
+This module contains tests for the query helpers in main.py.
+It tests that templated queries give the same results as parsing them.
+
+Changes:
+- Initial implementation of prepared path admission tests
+"""
+
+import unittest
+import main
+from modules.engine.db import Database
+
+class RunQueryTests(unittest.TestCase):
+    """Tests for running queries through main.run_query."""
+    
+    def setUp(self):
+        """Set up a test database and forget templates seen by other tests."""
+        main._template_counts.clear()
+        self.db = Database()
+        self.db.query("CREATE TABLE t (id, name)")
+        self.db.query("INSERT INTO t VALUES (1, 'x')")
+        
+    def test_admitted_template(self):
+        """Test that results don't change once a template is prepared."""
+        for _ in range(main._ADMIT_AFTER + 2):
+            self.assertEqual(main.run_query(self.db, "UPDATE t SET name = 'y' WHERE id = 1"), '1 row(s) updated')
+            result = main.run_query(self.db, "SELECT name FROM t WHERE id = 1")
+            self.assertEqual(result.rows, [('y',)])
+        self.assertIn("SELECT name FROM t WHERE id = ?", self.db._templates)
+        
+    def test_keyword_literal(self):
+        """Test that literals containing clause keywords are never templated."""
+        query = "UPDATE t SET name = 'a where b' WHERE id = 1"
+        expected = self.db.query(query)
+        for _ in range(main._ADMIT_AFTER + 2):
+            self.assertEqual(main.run_query(self.db, query), expected)
+        self.assertEqual(self.db.query("SELECT name FROM t").rows, [('x',)])
+        for literal in ("'a FROM b'", "'x and y'", "'set'"):
+            self.assertIsNone(main._fingerprint(f"SELECT * FROM t WHERE name = {literal}"))
+
+if __name__ == '__main__':
+    unittest.main()
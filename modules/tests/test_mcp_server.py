@@ -0,0 +1,36 @@
+"""
+test_mcp_server.py - Tests for the SQL-ish MCP server
+
+This module contains tests for the query helpers behind the MCP tools.
+They are skipped when the mcp package is not installed.
+
+Changes:
+- Initial implementation of batch execution tests
+"""
+
+import importlib.util
+import unittest
+from modules.engine.db import Database
+
+HAVE_MCP = importlib.util.find_spec('mcp') is not None
+if HAVE_MCP:
+    from modules.mcp.server import run_batch
+
+@unittest.skipUnless(HAVE_MCP, "mcp package not installed")
+class BatchExecuteTests(unittest.TestCase):
+    """Tests for running a script through run_batch."""
+    
+    def test_continues_after_error(self):
+        """Test that a failing query doesn't stop the rest of the batch."""
+        db = Database()
+        contents = run_batch(db, "CREATE TABLE t (id, name); "
+                                 "INSERT INTO missing VALUES (1, 'x'); "
+                                 "INSERT INTO t VALUES (2, 'y'); "
+                                 "SELECT name FROM t")
+        self.assertEqual([content.title for content in contents],
+                         ["Query 1 Result", "Query 2 Error", "Query 3 Result", "Query 4 Result"])
+        self.assertIn("missing", contents[1].text)
+        self.assertEqual(db.query("SELECT name FROM t").rows, [('y',)])
+
+if __name__ == '__main__':
+    unittest.main()
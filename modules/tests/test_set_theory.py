@@ -9,6 +9,9 @@ Changes:
 - Tests for union, intersection, and difference operations
 - Tests for Cartesian product operation
 - Added as part of package restructuring
+- Tests for set operations after the tables change
+- Tests for hash joins against the filtered Cartesian product
+- Tests for row membership
 """
 
 import unittest
@@ -56,6 +59,15 @@ class SetTheoryTests(unittest.TestCase):
         result = self.cs_students.difference(self.students)
         self.assertEqual(len(result.rows), 1)  # 4
         
+    def test_set_operations_follow_changes(self):
+        """Test that repeated set operations see rows added in between."""
+        self.assertEqual(len(self.students.difference(self.cs_students).rows), 1)
+        self.cs_students.insert(('2', 'Bob', 'Math'))
+        self.assertEqual(len(self.students.difference(self.cs_students).rows), 0)
+        self.cs_students.delete(lambda row, cols: row[0] == '1')
+        self.assertEqual(self.students.intersection(self.cs_students).rows,
+                         [('2', 'Bob', 'Math'), ('3', 'Charlie', 'CS')])
+        
     def test_cartesian_product(self):
         """Test Cartesian product operation."""
         result = self.students.cartesian_product(self.courses)
@@ -63,6 +75,30 @@ class SetTheoryTests(unittest.TestCase):
         self.assertEqual(len(result.rows), 6)
         # Result should have columns from both tables
         self.assertEqual(len(result.columns), 6)  # id, name, major, code, title, credits
+        
+    def test_hash_join(self):
+        """Test that a hash join matches the Cartesian product filtered on equality."""
+        enrollments = Table('enrollments', ['student', 'code'])
+        for row in [('3', 'CS101'), ('1', 'MATH200'), ('1', 'CS101'), ('9', 'CS101')]:
+            enrollments.insert(row)
+        
+        # Hash either side, depending on which one is smaller
+        for left, right, left_col, right_col in [(self.students, enrollments, 'id', 'student'),
+                                                 (enrollments, self.courses, 'code', 'code')]:
+            product = left.cartesian_product(right)
+            right_idx = len(left.columns) + right.columns.index(right_col)
+            left_idx = left.columns.index(left_col)
+            expected = [row for row in product.rows if row[left_idx] == row[right_idx]]
+            result = left.hash_join(right, left_col, right_col)
+            self.assertEqual(result.columns, product.columns)
+            self.assertEqual(result.rows, expected)
+
+    def test_contains(self):
+        """Test row membership, including after rows change."""
+        self.assertIn(('1', 'Alice', 'CS'), self.students)
+        self.assertNotIn(('4', 'Dave', 'CS'), self.students)
+        self.students.insert(('4', 'Dave', 'CS'))
+        self.assertIn(('4', 'Dave', 'CS'), self.students)
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+test_sql_utils.py - Tests for SQL-ish script utilities
+
+This module contains tests for the SQL script helpers in the utils package.
+It tests comment stripping and statement splitting.
+
+Changes:
+- Initial implementation of statement splitting tests
+- Tests for streaming statements from a file
+- Test for a statement spanning many chunks at the default chunk size
+"""
+
+import io
+import unittest
+from modules.utils.sql_utils import iter_statements, iter_statements_streaming, smart_split_sql
+
+class StatementSplitTests(unittest.TestCase):
+    """Tests for splitting SQL scripts into statements."""
+
+    def test_split_statements(self):
+        """Test splitting on semicolons and dropping empty statements."""
+        script = "CREATE TABLE t (a, b);\n\nINSERT INTO t VALUES (1, 2);;  "
+        self.assertEqual(list(iter_statements(script)),
+                         ["CREATE TABLE t (a, b)", "INSERT INTO t VALUES (1, 2)"])
+
+    def test_strip_comments(self):
+        """Test removing comments, including ones inside a statement."""
+        script = "-- header\nSELECT * -- all columns\nFROM t; -- done"
+        self.assertEqual(list(iter_statements(script)), ["SELECT * \nFROM t"])
+
+    def test_string_literals(self):
+        """Test that semicolons and dashes inside strings are preserved."""
+        script = "INSERT INTO t VALUES ('a;b', \"--c\", 'it\\'s'); SELECT * FROM t"
+        self.assertEqual(list(iter_statements(script)),
+                         ["INSERT INTO t VALUES ('a;b', \"--c\", 'it\\'s')", "SELECT * FROM t"])
+
+    def test_smart_split_sql(self):
+        """Test the list-returning wrapper."""
+        self.assertEqual(smart_split_sql("SELECT 1; SELECT 2;"), ["SELECT 1", "SELECT 2"])
+
+    def test_streaming(self):
+        """Test that chunked reads split the same as a single scan."""
+        script = ("-- header\nCREATE TABLE t (a, b); -- x;y\n"
+                  "INSERT INTO t VALUES ('a;b', \"--c\"); INSERT INTO t VALUES ('it\\'s', 2)\n")
+        expected = list(iter_statements(script))
+        for chunk_size in (1, 2, 3, 7, 64):
+            statements = iter_statements_streaming(io.StringIO(script), chunk_size)
+            self.assertEqual(list(statements), expected)
+
+    def test_streaming_long_statement(self):
+        """Test a statement spanning many chunks at the default chunk size."""
+        values = ", ".join("(%d, 'v;%d', \"it\\'s\")" % (i, i) for i in range(50000))
+        script = "-- rows\nINSERT INTO t VALUES " + values + "; -- done\nSELECT * FROM t"
+        self.assertGreater(len(script), 10 * (1 << 16))
+        statements = list(iter_statements_streaming(io.StringIO(script)))
+        self.assertEqual(statements, ["INSERT INTO t VALUES " + values, "SELECT * FROM t"])
+        self.assertEqual(statements, list(iter_statements(script)))
+
+    def test_streaming_chunk_boundaries(self):
+        """Test comment dashes and escaped quotes split across chunks."""
+        script = "SELECT 'a\\'b' -- c;\nFROM t; SELECT 1 - 2"
+        expected = ["SELECT 'a\\'b' \nFROM t", "SELECT 1 - 2"]
+        for chunk_size in range(1, len(script) + 1):
+            statements = iter_statements_streaming(io.StringIO(script), chunk_size)
+            self.assertEqual(list(statements), expected)
+
+if __name__ == '__main__':
+    unittest.main()
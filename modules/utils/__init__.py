@@ -7,9 +7,13 @@ Changes:
 - Initial implementation of the utils package
 - Added sql_utils module with SQL parsing utilities
 - Added format_utils module with result formatting utilities
+- Exposed iter_statements for single-pass script splitting
+- Exposed iter_statements_streaming for splitting scripts read from a file
+- Exposed format_result_structured for drawing result tables directly
 """
 
-from modules.utils.sql_utils import smart_split_sql
-from modules.utils.format_utils import format_result
+from modules.utils.sql_utils import smart_split_sql, iter_statements, iter_statements_streaming
+from modules.utils.format_utils import format_result, format_result_structured
 
-__all__ = ['smart_split_sql', 'format_result'] 
\ No newline at end of file
+__all__ = ['smart_split_sql', 'iter_statements', 'iter_statements_streaming', 'format_result',
+           'format_result_structured'] 
\ No newline at end of file
@@ -9,8 +9,58 @@ Changes:
 - Enhanced formatting with improved table layout and value representation
 - Added support for NULL values and better handling of various data types
 - Added truncation for large results
+- Split out format_result_structured so callers can draw tables themselves
 """
 
+def format_result_structured(result, max_column_width=40, max_rows=200):
+    """
+    Prepare a table result for display without rendering it.
+    
+    Args:
+        result: The query result
+        max_column_width: Maximum width for columns before truncation
+        max_rows: Maximum number of rows to display
+        
+    Returns:
+        tuple: (columns, rows, widths) with the cell values as strings and the
+            padded width of each column, or None if the result is not a table
+            with rows
+    """
+    if not (hasattr(result, 'rows') and hasattr(result, 'columns')) or not result.rows:
+        return None
+    
+    # Extract data, limiting rows for display
+    columns = [str(col) for col in result.columns]
+    rows = result.rows[:max_rows]
+        
+    # Format rows
+    formatted_rows = []
+    for row in rows:
+        formatted_row = []
+        for val in row:
+            if val is None:
+                formatted_row.append("NULL")
+            else:
+                val_str = str(val)
+                # Truncate long values
+                if len(val_str) > max_column_width:
+                    val_str = val_str[:max_column_width - 3] + "..."
+                formatted_row.append(val_str)
+        formatted_rows.append(formatted_row)
+        
+    # Find column widths
+    col_widths = []
+    for i, col in enumerate(columns):
+        # Start with column name width
+        width = len(col)
+        # Check all row values
+        for row in formatted_rows:
+            if i < len(row):
+                width = max(width, len(row[i]))
+        col_widths.append(min(width + 2, max_column_width + 2))  # Add padding
+    
+    return columns, formatted_rows, col_widths
+
 def format_result(result, query_type=None, max_column_width=40, max_rows=200):
     """
     Format a query result for display.
@@ -29,57 +79,23 @@ def format_result(result, query_type=None, max_column_width=40, max_rows=200):
         if not result.rows:
             return "No rows returned"
         
-        # Extract data
-        columns = result.columns
-        rows = result.rows
-        
-        # Limit rows for display
-        show_truncated = False
-        if len(rows) > max_rows:
-            rows = rows[:max_rows]
-            show_truncated = True
-            
-        # Format columns and rows
-        formatted_rows = []
-        for row in rows:
-            formatted_row = []
-            for val in row:
-                if val is None:
-                    formatted_row.append("NULL")
-                else:
-                    val_str = str(val)
-                    # Truncate long values
-                    if len(val_str) > max_column_width:
-                        val_str = val_str[:max_column_width - 3] + "..."
-                    formatted_row.append(val_str)
-            formatted_rows.append(formatted_row)
-            
-        # Find column widths
-        col_widths = []
-        for i, col in enumerate(columns):
-            # Start with column name width
-            width = len(str(col))
-            # Check all row values
-            for row in formatted_rows:
-                if i < len(row):
-                    width = max(width, len(str(row[i])))
-            col_widths.append(min(width + 2, max_column_width + 2))  # Add padding
+        columns, formatted_rows, col_widths = format_result_structured(result, max_column_width, max_rows)
         
         # Build header
-        header = "| " + " | ".join(str(col).ljust(width-2) for col, width in zip(columns, col_widths)) + " |"
+        header = "| " + " | ".join(col.ljust(width-2) for col, width in zip(columns, col_widths)) + " |"
         separator = "+" + "+".join("-" * width for width in col_widths) + "+"
         
         # Build rows
         row_strings = []
         for row in formatted_rows:
-            row_str = "| " + " | ".join(str(val).ljust(width-2) for val, width in zip(row, col_widths)) + " |"
+            row_str = "| " + " | ".join(val.ljust(width-2) for val, width in zip(row, col_widths)) + " |"
             row_strings.append(row_str)
         
         # Combine everything
         result_str = "\n".join([separator, header, separator] + row_strings + [separator])
         
         # Add truncation notice if needed
-        if show_truncated:
+        if len(result.rows) > max_rows:
             result_str += f"\nShowing {max_rows} of {len(result.rows)} rows."
             
         return result_str
@@ -6,8 +6,181 @@ This module provides utility functions for working with SQL-ish queries.
 Changes:
 - Initial implementation of SQL utility functions
 - Added smart_split_sql function for parsing SQL scripts
+- Added iter_statements to strip comments and split statements in one scan
+- Added iter_statements_streaming to split statements read from a file in chunks
+- Split text without quotes or comments with str.split
+- Compiled the token regex with re.ASCII
+- Keep the scanner state between chunks so streamed statements are scanned once
 """
 
+import re
+
+# Characters that change the scanner state: comments, terminators and quotes
+_TOKEN_RE = re.compile(r"--|[;'\"]", re.ASCII)
+
+class _StatementScanner:
+    """
+    Splits SQL text into statements as it arrives, as described for iter_statements.
+    
+    The scanner keeps the statement in progress and whether a string or a
+    comment is left open between pieces of text, so each character is
+    scanned once however the input is divided.
+    """
+    
+    def __init__(self):
+        """Initialize a scanner at the start of the input."""
+        self._pieces = []  # Text of the statement in progress
+        self._quote = None  # Quote character of a string left open
+        self._in_comment = False  # Whether a comment is left open
+        self._carry = ''  # Last character held back, as it may start a token with the next text
+    
+    def feed(self, text, final=False):
+        """
+        Scan more text, yielding the statements it completes.
+        
+        Args:
+            text (str): The next piece of SQL content
+            final (bool): Whether text runs to the end of the input, so the
+                trailing statement is yielded too
+                
+        Yields:
+            str: Each completed non-empty statement, stripped of surrounding whitespace
+        """
+        if self._carry:
+            text = self._carry + text
+            self._carry = ''
+        pieces = self._pieces
+        length = len(text)
+        start = pos = 0
+        
+        # Finish a comment or string left open by the previous text
+        if self._in_comment:
+            end = text.find('\n')
+            if end == -1:
+                start = pos = length
+            else:
+                self._in_comment = False
+                start = pos = end
+        elif self._quote:
+            end = self._closing_quote(text, self._quote, 0)
+            if end == -1:
+                pos = length
+            else:
+                self._quote = None
+                pos = end + 1
+        
+        if pos < length and "'" not in text and '"' not in text and '--' not in text:
+            # Nothing to skip over, so split on every semicolon in one call
+            parts = text[start:].split(';')
+            for part in parts[:-1]:
+                pieces.append(part)
+                statement = ''.join(pieces).strip()
+                if statement:
+                    yield statement
+                pieces = []
+            start = pos = length - len(parts[-1])
+        
+        search = _TOKEN_RE.search
+        while pos < length:
+            match = search(text, pos)
+            if match is None:
+                break
+            token = match.group()
+            i = match.start()
+            
+            if token == ';':
+                # End of statement
+                pieces.append(text[start:i])
+                statement = ''.join(pieces).strip()
+                if statement:
+                    yield statement
+                pieces = []
+                start = pos = i + 1
+            elif token == '--':
+                # Drop the comment but keep the newline that ends it
+                pieces.append(text[start:i])
+                end = text.find('\n', i)
+                if end == -1:
+                    self._in_comment = True
+                    end = length
+                start = pos = end
+            else:
+                # Skip to the closing quote, ignoring escaped quotes
+                end = self._closing_quote(text, token, i + 1)
+                if end == -1:
+                    self._quote = token  # The string runs on into the next text
+                    break
+                pos = end + 1
+        
+        if not self._in_comment:
+            tail = text[start:]
+            # A trailing "-" may start a comment and a trailing backslash inside
+            # a string may escape a quote, so hold them back for the next text
+            if not final and tail.endswith('\\' if self._quote else '-'):
+                self._carry = tail[-1]
+                tail = tail[:-1]
+            pieces.append(tail)
+        
+        if final:
+            statement = ''.join(pieces).strip()
+            if statement:
+                yield statement
+            pieces = []
+        self._pieces = pieces
+    
+    @staticmethod
+    def _closing_quote(text, quote, pos):
+        """
+        Find the quote closing a string, skipping quotes escaped with a backslash.
+        
+        Args:
+            text (str): Text to search
+            quote (str): The quote character that opened the string
+            pos (int): Offset to search from
+            
+        Returns:
+            int: Offset of the closing quote, or -1 if the string isn't closed in text
+        """
+        end = text.find(quote, pos)
+        while end > 0 and text[end - 1] == '\\':
+            end = text.find(quote, end + 1)
+        return end
+
+def iter_statements(text):
+    """
+    Yield the SQL statements contained in text.
+    
+    Comments ("--" to end of line) are removed and the text is split on
+    semicolons in a single pass. Both are ignored inside string literals.
+    
+    Args:
+        text (str): SQL content to split
+        
+    Yields:
+        str: Each non-empty statement, stripped of surrounding whitespace
+    """
+    yield from _StatementScanner().feed(text, final=True)
+
+def iter_statements_streaming(f, chunk_size=1 << 16):
+    """
+    Yield the SQL statements read from a file, as iter_statements does.
+    
+    The file is read in chunks and only the statement in progress is kept
+    between them, so memory use depends on the longest statement rather
+    than the size of the file, and each character is scanned once.
+    
+    Args:
+        f (file): Text file to read SQL content from
+        chunk_size (int): Number of characters to read at a time
+        
+    Yields:
+        str: Each non-empty statement, stripped of surrounding whitespace
+    """
+    scanner = _StatementScanner()
+    for chunk in iter(lambda: f.read(chunk_size), ''):
+        yield from scanner.feed(chunk)
+    yield from scanner.feed('', final=True)
+
 def smart_split_sql(content):
     """
     Split SQL content by semicolons, respecting string literals.
@@ -18,40 +191,4 @@ def smart_split_sql(content):
     Returns:
         list: SQL queries split by semicolons
     """
-    queries = []
-    current_query = ""
-    in_string = False
-    string_char = None
-    
-    i = 0
-    while i < len(content):
-        char = content[i]
-        
-        # Handle string literals
-        if char in ['"', "'"]:
-            if not in_string:
-                in_string = True
-                string_char = char
-            elif string_char == char:
-                # Check for escaped quotes
-                if i > 0 and content[i-1] == '\\':
-                    pass  # This is an escaped quote
-                else:
-                    in_string = False
-        
-        # Only treat semicolons as separators if not in a string
-        elif char == ';' and not in_string:
-            if current_query.strip():
-                queries.append(current_query.strip())
-            current_query = ""
-            i += 1
-            continue
-        
-        current_query += char
-        i += 1
-    
-    # Add the last query if there is one
-    if current_query.strip():
-        queries.append(current_query.strip())
-    
-    return queries 
\ No newline at end of file
+    return list(iter_statements(content))